@@ -0,0 +1,156 @@
+# benchmarks/conftest.py
+"""
+Gemeinsame Fixtures und Environment-Korpus für die Performance-Benchmarks.
+
+Die Benchmarks nutzen das Plugin pytest-benchmark
+(`pip install -e .[bench]`) und laufen getrennt von den Tests:
+
+    python -m pytest benchmarks --benchmark-autosave
+
+speichert die Ergebnisse als JSON unter `.benchmarks/`. Ein späterer Lauf mit
+
+    python -m pytest benchmarks --benchmark-compare \\
+        --benchmark-compare-fail=mean:10%
+
+vergleicht gegen den letzten gespeicherten Lauf und schlägt fehl, wenn ein
+Benchmark im Mittel mehr als 10% langsamer geworden ist.
+"""
+
+import pytest
+
+from pymonster import grid, logger, utils
+from pymonster.beast import Beast
+
+
+def env_from_rows(rows: list) -> str:
+    """Baut einen 49-Zeichen-Environment-String aus 7 Zeilen."""
+    env = "".join(rows)
+    assert len(env) == 49
+    return env
+
+
+# Repräsentative 7x7-Sichtfelder
+ENVIRONMENTS = {
+    "empty": env_from_rows(
+        [
+            ".......",
+            ".......",
+            ".......",
+            "...B...",
+            ".......",
+            ".......",
+            ".......",
+        ]
+    ),
+    "food_dense": env_from_rows(
+        [
+            "*.*.*.*",
+            ".*.*.*.",
+            "*.*.*.*",
+            ".*.B.*.",
+            "*.*.*.*",
+            ".*.*.*.",
+            "*.*.*.*",
+        ]
+    ),
+    "enemy_dense": env_from_rows(
+        [
+            ">..<..=",
+            "..*....",
+            ".<...>.",
+            "...B..*",
+            "=..<...",
+            "..>..*.",
+            "<.....>",
+        ]
+    ),
+    "mixed": env_from_rows(
+        [
+            "..*....",
+            ".<...*.",
+            "....*..",
+            ".*.B...",
+            "...*.>.",
+            "*......",
+            "....<..",
+        ]
+    ),
+}
+
+# Koloniegrößen (Anzahl eigener Beasts in GLOBAL_BEAST_LIST)
+COLONY_SIZES = (1, 10, 100)
+
+
+def make_colony(size: int) -> list:
+    """
+    Erzeugt eine Kolonie mit `size` Beasts. Die ersten Beasts stehen direkt
+    neben dem Benchmark-Beast, damit die Kollisionsprüfungen Treffer haben.
+    """
+    colony = []
+    for idx in range(1, size):
+        b = Beast()
+        b.set_id(idx + 1)
+        if idx <= 8:
+            b.set_abs_x(10 + (idx % 3) - 1)
+            b.set_abs_y(10 + (idx // 3) - 1)
+        else:
+            b.set_abs_x(-30 + idx % 60)
+            b.set_abs_y(-15 + idx % 30)
+        colony.append(b)
+    return colony
+
+
+def make_beast(environment: str, colony_size: int = 1) -> Beast:
+    """Erzeugt das Benchmark-Beast inkl. Kolonie in GLOBAL_BEAST_LIST."""
+    b = Beast()
+    b.set_id(1)
+    b.set_energy(100.0)
+    b.set_abs_x(10)
+    b.set_abs_y(10)
+    b.set_round_abs(30)
+    b.set_environment(environment)
+    utils.GLOBAL_BEAST_LIST = [b] + make_colony(colony_size)
+    return b
+
+
+@pytest.fixture(params=sorted(ENVIRONMENTS))
+def environment(request):
+    return ENVIRONMENTS[request.param]
+
+
+@pytest.fixture(params=grid.BACKENDS)
+def backend(request, monkeypatch):
+    """Sichtfeld-Backend (grid.BACKENDS), per Benchmark verglichen."""
+    monkeypatch.setattr(grid, "BACKEND", request.param)
+    return request.param
+
+
+@pytest.fixture(params=COLONY_SIZES, ids=lambda n: f"colony{n}")
+def colony_size(request):
+    return request.param
+
+
+@pytest.fixture
+def prepared_beast(environment, colony_size):
+    """Beast mit gesetztem Environment, Kolonie und allen Strategie-Listen."""
+    b = make_beast(environment, colony_size)
+    b.chase_food()
+    b.hunt()
+    b.compute_kill_list()
+    b.escape()
+    return b
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    """Leitet das Logging in ein temporäres Verzeichnis um."""
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(tmp_path))
+    monkeypatch.setattr(logger, "ARCHIVE_FOLDER", str(tmp_path / "archive"))
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", True)
+    monkeypatch.setattr(logger, "_pending_members", {})
+    return tmp_path
+
+
+@pytest.fixture
+def no_logging(monkeypatch):
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", False)
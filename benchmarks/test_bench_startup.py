@@ -0,0 +1,63 @@
+"""Startup-Benchmarks: Import des Clients und Dauer des ersten Zugs mit und
+ohne Aufwärmen (warmup.warm_up) in jeweils frischen Prozessen."""
+
+import subprocess
+import sys
+
+import pytest
+
+from .conftest import ENVIRONMENTS
+
+FIRST_TURN_SCRIPT = """
+import sys, time
+from pymonster import logger, utils
+logger.LOGGING_ENABLED = False
+from pymonster import logic
+from pymonster.beast import Beast
+if sys.argv[1] == "warm":
+    from pymonster.warmup import warm_up
+    warm_up()
+beast = Beast()
+beast.set_id(1)
+beast.set_energy(100.0)
+beast.set_environment(sys.argv[2])
+utils.GLOBAL_BEAST_LIST = [beast]
+start = time.perf_counter_ns()
+logic.decide_action(beast)
+first = time.perf_counter_ns() - start
+beast.set_environment(sys.argv[2])
+start = time.perf_counter_ns()
+logic.decide_action(beast)
+print(first, time.perf_counter_ns() - start)
+"""
+
+
+def run_python(*args: str) -> str:
+    result = subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def test_bench_import_client(benchmark):
+    benchmark.pedantic(
+        run_python, args=("-c", "import pymonster.client"), rounds=5
+    )
+
+
+@pytest.mark.parametrize("mode", ["cold", "warm"])
+def test_bench_first_turn(benchmark, mode):
+    turns = []
+
+    def first_turn():
+        output = run_python(
+            "-c", FIRST_TURN_SCRIPT, mode, ENVIRONMENTS["mixed"]
+        )
+        turns.append([int(value) for value in output.split()])
+
+    benchmark.pedantic(first_turn, rounds=5)
+    # Dauer des ersten und zweiten Zugs in µs (Median über die Prozesse)
+    firsts = sorted(first for first, _ in turns)
+    seconds = sorted(second for _, second in turns)
+    benchmark.extra_info["first_turn_us"] = firsts[len(firsts) // 2] / 1000
+    benchmark.extra_info["second_turn_us"] = seconds[len(seconds) // 2] / 1000
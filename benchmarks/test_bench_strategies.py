@@ -0,0 +1,88 @@
+"""Benchmarks der Strategie-Hot-Paths: parse_environment, chase_food, hunt,
+compute_kill_list, escape, split, decide_action und log_beast."""
+
+import itertools
+
+import pytest
+
+from pymonster import logger, logic
+from pymonster.logger import log_beast
+from .conftest import ENVIRONMENTS, make_beast
+
+
+def test_bench_parse_environment(benchmark, environment, backend):
+    b = make_beast(environment)
+    benchmark(b.parse_environment, environment)
+
+
+def test_bench_chase_food(benchmark, environment, backend):
+    b = make_beast(environment)
+    benchmark(b.chase_food)
+
+
+def test_bench_hunt(benchmark, environment, colony_size):
+    b = make_beast(environment, colony_size)
+    benchmark(b.hunt)
+
+
+def test_bench_compute_kill_list(benchmark, environment, colony_size, backend):
+    b = make_beast(environment, colony_size)
+    benchmark(b.compute_kill_list)
+
+
+def test_bench_escape(benchmark, environment, colony_size, backend):
+    b = make_beast(environment, colony_size)
+    benchmark(b.escape)
+
+
+def test_bench_split(benchmark, backend, prepared_beast):
+    benchmark(prepared_beast.split)
+
+
+def test_bench_decide_action(
+    benchmark, environment, colony_size, backend, no_logging
+):
+    def setup():
+        # frisches Beast pro Runde, damit Runde und Position konstant bleiben
+        return (make_beast(environment, colony_size),), {}
+
+    benchmark.pedantic(
+        logic.decide_action, setup=setup, rounds=200, warmup_rounds=5
+    )
+
+
+@pytest.mark.parametrize("mode", logger.LOG_MODES)
+def test_bench_log_beast(benchmark, log_folder, monkeypatch, mode):
+    monkeypatch.setattr(logger, "LOG_MODE", mode)
+    monkeypatch.setattr(logger, "_recent_rounds", {})
+    b = make_beast(ENVIRONMENTS["mixed"])
+    b.chase_food()
+    b.hunt()
+    b.compute_kill_list()
+    b.escape()
+    fields = dict(
+        bid=1,
+        cmd="MOVE",
+        e=b.get_energy(),
+        env=b.get_environment(),
+        move=(1, 0),
+        abs_x=10,
+        abs_y=10,
+        fl=b.get_food_list(),
+        pf=b.get_priority_food(),
+        hl=b.get_hunt_list(),
+        ph=b.get_priority_hunt(),
+        kl=b.get_kill_list(),
+        pk=b.get_priority_kill(),
+        el=b.get_escape_list(),
+        pe=b.get_priority_escape(),
+        pen=b.get_priority_energy(),
+    )
+    rounds = itertools.count(30)
+
+    def log_round():
+        # jede Runde eine neue abs_r, damit volle Blöcke geschrieben werden
+        abs_r = next(rounds)
+        log_beast(abs_r=abs_r, rel_r=abs_r, **fields)
+
+    benchmark(log_round)
@@ -6,12 +6,19 @@ Das Beast kann Futter suchen, Gegner jagen, gefährliche Felder meiden,
 Kill-Moves berechnen und sich bei passenden Bedingungen aufteilen.
 """
 
-import random
-import numpy as np
 import math
 from collections import OrderedDict
-from . import utils
+from . import grid, logic, utils
+from .escape import order_by_survival, rank_escape_moves
+from .forecast import split_forecast
+from .kills import rank_kill_moves
 from .logic import wrap_abs_coords
+from .pincer import get_coordinator
+from .spawn import choose_spawn_move
+from .strategy import get_strategy
+
+# Glättungsfaktor für die laufende Energie-Rate (Energie-Delta pro Runde)
+ENERGY_RATE_ALPHA = 0.1
 
 
 class Beast:
@@ -26,7 +33,7 @@ class Beast:
     sich in ein weiteres Beast aufteilt.
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Zusammenfassung der Funktion: Initialisiert ein neues Beast mit
         Standardwerten für ID, Energie, Position und Prioritäten.
@@ -35,6 +42,10 @@ class Beast:
         mit leerer Umweltbeschreibung und voreingestellten Prioritäten für
         Futter, Jagd, Flucht, Kill und Energieverbrauch. Listen für Food,
         Escape, Hunt und Kill werden ebenfalls leer initialisiert.
+
+        Args:
+            rng (random.Random | None): Zufallsgenerator für alle
+                Zufallsentscheidungen des Beasts. None = utils.COLONY_RNG.
         """
 
         self._id = 0
@@ -60,6 +71,21 @@ class Beast:
         self._abs_x = 0
         self._abs_y = 0
 
+        # Rolle (siehe controller.ROLE_CONFIGS), None = Standardwerte
+        self._role = None
+
+        # laufende Energie-Rate für die Rollen-Neuverteilung
+        self._energy_rate = 0.0
+        self._energy_variance = 0.0
+        self._energy_samples = 0
+        self._energy_delta = 0.0
+        self._last_energy = None
+
+        # Kosten des letzten Kill-Moves, None = letzte Aktion war kein Kill
+        self._pending_kill = None
+
+        self._rng = rng if rng is not None else utils.COLONY_RNG
+
     # Getter
 
     def get_id(self):
@@ -110,6 +136,27 @@ class Beast:
     def get_abs_y(self):
         return self._abs_y
 
+    def get_role(self):
+        return self._role
+
+    def get_energy_rate(self):
+        return self._energy_rate
+
+    def get_energy_variance(self):
+        return self._energy_variance
+
+    def get_energy_samples(self):
+        return self._energy_samples
+
+    def get_energy_delta(self):
+        return self._energy_delta
+
+    def get_pending_kill(self):
+        return self._pending_kill
+
+    def get_rng(self):
+        return self._rng
+
     # Setter
 
     def set_id(self, updated_id):
@@ -160,37 +207,69 @@ class Beast:
     def set_abs_y(self, updated_abs_y):
         self._abs_y = updated_abs_y
 
+    def set_role(self, updated_role):
+        self._role = updated_role
+
+    def set_rng(self, updated_rng):
+        self._rng = updated_rng
+
+    def set_pending_kill(self, move_cost):
+        self._pending_kill = move_cost
+
+    def set_energy_baseline(self, baseline_energy):
+        self._last_energy = baseline_energy
+
+    def update_energy_rate(self, updated_energy: float) -> float:
+        """
+        Zusammenfassung der Funktion: Aktualisiert die laufende Energie-Rate
+        des Beasts inkrementell aus dem Energie-Delta zur letzten Runde.
+
+        Die Rate ist ein exponentiell gleitender Mittelwert der Energie-
+        Änderung pro Runde (O(1) Zustand), dazu wird die exponentiell
+        gewichtete Varianz mitgeführt (für forecast.py). Beim ersten Aufruf
+        wird nur der Ausgangswert gespeichert.
+
+        Args:
+            updated_energy (float): Aktuelle Energie laut Server.
+
+        Returns:
+            float: Die aktualisierte Energie-Rate.
+        """
+
+        if self._last_energy is not None:
+            delta = updated_energy - self._last_energy
+            self._energy_delta = delta
+            diff = delta - self._energy_rate
+            increment = ENERGY_RATE_ALPHA * diff
+            self._energy_rate += increment
+            self._energy_variance = (1 - ENERGY_RATE_ALPHA) * (
+                self._energy_variance + diff * increment
+            )
+            self._energy_samples += 1
+        self._last_energy = updated_energy
+        return self._energy_rate
+
     def parse_environment(self, env: str):
         """
         Zusammenfassung der Funktion: Wandelt einen linearen Environment-String
-        in ein 7x7-Array um und setzt das Beast in die Mitte.
+        in ein 7x7-Sichtfeld um und setzt das Beast in die Mitte.
 
-        Der Environment-String wird zeilenweise in eine Liste von Listen
-        aufgeteilt, entsprechend der Spielfeldgröße (7x7). Anschließend wird
-        an der zentralen Position das Zeichen 'B' gesetzt, um die Position
-        des Beasts im Sichtfeld zu markieren.
+        Der Environment-String wird als Bytes kodiert und zeilenweise
+        aufgeteilt, entsprechend der Spielfeldgröße (7x7). Anschließend wird an der zentralen Position das
+        Zeichen 'B' gesetzt, um die Position des Beasts im Sichtfeld zu
+        markieren. Das Format hängt vom aktiven Backend ab (siehe
+        `grid.set_backend()`).
 
         Args:
             env (str): Lineare Darstellung des 7x7-Sichtfeldes als String.
 
         Returns:
-            numpy.ndarray: 2D-Array (7x7) mit den Zeichen des Environments,
-            inklusive 'B' in der Mitte.
+            list[bytearray] | numpy.ndarray: 7x7-Sichtfeld mit den Symbolen
+            des Environments als uint8 (grid.FOOD, ...), inklusive
+            grid.BEAST in der Mitte.
         """
 
-        # Bestimmt die Länge einer Array Zeile bevor die nächste startet.
-        N: int = 3
-        size_game: int = 2 * N + 1
-
-        # Macht aus dem String Environment eine Liste
-        result = [
-            list(env[element : element + size_game])
-            for element in range(0, len(env), size_game)
-        ]
-        result[N][N] = "B"  # Biest steht in der Mitte bei 3,3
-
-        numpy_env = np.array(result)
-        return numpy_env
+        return grid.parse_grid(env)
 
     #####################
     #  Chase-Food-Algo  #
@@ -221,7 +300,7 @@ class Beast:
             self._abs_x + dx, self._abs_y + dy
         )
 
-        for beast in utils.GLOBAL_BEAST_LIST:
+        for beast in utils.get_beast_list():
             # eigenes Beast überspringen für den Fall das wir stehen bleiben
             if beast.get_id() == self._id:
                 continue
@@ -243,13 +322,13 @@ class Beast:
 
         Es wird zufällig eine der Bewegungen nach oben, unten, links oder rechts
         gewählt. Der Move ist jeweils genau ein Schritt in die entsprechende
-        Richtung.
+        Richtung. Der Zufall kommt aus dem Zufallsgenerator des Beasts.
 
         Returns:
             tuple[int, int]: Einer der Moves (1, 0), (-1, 0), (0, 1) oder (0, -1).
         """
 
-        d_x, d_y = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        d_x, d_y = self._rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
         return d_x, d_y
 
     def _move_energy(self, move: tuple[int, int]) -> float:
@@ -324,32 +403,11 @@ class Beast:
             first_move (tuple[int, int]): Simulierter erster Move (dx, dy).
 
         Returns:
-            numpy.ndarray: Simuliertes zukünftiges 7x7-Sichtfeld.
+            list[bytearray] | numpy.ndarray: Simuliertes zukünftiges
+            7x7-Sichtfeld (uint8-Symbole).
         """
 
-        dx, dy = first_move
-
-        # ursprüngliches 7x7-Feld holen
-        field = self.parse_environment(self._environment).copy()
-
-        # 'B' im alten Feld entfernen, wir interessieren uns nur für Futter / Gegner
-        field[field == "B"] = "."
-
-        size = field.shape[0]  # 7
-        new_field = np.full((size, size), ".", dtype=str)
-
-        # Sichtfeld so verschieben, als ob das Beast um (dx, dy) gegangen wäre
-        for new_y in range(size):
-            for new_x in range(size):
-                src_x = new_x + dx
-                src_y = new_y + dy
-                if 0 <= src_x < size and 0 <= src_y < size:
-                    new_field[new_y][new_x] = field[src_y][src_x]
-
-        # Beast sitzt in der Zukunft wieder in der Mitte
-        center = size // 2
-        new_field[center][center] = "B"
-        return new_field
+        return grid.shift_grid(self._environment, first_move)
 
     def _food_moves_in_field(self, field) -> list[tuple[int, int]]:
         """
@@ -368,7 +426,7 @@ class Beast:
             numpy.ndarray: Simuliertes zukünftiges 7x7-Sichtfeld.
         """
 
-        size = field.shape[0]
+        size = len(field)
         center = size // 2
         moves: list[tuple[int, int]] = []
         seen: set[tuple[int, int]] = set()
@@ -377,7 +435,7 @@ class Beast:
 
         for y in range(size):
             for x in range(size):
-                if field[y][x] == "*":
+                if field[y][x] == grid.FOOD:
                     diff_x = x - center
                     diff_y = y - center
                     dx, dy = self._clamp_move(diff_x, diff_y, max_step)
@@ -600,7 +658,7 @@ class Beast:
 
         for y in range(7):
             for x in range(7):
-                if field[y][x] == "*":
+                if field[y][x] == grid.FOOD:
                     dx = x - cx
                     dy = y - cy
                     food_list.append((dx, dy))
@@ -730,9 +788,8 @@ class Beast:
         gefundenen Moves können anschließend mit einem Lookahead bewertet
         und nach Energie gefiltert werden.
 
-        Args:
-            raw (list[tuple[int, int]]): Liste relativer Futterpositionen
-                (dx, dy) aus dem Sichtfeld.
+        Hat der HuntCoordinator (pincer.py) dem Beast ein Annäherungsfeld
+        für einen Zangen-Angriff zugeteilt, steht der Move dorthin vorne.
 
         Returns:
             list[tuple[int, int]]: Sortierte Liste von 1er-Moves in Richtung Futter.
@@ -745,6 +802,10 @@ class Beast:
 
         max_step = 1 if self._priority_energy < 2.0 else 2
 
+        pincer_move = None
+        if unsorted_hunting_list:
+            pincer_move = self._pincer_move(unsorted_hunting_list, max_step)
+
         # Berechnet die Jagd auf Gegner  und sortiert sie ggf. wird geclamped
         for x_e, y_e in unsorted_hunting_list:
             diff_x = x_e - x_beast
@@ -769,6 +830,12 @@ class Beast:
             self.set_hunt_list([])
             return []
 
+        # Zangen-Angriff: Move zum zugeteilten Annäherungsfeld zuerst
+        if pincer_move is not None:
+            sorted_hunt_list = [pincer_move] + [
+                move for move in sorted_hunt_list if move != pincer_move
+            ]
+
         # Prüft ob der nächste move auf ein anderes unsere Biester steppt
         # wenn die liste true zurückliefert wird es in die liste gefügt
         safe_hunt_list = [
@@ -781,6 +848,47 @@ class Beast:
         self.set_hunt_list(safe_hunt_list)
         return safe_hunt_list
 
+    def _pincer_move(self, hunting_list: list, max_step: int):
+        """
+        Zusammenfassung der Funktion: Meldet die sichtbare Beute an den
+        HuntCoordinator der Sitzung und liefert den Move zum zugeteilten
+        Annäherungsfeld.
+
+        Eigene Beasts im Sichtfeld zählen nicht als Beute. Die Zuteilung
+        gilt nur, solange die Beute noch auf dem geplanten Feld steht.
+
+        Args:
+            hunting_list (list[tuple[int, int]]): Koordinaten der '<' im
+                7x7-Sichtfeld (aus locate_hunting_list).
+            max_step (int): Maximale Schrittweite pro Komponente.
+
+        Returns:
+            tuple[int, int] | None: Geclampter Move oder None.
+        """
+
+        ally_cells = self._ally_cells()
+        targets = []
+        for x_e, y_e in hunting_list:
+            cell = wrap_abs_coords(
+                self._abs_x + x_e - 3, self._abs_y + y_e - 3
+            )
+            if cell not in ally_cells:
+                targets.append(cell)
+
+        coordinator = get_coordinator()
+        coordinator.observe(
+            self._id, (self._abs_x, self._abs_y), self._round_abs, targets
+        )
+        assignment = coordinator.get_assignment(self._id)
+        if assignment is None or assignment[0] not in targets:
+            return None
+
+        cell_x, cell_y = assignment[1]
+        dx, dy = wrap_abs_coords(cell_x - self._abs_x, cell_y - self._abs_y)
+        if (dx, dy) == (0, 0):
+            return None
+        return self._clamp_move(dx, dy, max_step)
+
     def locate_hunting_list(self) -> list:
         """
         Zusammenfassung der Funktion: Sucht Gegner ('<') im aktuellen
@@ -797,7 +905,7 @@ class Beast:
 
         field = self.parse_environment(self._environment)
         hunting_list = list()
-        opponent_symbols = {"<"}
+        opponent_symbols = {grid.WEAKER}
 
         for r_idx, row in enumerate(field):
             for c_idx, col in enumerate(row):
@@ -825,7 +933,7 @@ class Beast:
         field = self.parse_environment(self._environment)
         enemy_list = []
 
-        opponent_symbols = {">", "="}
+        opponent_symbols = {grid.STRONGER, grid.EQUAL}
         for r_idx, row in enumerate(field):
             for c_idx, col in enumerate(row):
                 if col in opponent_symbols:
@@ -837,6 +945,35 @@ class Beast:
             unique_set.update(enemy)
         return list(unique_set)
 
+    def _ally_cells(self) -> set:
+        """
+        Zusammenfassung der Funktion: Sammelt die absoluten Felder aller
+        anderen eigenen Beasts in einem Durchlauf über die Beast-Liste.
+
+        Returns:
+            set[tuple[int, int]]: Absolute Koordinaten (x, y).
+        """
+
+        return {
+            (beast.get_abs_x(), beast.get_abs_y())
+            for beast in utils.get_beast_list()
+            if beast.get_id() != self._id
+        }
+
+    def _ally_offsets(self) -> set:
+        """
+        Zusammenfassung der Funktion: Liefert die Felder aller anderen
+        eigenen Beasts relativ zur eigenen Position (mit Wrapping).
+
+        Returns:
+            set[tuple[int, int]]: Relative Koordinaten (dx, dy).
+        """
+
+        return {
+            wrap_abs_coords(x - self._abs_x, y - self._abs_y)
+            for x, y in self._ally_cells()
+        }
+
     def get_enemy_positions(self) -> list:
         """
         Zusammenfassung der Funktion: Ermittelt die relativen Positionen
@@ -854,9 +991,10 @@ class Beast:
         """
 
         field = self.parse_environment(self._environment)
+        ally_cells = self._ally_cells()
 
         enemy_list = []
-        opponent_symbols = {">", "="}
+        opponent_symbols = {grid.STRONGER, grid.EQUAL}
 
         for r_idx, row in enumerate(field):
             for c_idx, col in enumerate(row):
@@ -869,18 +1007,7 @@ class Beast:
                     )
 
                     # prüft das die neue Abs coordiante nicht keins unserer bieaster ist.
-                    is_ally = False
-                    for beast in utils.GLOBAL_BEAST_LIST:
-                        # eigenes Beast überspringen ist nur zur Sicherheit
-                        if beast.get_id() == self._id:
-                            continue
-
-                        if (
-                            beast.get_abs_x() == abs_x
-                            and beast.get_abs_y() == abs_y
-                        ):
-                            is_ally = True
-                            break
+                    is_ally = (abs_x, abs_y) in ally_cells
 
                     # nur echte Gegner hinzufügen
                     if not is_ally:
@@ -939,7 +1066,10 @@ class Beast:
         5x5-Bereich (Koordinaten -2 bis +2 relativ) berücksichtigt. Die
         resultierenden Moves werden nach Distanz sortiert und anschließend
         über _is_safe_move gefiltert, sodass nur sichere Kill-Moves übrig
-        bleiben.
+        bleiben. Zuletzt ordnet kills.rank_kill_moves() sie nach erwartetem
+        Energie-Gewinn (Beute, Move-Kosten, Bedrohungen am Zielfeld) und
+        verwirft unrentable Moves; die Reihenfolge bestimmt die Priorität in
+        decide_action().
 
         Returns:
             list[tuple[int, int]]: Liste sicherer Kill-Moves (dx, dy) im 5x5-Bereich.
@@ -965,6 +1095,18 @@ class Beast:
             move for move in kill_moves if self._is_safe_move(move)
         ]
 
+        # nach erwartetem Energie-Gewinn ordnen (Schätzungen aus der
+        # Gegnerstatistik, siehe kills.py)
+        if safe_kill_moves:
+            stats = logic.OPPONENT_STATS
+            safe_kill_moves = rank_kill_moves(
+                safe_kill_moves,
+                self._energy,
+                stats.estimate_victim_energy(self._energy),
+                stats.kill_hit_rate(),
+                self.get_enemy_positions(),
+            )
+
         self.set_kill_list(safe_kill_moves)
         return safe_kill_moves
 
@@ -978,14 +1120,20 @@ class Beast:
         Beasts aufteilt, und liefert ggf. den Start-Move für das neue Beast.
 
         Zunächst wird eine durchschnittliche Energie pro Runde berechnet.
+        Alle Schwellwerte stammen aus der aktiven StrategyConfig.
         Ein regulärer Split ist nur erlaubt, wenn genügend Energie vorhanden
         ist, keine Jagd- oder Fluchtsituation besteht und ausreichend Futter
-        in Reichweite ist. Zusätzlich existiert ein Notfall-Split, der
+        in Reichweite ist. Sobald genug Energie-Deltas vorliegen, ersetzt die
+        Energie-Prognose (forecast.split_forecast) den Lebenszeit-
+        Durchschnitt: Beide Hälften müssen in den nächsten
+        split_forecast_rounds Runden voraussichtlich über
+        split_starvation_line bleiben. Zusätzlich existiert ein Notfall-Split, der
         greift, wenn nur noch ein Beast lebt, bestimmte Mindestenergie und
         -rundenzahlen erreicht sind, keine Gegner im 5x5-Bereich sichtbar
         sind und mindestens ein Futterfeld vorhanden ist. Im Erfolgsfall
         wird ein Move in eine der vier Hauptachsen geliefert, auf dem das
-        neue Beast spawnen soll.
+        neue Beast spawnen soll (bestes freies Feld laut
+        spawn.choose_spawn_move; ist keines frei, wird nicht gesplittet).
 
         Returns:
             tuple[tuple[int, int] | None, bool]:
@@ -994,16 +1142,15 @@ class Beast:
                 - True, wenn ein Split stattfinden soll, sonst False.
         """
 
-        # GENERAL_ENERGY_AVG wurde nach näherer Analysen der Futter-Runde
-        # Verhältnis aus der beast logs vom 14.11.25 ermittelt und gezeigt
-        # dass sich dieser Wert oder größer etwa eine Wahrscheinlichkeit von
-        # 20% hat um vorzukommen.
-        GENERAL_ENERGY_AVG: float = 2.5
-        MINIMUM_SPLIT_ENERGY: float = 80.0
+        # Schwellwerte kommen aus der aktiven StrategyConfig
+        # (Herleitung von general_energy_avg siehe strategy.py)
+        strategy = get_strategy()
+        GENERAL_ENERGY_AVG: float = strategy.general_energy_avg
+        MINIMUM_SPLIT_ENERGY: float = strategy.minimum_split_energy
 
         # Drehschrauben für den Notfall-Split
-        EMERGENCY_MIN_ENERGY: float = 50.0
-        EMERGENCY_MIN_ROUND: float = 100
+        EMERGENCY_MIN_ENERGY: float = strategy.emergency_min_energy
+        EMERGENCY_MIN_ROUND: float = strategy.emergency_min_round
 
         # Schutz Div durch 0
         if self._round_abs <= 0:
@@ -1011,6 +1158,15 @@ class Beast:
         else:
             cur_energy_avg: float = self._energy / self._round_abs
 
+        # Prognose statt Lebenszeit-Durchschnitt, sobald genug Daten da sind
+        forecast = None
+        if strategy.split_forecast_rounds > 0:
+            forecast = split_forecast(self, strategy.split_forecast_rounds)
+        if forecast is None:
+            income_ok = cur_energy_avg >= GENERAL_ENERGY_AVG
+        else:
+            income_ok = forecast > strategy.split_starvation_line
+
         food_list: list = self._food_list
         hunt_list: list = self._hunt_list
         escape_list: list = self._escape_list
@@ -1019,32 +1175,22 @@ class Beast:
         # Wir müssen hier die Anforderungen für den Split erfüllen
         if (
             self._energy > MINIMUM_SPLIT_ENERGY
-            and cur_energy_avg >= GENERAL_ENERGY_AVG
+            and income_ok
             and len(hunt_list) == 0
             and len(escape_list) == 0
             and len(food_list) >= 4
         ):
-            legal_moves = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-
-            move = None
-
-            # 1. Suche: Ist einer der legalen Moves ein Food-Feld?
-            for option in legal_moves:
-                if option in food_list:
-                    move = option
-                    break  # Den ersten Treffer nehmen und Schleife beenden
-
-            # 2. Fallback: Wenn kein Food da ist, nimm einen zufälligen legalen Move
-            if move is None:
-                move = random.choice(legal_moves)
+            # Spawn-Feld nach Futter, Gefahr und Gedränge bewerten
+            move = self._spawn_move()
 
             # Bedingungen == True -> Split erlaubt (True)
-            # -> Bester Food-MOVE -> neuer beast spawnt auf dem Food.
-            return move, True
+            # -> bestes freies Feld -> neuer beast spawnt dort.
+            if move is not None:
+                return move, True
 
         ######### Notfall-Split #########
         # lebt nur noch 1 eigenes Beast?
-        only_one_beast_left = len(utils.GLOBAL_BEAST_LIST) == 1
+        only_one_beast_left = len(utils.get_beast_list()) == 1
 
         # Mindestenergie + Mindest-Runde erreicht?
         has_min_energy_and_round = (
@@ -1059,10 +1205,10 @@ class Beast:
         has_food_in_view = "*" in env_str
 
         # irgendein anderes Biest im 5x5-Bereich (Chebyshev <=2)?
-        enemy_symbols = (">", "=", "<")
+        enemy_symbols = (grid.STRONGER, grid.EQUAL, grid.WEAKER)
         field = self.parse_environment(env_str)
 
-        size = field.shape[0]  # sollte 7 sein
+        size = len(field)  # sollte 7 sein
         center = size // 2  # 3 -> unser Beast sitzt in der Mitte
         has_enemy_in_view = False
 
@@ -1081,27 +1227,32 @@ class Beast:
             and has_food_in_view
             and not has_enemy_in_view
         ):
-            legal_moves = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-            move = None
-
-            # 1. Suche: Wie beim normalen Split zuerst versuchen, direkt auf Food zu splitten
-            for option in legal_moves:
-                if option in food_list:
-                    move = option
-                    break  # Den ersten Treffer nehmen und Schleife beenden
-
-            if move is None:
-                # Fallback: zufälliger legaler Move, möglichst "sicher"
-                move = random.choice(legal_moves)
+            # Wie beim normalen Split das beste freie Feld wählen
+            move = self._spawn_move()
 
             # Bedingungen == True -> Split erlaubt (True)
-            # -> Bester Food-MOVE -> neuer beast spawnt auf dem Food.
-            return move, True
+            # -> bestes freies Feld -> neuer beast spawnt dort.
+            if move is not None:
+                return move, True
 
         ######### Kein Split #########
         # Bedingungen != True -> Kein MOVE (None) und Kein Split erlaubt (False)
         return None, False
 
+    def _spawn_move(self):
+        """
+        Zusammenfassung der Funktion: Wählt das Spawn-Feld für einen Split
+        anhand von Futter, Gegnern und eigenen Beasts in der Nähe.
+
+        Returns:
+            tuple[int, int] | None: Spawn-Feld (dx, dy) oder None, wenn alle
+            vier Nachbarfelder belegt sind.
+        """
+
+        env_str = self._environment or ""
+        enemies = self.get_enemy_positions() if len(env_str) == 49 else []
+        return choose_spawn_move(env_str, enemies, self._ally_offsets())
+
     def locate_enemy_list(self, enemy: tuple) -> list:
         """
         Zusammenfassung der Funktion: Liefert das 5x5-Umfeld um eine gegnerische
@@ -1144,10 +1295,13 @@ class Beast:
         Die Funktion ermittelt zunächst alle Gegnerpositionen. Dann werden
         alle möglichen Moves im Bereich [-2..2] × [-2..2] betrachtet, das
         eigene Feld (0, 0) ausgeschlossen. Felder, die im 5x5-Umfeld eines
-        Gegners liegen, gelten als gefährlich. Sichere Moves sind alle
-        übrigen, die zusätzlich über _is_safe_move geprüft werden. Diese
-        sicheren Moves werden in 1er-Moves und längere Moves aufgeteilt
-        und jeweils nach Distanz zu den Gegnern mit score_safe_moves sortiert.
+        Gegners liegen, gelten als gefährlich. Die übrigen Moves werden in
+        1er-Moves und längere Moves aufgeteilt und jeweils nach Distanz zu
+        den Gegnern sortiert (escape.rank_escape_moves, gleiche Reihenfolge
+        wie score_safe_moves). Danach werden Moves auf Felder eigener
+        Beasts entfernt. Zum Schluss rücken Moves nach hinten, nach denen
+        uns die Gegner in den nächsten Runden einschließen können
+        (escape.order_by_survival, Tiefe aus der Strategie).
 
         Returns:
             list[tuple[int, int]]: Liste sicherer Escape-Moves (dx, dy),
@@ -1157,71 +1311,27 @@ class Beast:
         # 1. Alle Gegnerpositionen (relativ zu uns) holen
         enemy_list = self.get_enemy_positions()
 
-        # Sofortregel: wenn kein Enemy vorhanden -> leere Liste zurückgeben
-        if not enemy_list:
-            self.set_escape_list([])
-            return []
-
-        # 2. Alle möglichen Moves im 5x5 (ohne (0,0))
-        our_moves = [
-            (x, y)
-            for x in range(-2, 3)
-            for y in range(-2, 3)
-            if not (x == 0 and y == 0)
-        ]
-
-        # 3. Gefährliche Felder bestimmen (5x5 um jeden Gegner, geschnitten mit unserem 5x5)
-        danger_moves_set = set()
-        our_area_set = set((x, y) for x in range(-2, 3) for y in range(-2, 3))
-
-        for ex, ey in enemy_list:
-            for gx in range(ex - 2, ex + 3):
-                for gy in range(ey - 2, ey + 3):
-                    if (gx, gy) in our_area_set:
-                        danger_moves_set.add((gx, gy))
-
-        danger_moves_set.discard((0, 0))
-
-        # 4. Sichere Moves = our_moves - danger_moves, zusätzlich globale Kollisionsprüfung
-        safe_moves = [
-            move for move in our_moves if move not in danger_moves_set
-        ]
-        safe_moves = [move for move in safe_moves if self._is_safe_move(move)]
-
-        # WENN GAR KEIN sicherer Move -> raus
-        if not safe_moves:
-            self.set_escape_list([])
-            return []
-
-        # 5. Safe Moves nach Schrittweite in zwei Gruppen aufteilen
-        one_step_moves = []
-        longer_moves = []
-
-        for mx, my in safe_moves:
-            cheby = max(abs(mx), abs(my))  # Chebyshev-Distanz
-            if cheby == 1:
-                one_step_moves.append((mx, my))
-            else:
-                longer_moves.append((mx, my))
-
-        result_moves: list[tuple[int, int]] = []
+        # 2.-3. Moves außerhalb der Gefahrenzone bewerten und sortieren
+        ranked_moves = rank_escape_moves(enemy_list)
+
+        # 4. Globale Kollisionsprüfung: ein Durchlauf über die Beast-Liste
+        if ranked_moves:
+            occupied = self._ally_cells()
+            result_moves = [
+                (dx, dy)
+                for dx, dy in ranked_moves
+                if wrap_abs_coords(self._abs_x + dx, self._abs_y + dy)
+                not in occupied
+            ]
+        else:
+            result_moves = []
 
-        # 6. ZUERST: 1er-Moves sortieren (weiter weg vom Gegner = besser)
-        if one_step_moves:
-            sorted_one_step, _ = self.score_safe_moves(
-                one_step_moves, enemy_list
+        # 5. Moves, nach denen uns die Gegner einschließen können, nach hinten
+        search_depth = get_strategy().escape_search_depth
+        if len(result_moves) > 1 and search_depth > 1:
+            result_moves = order_by_survival(
+                result_moves, enemy_list, self._ally_offsets(), search_depth
             )
-            result_moves.extend(sorted_one_step)
-
-        # 7. DANN: längere Moves sortieren und hinten anhängen
-        if longer_moves:
-            sorted_longer, _ = self.score_safe_moves(longer_moves, enemy_list)
-            result_moves.extend(sorted_longer)
-
-        # leere liste wenn es nichts ist
-        if not result_moves:
-            self.set_escape_list([])
-            return []
 
         self.set_escape_list(result_moves)
         return result_moves
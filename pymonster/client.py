@@ -5,19 +5,31 @@ Verbindung zum Server.
 Der Client baut eine gesicherte WebSocket-Verbindung zum Spielserver auf,
 authentifiziert sich mit Benutzername und Passwortdatei, startet die
 asynchrone Client-Schleife und leitet eingehende Servernachrichten an die
-Steuerungslogik weiter. Außerdem stellt das Modul einen CLI-Einstiegspunkt
+Steuerungslogik weiter. Bricht die Verbindung unerwartet ab, verbindet
+sich der Client mit exponentiellem Backoff (mit Jitter) neu und meldet
+sich erneut an. Beast-Liste und übriger Spielzustand bleiben dabei im
+Speicher erhalten. Außerdem stellt das Modul einen CLI-Einstiegspunkt
 bereit, um den Client über die Kommandozeile zu starten.
+
+Für einen schnellen Start lädt das Modul die Spiellogik (controller,
+logic, beast) erst beim Login: Nach dem Senden der
+Zugangsdaten wird sie geladen und mit `warmup.warm_up()` aufgewärmt,
+während der Server den Login prüft. Die Log-Verdichtung wird nur mit
+--compact-logs geladen, der Metrik-Server nur mit --metrics-port und der
+Sampling-Profiler erst in `client_main()`. `json` und `gzip` bleiben über
+`logger` beim Import geladen: `log_server()` schreibt schon vor dem
+Verbindungsaufbau.
 """
 
 import argparse
 import asyncio
+import random
 import ssl
 import websockets
-from . import utils
-from websockets.exceptions import ConnectionClosed
-from .utils import print_and_flush, handle_shutdown
-from .controller import control_cmd
-from .beast import Beast
+from . import console, grid, latency, logger, utils
+from websockets.exceptions import ConnectionClosed, WebSocketException
+from .utils import print_and_flush, handle_shutdown, cmd
+from .latency import enable_latency
 from .logger import log_server
 
 # accept self-signed certificate
@@ -25,14 +37,179 @@ ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
 ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
+# Wiederverbinden: Wartezeit vor Versuch n ist zufällig in
+# [0, min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2**n)] ("full jitter")
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_ATTEMPTS = 10
+
+# Eigener Generator, damit der Backoff den Kolonie-Zufall nicht verschiebt
+_BACKOFF_RNG = random.Random()
+
+# Spiellogik, erst durch load_game_modules() geladen
+_controller = None
+
 ################################################################################
 # No need to change functionality below this line
 # You should remove most of the debug print statements to save disk space.
 ################################################################################
 
 
+def load_game_modules():
+    """
+    Zusammenfassung der Funktion: Lädt beim ersten Aufruf die Spiellogik
+    (controller und darüber logic und beast).
+
+    Returns:
+        module: Das Modul pymonster.controller.
+    """
+
+    global _controller
+    if _controller is None:
+        # bewusst erst hier importiert (schneller Start, siehe Moduldoku)
+        from . import controller
+
+        _controller = controller
+    return _controller
+
+
+async def control_cmd(server_str, websocket, my_beast):
+    """Leitet an controller.control_cmd() weiter."""
+    return await load_game_modules().control_cmd(
+        server_str, websocket, my_beast
+    )
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Zusammenfassung der Funktion: Berechnet die Wartezeit vor einem
+    Verbindungsversuch (exponentieller Backoff mit vollem Jitter).
+
+    Der Jitter verhindert, dass viele Clients nach einem Serverausfall im
+    Gleichschritt neu verbinden.
+
+    Args:
+        attempt (int): Nummer des Versuchs (0 = erster Versuch).
+
+    Returns:
+        float: Wartezeit in Sekunden.
+    """
+
+    cap = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2**attempt)
+    return _BACKOFF_RNG.uniform(0, cap)
+
+
+async def open_connection(hostname: str, port: int):
+    """
+    Zusammenfassung der Funktion: Öffnet die TLS-WebSocket-Verbindung zum
+    Login-Endpunkt des Servers.
+
+    Args:
+        hostname (str): Hostname oder IP-Adresse des Servers.
+        port (int): TCP-Port des Servers.
+
+    Returns:
+        websockets.ClientConnection: Offene Verbindung.
+    """
+
+    return await websockets.connect(
+        f"wss://{hostname}:{port}/login",
+        ssl=ssl_context,
+    )
+
+
+async def login(
+    websocket, username: str, password: str, warm: bool = False
+) -> str:
+    """
+    Zusammenfassung der Funktion: Führt den Login-Handshake aus.
+
+    Mit `warm=True` wird nach dem Senden der Zugangsdaten die Spiellogik
+    geladen und aufgewärmt, während der Server den Login prüft.
+
+    Args:
+        websocket: Offene Verbindung.
+        username (str): Benutzername.
+        password (str): Passwort.
+        warm (bool): Spiellogik während des Wartens aufwärmen.
+
+    Returns:
+        str: Antwort des Servers.
+    """
+
+    await websocket.send(f"{username}:{password}")
+    if warm:
+        load_game_modules()
+        from .warmup import warm_up
+
+        elapsed = warm_up()
+        console.debug(f"warm-up took {elapsed * 1000:.1f} ms")
+    server_str = await websocket.recv()
+    log_server("SMSG", f"{server_str!r}")
+    print_and_flush(f"Reply from server: {server_str!r}")
+    return server_str
+
+
+async def reconnect(
+    hostname: str,
+    port: int,
+    username: str,
+    password: str,
+    max_attempts: int = RECONNECT_ATTEMPTS,
+):
+    """
+    Zusammenfassung der Funktion: Baut eine abgebrochene Verbindung neu auf
+    und meldet sich erneut an.
+
+    Vor jedem Versuch wird backoff_delay() Sekunden gewartet. Fehlschläge
+    (Netzwerkfehler, abgelehnter Handshake wie InvalidStatus, Abbruch
+    beim Login) werden im Server-Log vermerkt. Scheitert der Login, wird
+    die halb offene Verbindung geschlossen.
+
+    Args:
+        hostname (str): Hostname oder IP-Adresse des Servers.
+        port (int): TCP-Port des Servers.
+        username (str): Benutzername.
+        password (str): Passwort.
+        max_attempts (int): Maximale Anzahl Versuche.
+
+    Returns:
+        websockets.ClientConnection | None: Neue, angemeldete Verbindung
+        oder None, wenn alle Versuche fehlgeschlagen sind.
+    """
+
+    for attempt in range(max_attempts):
+        delay = backoff_delay(attempt)
+        console.warning(
+            f"reconnecting in {delay:.2f}s "
+            f"(attempt {attempt + 1}/{max_attempts})",
+            key="reconnect",
+        )
+        await asyncio.sleep(delay)
+        try:
+            websocket = await open_connection(hostname, port)
+        except (OSError, asyncio.TimeoutError, WebSocketException) as e:
+            log_server("ERROR", f"Reconnect attempt {attempt + 1}: {e!r}")
+            continue
+        try:
+            await login(websocket, username, password)
+        except (OSError, WebSocketException) as e:
+            log_server("ERROR", f"Reconnect attempt {attempt + 1}: {e!r}")
+            await websocket.close()
+            continue
+        log_server("SUCCESS", f"Reconnected after {attempt + 1} attempts")
+        return websocket
+    return None
+
+
 async def client_loop(
-    username: str, password_file_name: str, hostname: str, port: int
+    username: str,
+    password_file_name: str,
+    hostname: str,
+    port: int,
+    metrics_port: int | None = None,
+    max_reconnects: int = RECONNECT_ATTEMPTS,
+    warm: bool = True,
 ):
     """
     Zusammenfassung der Funktion: Baut eine gesicherte WebSocket-Verbindung
@@ -42,9 +219,13 @@ async def client_loop(
     eine TLS-gesicherte WebSocket-Verbindung zum Spielserver her und
     führt einen einfachen Login-Handshake aus. Anschließend wird in einer
     Endlosschleife auf Nachrichten vom Server gewartet und jede Nachricht
-    zur weiteren Verarbeitung an control_cmd() übergeben. Wenn der Server
-    einen Shutdown signalisiert oder die Verbindung schließt, wird die
-    Schleife beendet und ein geordneter Shutdown ausgelöst.
+    zur weiteren Verarbeitung an control_cmd() übergeben. Bricht die
+    Verbindung unerwartet ab, wird mit reconnect() neu verbunden, die
+    Beast-Liste und das Start-Beast bleiben erhalten. Wenn der Server
+    einen Shutdown signalisiert oder alle Wiederverbindungsversuche
+    scheitern, wird die Schleife beendet und ein geordneter Shutdown
+    ausgelöst. Optional läuft in derselben Event-Loop ein
+    Prometheus-Metrik-Endpunkt.
 
     Args:
         username (str): Benutzername für die Authentifizierung am Server.
@@ -52,6 +233,11 @@ async def client_loop(
             Authentifizierung enthält (abschließende Leerzeichen werden entfernt).
         hostname (str): Hostname oder IP-Adresse des WebSocket-Servers.
         port (int): TCP-Portnummer des WebSocket-Servers.
+        metrics_port (int | None): Lokaler Port für GET /metrics,
+            None = kein Metrik-Server.
+        max_reconnects (int): Maximale Anzahl Wiederverbindungsversuche
+            pro Abbruch, 0 = nach einem Abbruch beenden.
+        warm (bool): Spiellogik während des Logins aufwärmen.
 
     Returns:
         None
@@ -60,8 +246,6 @@ async def client_loop(
         FileNotFoundError: Wenn die Passwortdatei nicht gefunden wird.
         PermissionError: Wenn auf die Passwortdatei nicht zugegriffen werden kann.
         IsADirectoryError: Wenn password_file_name auf ein Verzeichnis zeigt.
-        ConnectionClosedError: Wenn die WebSocket-Verbindung unerwartet
-            während des Empfangens von Nachrichten geschlossen wird.
     """
 
     try:
@@ -73,33 +257,51 @@ async def client_loop(
         log_server("ERROR", "Error reading Password file")
         raise type(e)("Error reading Password file") from e
 
-    async with websockets.connect(
-        f"wss://{hostname}:{port}/login",
-        ssl=ssl_context,
-    ) as websocket:
-        await websocket.send(f"{username}:{password}")
-        server_str = await websocket.recv()
-        log_server("SMSG", f"{server_str!r}")
-        print_and_flush(f"Reply from server: {server_str!r}")
+    metrics_server = None
+    if metrics_port is not None:
+        from .metrics import start_metrics_server
+
+        metrics_server = await start_metrics_server(port=metrics_port)
+
+    websocket = await open_connection(hostname, port)
+    try:
+        await login(websocket, username, password, warm)
+        load_game_modules()
+        from .beast import Beast
+
         # Biest hier intitalisieren
         my_beast = Beast()
-        utils.GLOBAL_BEAST_LIST.append(my_beast)
+        utils.get_beast_list().append(my_beast)
         while True:
             try:
                 server_str = await websocket.recv()
                 # log_server("SMSG", f"{server_str!r}") #logt den Serverstring in unseren Logs
                 # print_and_flush(f"{server_str = }")
                 # warten auf control_cmd() weil es async ist
+                clock = latency.start_clock()
                 keep_running = await control_cmd(
                     server_str, websocket, my_beast
                 )
+                if clock:
+                    # unbekannte Nachrichten teilen sich ein Histogramm
+                    kind = server_str if server_str in cmd else "unknown"
+                    clock.total(f"message_{kind.lower()}")
                 if not keep_running:
                     break
             except websockets.ConnectionClosedError:
-                print_and_flush("Connection closed by server")
+                console.warning("Connection closed by server")
                 log_server("ERROR", "Connection closed by server")
-                break
-        await handle_shutdown()
+                websocket = await reconnect(
+                    hostname, port, username, password, max_reconnects
+                )
+                if websocket is None:
+                    break
+    finally:
+        if websocket is not None:
+            await websocket.close()
+        if metrics_server is not None:
+            metrics_server.close()
+    await handle_shutdown()
 
 
 def client_main():
@@ -108,7 +310,17 @@ def client_main():
     startet die asynchrone Client-Schleife.
 
     Die Funktion legt einen ArgumentParser an, liest Benutzername,
-    Passwortdatei, Hostname und Port aus der Kommandozeile und ruft
+    Passwortdatei, Hostname und Port aus der Kommandozeile, aktiviert
+    optional das Online-Tuning der Rollen (--bandit-file), setzt optional
+    den Seed des Kolonie-Zufallsgenerators (--seed), aktiviert optional
+    die Latenz-Messung pro Stufe (--latency-file), installiert den per
+    SIGUSR1 startbaren Sampling-Profiler (--profile-seconds), startet
+    optional einen lokalen Metrik-Endpunkt (--metrics-port), setzt das
+    Level der Konsolenausgabe (--log-level), die Anzahl der
+    Wiederverbindungsversuche (--reconnect-attempts), das Aufwärmen beim
+    Login (--no-warm-up) und die Stufe des
+    Beast-Loggings (--log-mode), startet optional die
+    Log-Verdichtung als eigenen Prozess (--compact-logs) und ruft
     anschließend client_loop() mit diesen Parametern über asyncio.run()
     auf. Wird die Verbindung vom Server geschlossen, wird die Ausnahme
     abgefangen und eine entsprechende Meldung ausgegeben und geloggt.
@@ -132,7 +344,128 @@ def client_main():
     parser.add_argument(
         "-p", "--port", type=int, help="Port number", default=9721
     )
+    parser.add_argument(
+        "--bandit-file",
+        type=str,
+        help="Enable online tuning of role priorities and persist the "
+        "bandit statistics in this JSON file",
+        default=None,
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for the colony random generator (reproducible runs)",
+        default=None,
+    )
+    parser.add_argument(
+        "--latency-file",
+        type=str,
+        help="Measure per-stage latencies and write the histograms as JSON "
+        "to this file (periodically and on shutdown)",
+        default=None,
+    )
+    parser.add_argument(
+        "--latency-every",
+        type=int,
+        help="Number of turns between two latency dumps",
+        default=1000,
+    )
+    parser.add_argument(
+        "--profile-seconds",
+        type=float,
+        help="Duration of a sampling profile started with SIGUSR1",
+        default=30.0,
+    )
+    parser.add_argument(
+        "--profile-interval-ms",
+        type=float,
+        help="Sampling interval of the profiler in milliseconds",
+        default=5.0,
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics",
+        default=None,
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=sorted(console.LEVEL_NAMES),
+        help="Minimum level of console messages",
+        default="info",
+    )
+    parser.add_argument(
+        "--log-mode",
+        choices=logger.LOG_MODES,
+        help="Beast logging tier: every field, scalars only or sampled rounds",
+        default="full",
+    )
+    parser.add_argument(
+        "--log-sample-every",
+        type=int,
+        help="In sampled mode, log every N-th round in full",
+        default=logger.SAMPLE_EVERY,
+    )
+    parser.add_argument(
+        "--log-sample-percent",
+        type=float,
+        help="In sampled mode, log this percentage of beasts in full",
+        default=logger.SAMPLE_BEAST_PERCENT,
+    )
+    parser.add_argument(
+        "--log-anomaly-rounds",
+        type=int,
+        help="In summary and sampled mode, log the last K rounds before a "
+        "death in full",
+        default=logger.ANOMALY_ROUNDS,
+    )
+    parser.add_argument(
+        "--grid-backend",
+        choices=grid.BACKENDS,
+        help="Backend for single-beast view operations (numpy = arrays)",
+        default=grid.BACKEND,
+    )
+    parser.add_argument(
+        "--reconnect-attempts",
+        type=int,
+        help="Reconnect attempts after a dropped connection (0 = exit)",
+        default=RECONNECT_ATTEMPTS,
+    )
+    parser.add_argument(
+        "--no-warm-up",
+        action="store_true",
+        help="Do not warm up the decision logic during login",
+    )
+    parser.add_argument(
+        "--compact-logs",
+        action="store_true",
+        help="Compact and prune archived logs in a low-priority background "
+        "process (see biester_compact)",
+    )
     args = parser.parse_args()
+    console.set_level(args.log_level)
+    logger.set_log_mode(
+        args.log_mode,
+        args.log_sample_every,
+        args.log_sample_percent,
+        args.log_anomaly_rounds,
+    )
+    grid.set_backend(args.grid_backend)
+    if args.compact_logs:
+        from .compaction import spawn_compactor
+
+        spawn_compactor()
+    from .profiler import install_profiler_signal
+
+    install_profiler_signal(
+        args.profile_seconds, args.profile_interval_ms / 1000
+    )
+    if args.latency_file is not None:
+        enable_latency(args.latency_file, args.latency_every)
+    if args.seed is not None:
+        utils.seed_colony_rng(args.seed)
+    if args.bandit_file is not None:
+        load_game_modules().enable_role_bandit(args.bandit_file)
     try:
         asyncio.run(
             client_loop(
@@ -140,10 +473,13 @@ def client_main():
                 args.password_file_name,
                 args.hostname,
                 args.port,
+                args.metrics_port,
+                args.reconnect_attempts,
+                not args.no_warm_up,
             )
         )
     except ConnectionClosed:
-        print_and_flush("Connection closed by server")
+        console.warning("Connection closed by server")
         log_server("ERROR", "Connection closed by server")
 
 
@@ -0,0 +1,697 @@
+"""
+Dieses Modul verdichtet und bereinigt alte Log-Dateien in `logs/` und
+`logs/archive/` sowie in den Ordnern der Sitzungen des Multi-Account-Runners
+(`logs/<Sitzung>/` und `logs/<Sitzung>/archive/`).
+
+`archive_previous_chunk_if_exists()` verschiebt abgeschlossene Chunks nur
+ins Archiv, das Archiv wächst auf Dauer-Servern ohne Grenze. Die
+Verdichtung läuft deshalb als eigener Prozess mit niedrigster Priorität
+(`biester_compact` oder `--compact-logs` bei `biester_client` und
+`biester_runner`) und arbeitet in Durchgängen:
+
+1. Archivierte Beast-Chunks werden pro Spieltag (Änderungsdatum der Datei)
+   in ein Bündel `archive/bundles/game_YYYYMMDD.ndjson.gz` übernommen.
+   Server-Logs vergangener Tage werden nach
+   `archive/bundles/server_YYYYMMDD.ndjson.gz` übernommen. Dateien einer
+   Sitzung landen in eigenen Bündeln (`game_<Sitzung>_YYYYMMDD.ndjson.gz`,
+   `server_<Sitzung>_YYYYMMDD.ndjson.gz`), ihre Index-Einträge und
+   Manifest-Einträge tragen zusätzlich das Feld `session`.
+2. Dabei werden die Einträge mit höherem gzip-Level in Member zu je
+   BUNDLE_MEMBER_ROUNDS Runden neu komprimiert. Jedes Bündel bekommt eine
+   Index-Datei im Format von `logger.read_round_index()` (zusätzlich mit
+   Beast-ID und Chunk), `read_bundled_rounds()` springt damit direkt zu
+   den benötigten Membern.
+3. `archive/bundles/manifest.json` beschreibt alle Bündel (Größe, Runden,
+   Quelldateien). Erst nach dem Schreiben des Manifests werden die
+   Quelldateien gelöscht. Bricht ein Durchgang ab, wird das Bündel beim
+   nächsten Mal auf den Stand des Manifests zurückgeschnitten.
+4. Bündel, die älter als `max_age_days` sind, werden gelöscht. Danach
+   werden die ältesten Bündel gelöscht, bis das Archiv höchstens
+   `max_bytes` groß ist.
+
+zstd steht in der Standardbibliothek (Python < 3.14) nicht zur Verfügung,
+die Bündel bleiben deshalb gzip-Dateien und sind weiter mit `gzip`,
+`zcat` und dem Visualisierungs-Server lesbar.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from . import logger, utils
+from .logger import INDEX_SUFFIX, iter_members, record_round
+
+BUNDLE_FOLDER_NAME = "bundles"
+ARCHIVE_FOLDER_NAME = "archive"
+MANIFEST_NAME = "manifest.json"
+
+# gzip-Level der Bündel (die Live-Logs nutzen 1 bzw. 6)
+BUNDLE_LEVEL = 9
+
+# Runden pro gzip-Member in den Bündeln
+BUNDLE_MEMBER_ROUNDS = 1000
+
+# Dateien, die jünger sind, werden noch nicht angefasst (Sekunden)
+MIN_FILE_AGE = 60
+
+# Beast-Chunks im Log-Ordner, die so lange nicht geschrieben wurden,
+# gehören zu toten Beasts oder beendeten Spielen (Sekunden)
+STALE_CHUNK_AGE = 3600
+
+# Standard-Budgets und Pause zwischen zwei Durchgängen
+MAX_ARCHIVE_BYTES = 2 * 1024**3
+MAX_AGE_DAYS = 30
+COMPACTION_INTERVAL = 600
+
+BEAST_CHUNK_PATTERN = re.compile(
+    r"^beast-(?P<bid>.+)_c(?P<chunk>\d+)\.ndjson\.gz$"
+)
+SERVER_LOG_PATTERN = re.compile(r"^(?P<name>.+)_(?P<day>\d{8})\.ndjson\.gz$")
+
+# Unterordner des Log-Ordners, die keine Sitzungen sind (Archiv, Profile)
+RESERVED_FOLDERS = (ARCHIVE_FOLDER_NAME, "profiles")
+
+
+def get_bundle_folder(log_folder: str) -> str:
+    return os.path.join(log_folder, ARCHIVE_FOLDER_NAME, BUNDLE_FOLDER_NAME)
+
+
+def iter_session_folders(log_folder: str):
+    """
+    Zusammenfassung der Funktion: Liefert den Log-Ordner und die Ordner
+    aller Sitzungen darin.
+
+    Args:
+        log_folder (str): Log-Ordner.
+
+    Yields:
+        tuple[str | None, str]: Sitzungsname (None = Einzel-Client) und
+        Log-Ordner der Sitzung.
+    """
+
+    yield None, log_folder
+    if not os.path.isdir(log_folder):
+        return
+    for name in sorted(os.listdir(log_folder)):
+        path = os.path.join(log_folder, name)
+        if name not in RESERVED_FOLDERS and os.path.isdir(path):
+            yield name, path
+
+
+def get_bundle_name(prefix: str, session: str | None, day: str) -> str:
+    """Name des Bündels für Präfix, Sitzung und Tag (YYYYMMDD)."""
+    if session is None:
+        return f"{prefix}_{day}.ndjson.gz"
+    return f"{prefix}_{session}_{day}.ndjson.gz"
+
+
+def file_day(path: str) -> str:
+    """Tag der letzten Änderung einer Datei als YYYYMMDD."""
+    return datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y%m%d")
+
+
+def load_manifest(bundle_folder: str) -> dict:
+    """
+    Zusammenfassung der Funktion: Lädt das Manifest der Bündel.
+
+    Args:
+        bundle_folder (str): Ordner der Bündel.
+
+    Returns:
+        dict: Manifest mit "bundles" (Name -> Beschreibung), leer, wenn
+        noch keines existiert.
+    """
+
+    path = os.path.join(bundle_folder, MANIFEST_NAME)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"version": 1, "bundles": {}}
+
+
+def save_manifest(bundle_folder: str, manifest: dict) -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt das Manifest atomar (temporäre
+    Datei, dann ersetzen).
+
+    Args:
+        bundle_folder (str): Ordner der Bündel.
+        manifest (dict): Manifest.
+
+    Returns:
+        None
+    """
+
+    path = os.path.join(bundle_folder, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def repair_bundle(path: str, entry: dict | None) -> None:
+    """
+    Zusammenfassung der Funktion: Schneidet ein Bündel und seine
+    Index-Datei auf den Stand des Manifests zurück.
+
+    Daten, die ein abgebrochener Durchgang nach dem letzten Manifest
+    angehängt hat, werden so verworfen. Die Quelldateien existieren in
+    diesem Fall noch und werden erneut übernommen.
+
+    Args:
+        path (str): Pfad des Bündels.
+        entry (dict | None): Eintrag im Manifest, None = Bündel ist neu.
+
+    Returns:
+        None
+    """
+
+    size = entry["size"] if entry else 0
+    members = entry["members"] if entry else 0
+    if os.path.exists(path) and os.path.getsize(path) != size:
+        with open(path, "r+b") as f:
+            f.truncate(size)
+    index_path = path + INDEX_SUFFIX
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        if len(lines) != members:
+            with open(index_path, "w", encoding="utf-8") as f:
+                f.writelines(lines[:members])
+
+
+def iter_blocks(path: str):
+    """
+    Zusammenfassung der Funktion: Liest alle vollständigen Einträge einer
+    Log-Datei in Blöcken zu je BUNDLE_MEMBER_ROUNDS Runden.
+
+    Args:
+        path (str): Pfad der .ndjson.gz-Datei.
+
+    Yields:
+        tuple[int, int, list[bytes]]: Erste und letzte Runde sowie die
+        NDJSON-Zeilen (ohne Zeilenumbruch) eines Blocks.
+    """
+
+    block = None
+    lines = []
+    first_round = last_round = None
+    with open(path, "rb") as f:
+        for _, _, member_lines in iter_members(f):
+            for line in member_lines:
+                round_number = record_round(json.loads(line))
+                if lines and round_number // BUNDLE_MEMBER_ROUNDS != block:
+                    yield first_round, last_round, lines
+                    lines = []
+                if not lines:
+                    first_round = round_number
+                    block = round_number // BUNDLE_MEMBER_ROUNDS
+                lines.append(line)
+                last_round = round_number
+    if lines:
+        yield first_round, last_round, lines
+
+
+def append_to_bundle(
+    source: str, bundle_path: str, level: int, extra: dict
+) -> dict:
+    """
+    Zusammenfassung der Funktion: Hängt die Einträge einer Quelldatei neu
+    komprimiert an ein Bündel an.
+
+    Jeder Block aus iter_blocks() wird ein gzip-Member und bekommt einen
+    Eintrag in der Index-Datei des Bündels (r0, r1, off, len, n sowie die
+    Felder aus `extra`).
+
+    Args:
+        source (str): Pfad der Quelldatei.
+        bundle_path (str): Pfad des Bündels.
+        level (int): gzip-Level.
+        extra (dict): Zusätzliche Felder je Index-Eintrag (z. B. bid, c).
+
+    Returns:
+        dict: records, members, first_round und last_round der Quelldatei.
+    """
+
+    stats = {
+        "records": 0,
+        "members": 0,
+        "first_round": None,
+        "last_round": None,
+    }
+    with (
+        open(bundle_path, "ab") as f,
+        open(bundle_path + INDEX_SUFFIX, "a", encoding="utf-8") as index_file,
+    ):
+        f.seek(0, os.SEEK_END)
+        for first_round, last_round, lines in iter_blocks(source):
+            member = gzip.compress(b"\n".join(lines) + b"\n", level)
+            entry = dict(
+                extra,
+                r0=first_round,
+                r1=last_round,
+                off=f.tell(),
+                len=len(member),
+                n=len(lines),
+            )
+            f.write(member)
+            index_file.write(json.dumps(entry) + "\n")
+
+            stats["records"] += len(lines)
+            stats["members"] += 1
+            if stats["first_round"] is None:
+                stats["first_round"] = first_round
+            stats["last_round"] = last_round
+    return stats
+
+
+def find_sources(log_folder: str, now: float) -> list:
+    """
+    Zusammenfassung der Funktion: Sucht alle Dateien, die in Bündel
+    übernommen werden können.
+
+    Das sind archivierte Beast-Chunks, Beast-Chunks im Log-Ordner, die seit
+    STALE_CHUNK_AGE Sekunden nicht geschrieben wurden (tote Beasts werden
+    nie archiviert), sowie Server-Logs vergangener Tage im Log-Ordner.
+    Dateien, die jünger als MIN_FILE_AGE Sekunden sind, werden
+    übersprungen. Durchsucht werden auch die Ordner aller Sitzungen
+    (siehe iter_session_folders()); deren Index-Felder enthalten
+    zusätzlich `session`.
+
+    Args:
+        log_folder (str): Log-Ordner.
+        now (float): Aktuelle Zeit (time.time()).
+
+    Returns:
+        list[tuple[str, str, dict]]: Pfad der Quelldatei, Name des Bündels
+        und zusätzliche Index-Felder, sortiert nach Änderungszeit.
+    """
+
+    sources = []
+    today = datetime.fromtimestamp(now).strftime("%Y%m%d")
+    for session, session_folder in iter_session_folders(log_folder):
+        base = {} if session is None else {"session": session}
+        archive_folder = os.path.join(session_folder, ARCHIVE_FOLDER_NAME)
+        for folder, min_age in (
+            (archive_folder, MIN_FILE_AGE),
+            (session_folder, STALE_CHUNK_AGE),
+        ):
+            if not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                match = BEAST_CHUNK_PATTERN.match(name)
+                if match is not None:
+                    if now - os.path.getmtime(path) < min_age:
+                        continue
+                    extra = dict(base, bid=match["bid"], c=int(match["chunk"]))
+                    bundle = get_bundle_name("game", session, file_day(path))
+                    sources.append((path, bundle, extra))
+                    continue
+                match = SERVER_LOG_PATTERN.match(name)
+                if folder == session_folder and match and match["day"] < today:
+                    bundle = get_bundle_name(
+                        match["name"], session, match["day"]
+                    )
+                    sources.append((path, bundle, dict(base)))
+
+    sources.sort(key=lambda source: (os.path.getmtime(source[0]), source[0]))
+    return sources
+
+
+def compact_logs(
+    log_folder: str = logger.LOG_FOLDER,
+    level: int = BUNDLE_LEVEL,
+    now: float | None = None,
+) -> dict:
+    """
+    Zusammenfassung der Funktion: Übernimmt alle fertigen Log-Dateien in
+    Bündel und löscht danach die Quelldateien.
+
+    Args:
+        log_folder (str): Log-Ordner.
+        level (int): gzip-Level der Bündel.
+        now (float | None): Aktuelle Zeit, None = time.time().
+
+    Returns:
+        dict: Anzahl übernommener Dateien sowie Bytes vorher und nachher.
+    """
+
+    now = time.time() if now is None else now
+    bundle_folder = get_bundle_folder(log_folder)
+    os.makedirs(bundle_folder, exist_ok=True)
+    manifest = load_manifest(bundle_folder)
+    bundles = manifest["bundles"]
+    repaired = set()
+    result = {"files": 0, "bytes_in": 0, "bytes_out": 0}
+
+    for source, bundle_name, extra in find_sources(log_folder, now):
+        bundle_path = os.path.join(bundle_folder, bundle_name)
+        entry = bundles.get(bundle_name)
+        if bundle_name not in repaired:
+            repair_bundle(bundle_path, entry)
+            repaired.add(bundle_name)
+
+        source_name = os.path.basename(source)
+        mtime = os.path.getmtime(source)
+        already = entry is not None and any(
+            s["name"] == source_name and s["mtime"] == mtime
+            for s in entry["sources"]
+        )
+        if not already:
+            size_before = entry["size"] if entry else 0
+            stats = append_to_bundle(source, bundle_path, level, extra)
+            if entry is None:
+                entry = bundles[bundle_name] = {
+                    "kind": "game" if "bid" in extra else "server",
+                    "day": SERVER_LOG_PATTERN.match(bundle_name)["day"],
+                    "session": extra.get("session"),
+                    "size": 0,
+                    "members": 0,
+                    "records": 0,
+                    "first_round": None,
+                    "last_round": None,
+                    "sources": [],
+                }
+            entry["size"] = os.path.getsize(bundle_path)
+            entry["members"] += stats["members"]
+            entry["records"] += stats["records"]
+            for key, pick in (("first_round", min), ("last_round", max)):
+                values = [v for v in (entry[key], stats[key]) if v is not None]
+                entry[key] = pick(values) if values else None
+            entry["sources"].append(
+                dict(
+                    extra,
+                    name=source_name,
+                    mtime=mtime,
+                    records=stats["records"],
+                    first_round=stats["first_round"],
+                    last_round=stats["last_round"],
+                )
+            )
+            entry["updated"] = datetime.fromtimestamp(now).isoformat()
+            save_manifest(bundle_folder, manifest)
+            result["files"] += 1
+            result["bytes_in"] += os.path.getsize(source)
+            result["bytes_out"] += entry["size"] - size_before
+
+        # erst nach dem Manifest löschen
+        os.remove(source)
+        if os.path.exists(source + INDEX_SUFFIX):
+            os.remove(source + INDEX_SUFFIX)
+    return result
+
+
+def enforce_budgets(
+    log_folder: str = logger.LOG_FOLDER,
+    max_bytes: int = MAX_ARCHIVE_BYTES,
+    max_age_days: float = MAX_AGE_DAYS,
+    now: float | None = None,
+) -> list:
+    """
+    Zusammenfassung der Funktion: Löscht Bündel, die das Alters- oder
+    Größenbudget überschreiten.
+
+    Zuerst werden alle Bündel gelöscht, deren Tag älter als `max_age_days`
+    ist. Danach werden die ältesten Bündel gelöscht, bis das Archiv
+    (Bündel und noch nicht übernommene Dateien in den Archiven aller
+    Sitzungen) höchstens `max_bytes` groß ist.
+
+    Args:
+        log_folder (str): Log-Ordner.
+        max_bytes (int): Größenbudget des Archivs in Bytes.
+        max_age_days (float): Altersbudget in Tagen.
+        now (float | None): Aktuelle Zeit, None = time.time().
+
+    Returns:
+        list[str]: Namen der gelöschten Bündel.
+    """
+
+    now = time.time() if now is None else now
+    bundle_folder = get_bundle_folder(log_folder)
+    manifest = load_manifest(bundle_folder)
+    bundles = manifest["bundles"]
+    cutoff = datetime.fromtimestamp(now - max_age_days * 86400).strftime(
+        "%Y%m%d"
+    )
+
+    def bundle_bytes(name):
+        path = os.path.join(bundle_folder, name)
+        return sum(
+            os.path.getsize(p)
+            for p in (path, path + INDEX_SUFFIX)
+            if os.path.exists(p)
+        )
+
+    loose = 0
+    for _, session_folder in iter_session_folders(log_folder):
+        archive_folder = os.path.join(session_folder, ARCHIVE_FOLDER_NAME)
+        if os.path.isdir(archive_folder):
+            loose += sum(
+                os.path.getsize(os.path.join(archive_folder, name))
+                for name in os.listdir(archive_folder)
+                if os.path.isfile(os.path.join(archive_folder, name))
+            )
+    total = loose + sum(bundle_bytes(name) for name in bundles)
+
+    removed = []
+    for name in sorted(bundles, key=lambda n: (bundles[n]["day"], n)):
+        if bundles[name]["day"] >= cutoff and total <= max_bytes:
+            break
+        total -= bundle_bytes(name)
+        path = os.path.join(bundle_folder, name)
+        for p in (path, path + INDEX_SUFFIX):
+            if os.path.exists(p):
+                os.remove(p)
+        del bundles[name]
+        removed.append(name)
+
+    if removed:
+        save_manifest(bundle_folder, manifest)
+    return removed
+
+
+def read_bundled_rounds(
+    bid,
+    first_round: int,
+    last_round: int,
+    log_folder=logger.LOG_FOLDER,
+    session: str | None = None,
+) -> list:
+    """
+    Zusammenfassung der Funktion: Liest die Einträge eines Beasts aus dem
+    Rundenbereich [first_round, last_round] aus den Bündeln.
+
+    Pro Bündel werden über die Index-Datei nur die Member des Beasts
+    dekomprimiert, die den Bereich überschneiden.
+
+    Args:
+        bid: ID des Beasts.
+        first_round (int): Erste Runde (inklusive).
+        last_round (int): Letzte Runde (inklusive).
+        log_folder (str): Log-Ordner.
+        session (str | None): Sitzung des Beasts, None = Einzel-Client.
+
+    Returns:
+        list[dict]: Einträge in Rundenreihenfolge.
+    """
+
+    bundle_folder = get_bundle_folder(log_folder)
+    manifest = load_manifest(bundle_folder)
+    records = []
+    for name, entry in sorted(manifest["bundles"].items()):
+        if entry["kind"] != "game" or entry.get("session") != session:
+            continue
+        path = os.path.join(bundle_folder, name)
+        members = [
+            member
+            for member in logger.read_round_index(path)
+            if member.get("bid") == str(bid)
+            and member.get("session") == session
+            and member["r1"] >= first_round
+            and member["r0"] <= last_round
+        ]
+        with open(path, "rb") as f:
+            for member in members:
+                f.seek(member["off"])
+                data = gzip.decompress(f.read(member["len"]))
+                for line in data.splitlines():
+                    record = json.loads(line)
+                    if first_round <= record_round(record) <= last_round:
+                        records.append(record)
+    records.sort(key=record_round)
+    return records
+
+
+def read_beast_rounds(
+    bid,
+    first_round: int,
+    last_round: int,
+    log_folder=logger.LOG_FOLDER,
+    session: str | None = None,
+) -> list:
+    """
+    Zusammenfassung der Funktion: Wie logger.read_beast_rounds(), liest aber
+    zusätzlich bereits verdichtete Chunks aus den Bündeln.
+
+    Args:
+        bid: ID des Beasts.
+        first_round (int): Erste Runde (inklusive).
+        last_round (int): Letzte Runde (inklusive).
+        log_folder (str): Log-Ordner.
+        session (str | None): Sitzung des Beasts, None = Einzel-Client.
+
+    Returns:
+        list[dict]: Einträge in Rundenreihenfolge.
+    """
+
+    records = read_bundled_rounds(
+        bid, first_round, last_round, log_folder, session
+    )
+    session_folder = (
+        log_folder if session is None else os.path.join(log_folder, session)
+    )
+    records += logger.read_beast_rounds(
+        bid, first_round, last_round, session_folder
+    )
+    records.sort(key=record_round)
+    return records
+
+
+def lower_priority() -> None:
+    """
+    Zusammenfassung der Funktion: Senkt die CPU- (nice 19, unter Linux
+    SCHED_IDLE) Priorität des eigenen Prozesses.
+
+    Returns:
+        None
+    """
+
+    if hasattr(os, "nice"):
+        try:
+            os.nice(19)
+        except OSError:
+            pass
+    if hasattr(os, "sched_setscheduler") and hasattr(os, "SCHED_IDLE"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+        except OSError:
+            pass
+
+
+def spawn_compactor(
+    log_folder: str = logger.LOG_FOLDER,
+    interval: float = COMPACTION_INTERVAL,
+    max_bytes: int = MAX_ARCHIVE_BYTES,
+    max_age_days: float = MAX_AGE_DAYS,
+):
+    """
+    Zusammenfassung der Funktion: Startet die Verdichtung als eigenen
+    Prozess und beendet ihn beim Shutdown des Clients.
+
+    Args:
+        log_folder (str): Log-Ordner.
+        interval (float): Sekunden zwischen zwei Durchgängen.
+        max_bytes (int): Größenbudget des Archivs in Bytes.
+        max_age_days (float): Altersbudget in Tagen.
+
+    Returns:
+        subprocess.Popen: Der gestartete Prozess.
+    """
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "pymonster.compaction",
+            "--log-folder",
+            log_folder,
+            "--interval",
+            str(interval),
+            "--max-bytes",
+            str(max_bytes),
+            "--max-age-days",
+            str(max_age_days),
+        ],
+        stdin=subprocess.DEVNULL,
+    )
+    utils.register_shutdown_hook(process.terminate)
+    return process
+
+
+def compaction_main():
+    """
+    Zusammenfassung der Funktion: CLI-Einstiegspunkt für die Verdichtung.
+
+    Beispiel:
+        biester_compact --log-folder logs --max-bytes 500000000
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Compact archived logs into per-game bundles"
+    )
+    parser.add_argument(
+        "--log-folder", default=logger.LOG_FOLDER, help="Folder with logs"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=COMPACTION_INTERVAL,
+        help="Seconds between two compaction passes",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Run a single pass and exit"
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=MAX_ARCHIVE_BYTES,
+        help="Size budget of the archive in bytes",
+    )
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=MAX_AGE_DAYS,
+        help="Delete bundles older than this many days",
+    )
+    parser.add_argument(
+        "--level", type=int, default=BUNDLE_LEVEL, help="gzip level"
+    )
+    args = parser.parse_args()
+
+    lower_priority()
+    try:
+        while True:
+            result = compact_logs(args.log_folder, args.level)
+            removed = enforce_budgets(
+                args.log_folder, args.max_bytes, args.max_age_days
+            )
+            if result["files"] or removed:
+                print(
+                    f"compacted {result['files']} files "
+                    f"({result['bytes_in']} -> {result['bytes_out']} bytes), "
+                    f"removed {len(removed)} bundles",
+                    flush=True,
+                )
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    compaction_main()
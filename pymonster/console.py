@@ -0,0 +1,271 @@
+"""
+Dieses Modul stellt die Konsolenausgabe des Beast-Clients bereit.
+
+Bisher wurde jede Meldung mit `print()` und `sys.stdout.flush()` direkt im
+Event-Loop geschrieben. Hängt stdout an einer langsamen Pipe, blockiert
+jeder Flush die Zugberechnung. Stattdessen gilt jetzt:
+
+- Jede Meldung hat ein Level (DEBUG, INFO, WARNING, ERROR), Meldungen
+  unter `CONSOLE_LEVEL` werden sofort verworfen.
+- Meldungen mit einem Schlüssel (`key`) werden pro Schlüssel auf
+  RATE_LIMIT_BURST Meldungen pro RATE_LIMIT_INTERVAL Sekunden begrenzt,
+  unterdrückte Meldungen werden bei der nächsten erlaubten mitgezählt.
+- Geschrieben wird von einem Hintergrund-Thread in Blöcken mit einem
+  Flush pro Block. Die Warteschlange ist begrenzt, bei Überlauf werden
+  neue Meldungen verworfen und gezählt.
+
+`utils.print_and_flush()` ist nur noch eine dünne Hülle um `info()`.
+"""
+
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {
+    "debug": DEBUG,
+    "info": INFO,
+    "warning": WARNING,
+    "error": ERROR,
+}
+
+CONSOLE_LEVEL = INFO
+
+# Rate-Limit pro Schlüssel
+RATE_LIMIT_INTERVAL = 1.0
+RATE_LIMIT_BURST = 5
+
+# Maximale Anzahl wartender Meldungen
+MAX_QUEUE = 10000
+
+# Maximale Wartezeit von flush() in Sekunden
+FLUSH_TIMEOUT = 5.0
+
+
+class ConsoleWriter:
+    """
+    Zusammenfassung der Klasse: Gepufferter Writer, der Meldungen aus einer
+    begrenzten Warteschlange in einem Hintergrund-Thread schreibt.
+
+    Jede Meldung merkt sich ihren Ziel-Stream zum Zeitpunkt des Aufrufs,
+    damit Umleitungen wie contextlib.redirect_stdout() weiter greifen.
+    """
+
+    def __init__(self, max_queue: int = MAX_QUEUE):
+        self._max_queue = max_queue
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._dropped = 0
+        self._thread = None
+
+    def get_queue_depth(self) -> int:
+        return len(self._queue)
+
+    def get_dropped(self) -> int:
+        return self._dropped
+
+    def write(self, stream, text: str) -> bool:
+        """
+        Zusammenfassung der Funktion: Reiht einen Text zum Schreiben ein,
+        ohne zu blockieren.
+
+        Args:
+            stream (TextIO): Ziel-Stream.
+            text (str): Zu schreibender Text inkl. Zeilenumbruch.
+
+        Returns:
+            bool: False, wenn die Warteschlange voll war und der Text
+            verworfen wurde.
+        """
+
+        with self._cond:
+            if len(self._queue) >= self._max_queue:
+                self._dropped += 1
+                return False
+            self._queue.append((stream, text))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="pymonster-console", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                batch = list(self._queue)
+                self._queue.clear()
+                self._busy = True
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _write_batch(batch: list) -> None:
+        """
+        Zusammenfassung der Funktion: Schreibt einen Block von Meldungen mit
+        einem write() und einem flush() pro Ziel-Stream.
+
+        Args:
+            batch (list[tuple[TextIO, str]]): Meldungen in Reihenfolge.
+
+        Returns:
+            None
+        """
+
+        start = 0
+        while start < len(batch):
+            stream = batch[start][0]
+            end = start
+            while end < len(batch) and batch[end][0] is stream:
+                end += 1
+            try:
+                stream.write("".join(text for _, text in batch[start:end]))
+                stream.flush()
+            except (OSError, ValueError):
+                # Stream geschlossen (z. B. Pipe weg): Meldungen verwerfen
+                pass
+            start = end
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """
+        Zusammenfassung der Funktion: Wartet, bis alle wartenden Meldungen
+        geschrieben sind (z. B. beim Shutdown).
+
+        Args:
+            timeout (float): Maximale Wartezeit in Sekunden.
+
+        Returns:
+            bool: True, wenn die Warteschlange leer ist.
+        """
+
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._busy, timeout
+            )
+
+
+class RateLimiter:
+    """
+    Zusammenfassung der Klasse: Begrenzt Meldungen pro Schlüssel auf eine
+    feste Anzahl pro Zeitfenster.
+    """
+
+    def __init__(
+        self,
+        interval: float = RATE_LIMIT_INTERVAL,
+        burst: int = RATE_LIMIT_BURST,
+    ):
+        self._interval = interval
+        self._burst = burst
+        # Schlüssel -> [Fensterbeginn, Anzahl im Fenster, unterdrückt]
+        self._windows = {}
+
+    def allow(self, key: str, now: float | None = None) -> tuple:
+        """
+        Zusammenfassung der Funktion: Prüft, ob eine Meldung mit diesem
+        Schlüssel ausgegeben werden darf.
+
+        Args:
+            key (str): Meldungstyp.
+            now (float | None): Aktuelle Zeit (time.monotonic()).
+
+        Returns:
+            tuple[bool, int]: Ob die Meldung erlaubt ist und wie viele
+            Meldungen seit der letzten erlaubten unterdrückt wurden.
+        """
+
+        now = time.monotonic() if now is None else now
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self._interval:
+            suppressed = window[2] if window is not None else 0
+            self._windows[key] = [now, 1, 0]
+            return True, suppressed
+        if window[1] < self._burst:
+            window[1] += 1
+            return True, 0
+        window[2] += 1
+        return False, 0
+
+
+WRITER = ConsoleWriter()
+RATE_LIMITER = RateLimiter()
+
+atexit.register(WRITER.flush)
+
+
+def set_level(level) -> None:
+    """
+    Zusammenfassung der Funktion: Setzt das minimale Level der
+    Konsolenausgabe.
+
+    Args:
+        level (int | str): Level als Zahl oder Name ("debug", "info", ...).
+
+    Returns:
+        None
+    """
+
+    global CONSOLE_LEVEL
+    if isinstance(level, str):
+        level = LEVEL_NAMES[level.lower()]
+    CONSOLE_LEVEL = level
+
+
+def log(level: int, message: str, key: str | None = None) -> None:
+    """
+    Zusammenfassung der Funktion: Gibt eine Meldung gepuffert aus.
+
+    Args:
+        level (int): Level der Meldung.
+        message (str): Meldungstext.
+        key (str | None): Meldungstyp für das Rate-Limit, None = kein Limit.
+
+    Returns:
+        None
+    """
+
+    if level < CONSOLE_LEVEL:
+        return
+    if key is not None:
+        allowed, suppressed = RATE_LIMITER.allow(key)
+        if not allowed:
+            return
+        if suppressed:
+            message = f"{message} ({suppressed} similar messages suppressed)"
+    if level >= WARNING:
+        message = f"[{'ERROR' if level >= ERROR else 'WARNING'}] {message}"
+    WRITER.write(sys.stdout, message + "\n")
+
+
+def debug(message: str, key: str | None = None) -> None:
+    log(DEBUG, message, key)
+
+
+def info(message: str, key: str | None = None) -> None:
+    log(INFO, message, key)
+
+
+def warning(message: str, key: str | None = None) -> None:
+    log(WARNING, message, key)
+
+
+def error(message: str, key: str | None = None) -> None:
+    log(ERROR, message, key)
+
+
+def flush(timeout: float = FLUSH_TIMEOUT) -> bool:
+    return WRITER.flush(timeout)
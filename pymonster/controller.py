@@ -8,17 +8,18 @@ das zentrale Steuerelement `control_cmd()` bereit, welches alle eingehenden
 Nachrichten des Servers interpretiert und passende Aktionen ausführt.
 """
 
-import random
-from . import utils
-from .utils import print_and_flush, cmd
+import heapq
+from . import console, latency, metrics, utils
+from .utils import cmd
 from .logic import (
     handle_beast_gone,
     handle_no_beasts_left,
     decide_action,
+    OPPONENT_STATS,
 )
 from .beast import Beast
 from .logger import log_server
-
+from .tuning import RoleBandit, build_role_arms
 
 # Rollen-Presets: hier kannst du später einfach Zahlen anpassen oder Rollen hinzufügen
 ROLE_CONFIGS = {
@@ -46,7 +47,25 @@ ROLE_CONFIGS = {
 }
 
 
-def choose_role_by_score(score):
+# Ziel-Mischung der Rollen für die periodische Neuverteilung
+ROLE_TARGET_MIX = {
+    "farmer": 0.40,
+    "hunter": 0.30,
+    "backbag": 0.30,
+}
+
+# Alle wie viele Beast-Anfragen die Rollen neu verteilt werden
+ROLE_REBALANCE_INTERVAL = 50
+
+# Beast-Anfragen seit dem letzten Durchlauf pro Sitzung (None =
+# Einzel-Client)
+_requests_since_rebalance = {}
+
+# Online-Tuning der Rollen-Prioritäten, None = aus (siehe enable_role_bandit)
+ROLE_BANDIT = None
+
+
+def choose_role_by_score(score, aggression=0.0, rng=None):
     """
     Zusammenfassung der Funktion: Wählt eine Rolle für ein Beast basierend auf
     einem Leistungswert (Score).
@@ -54,9 +73,16 @@ def choose_role_by_score(score):
     Je nach Score wird eine defensive, ausgewogene oder offensive Rolle
     probabilistisch ausgewählt. Dies erlaubt es neuen Beasts, in ihrer
     Spielweise variabel zu sein und sich der Spielsituation anzupassen.
+    Ist die Region aggressiv (viele Annäherungen stärkerer Gegner), werden
+    Rollen mit hoher Escape-Priorität zusätzlich stärker gewichtet.
 
     Args:
         score (float): Leistungswert des Beasts (z. B. Energie / Rundenanzahl).
+        aggression (float): Aggressions-Schätzung der Region, in der das
+            Beast spawnt (siehe OpponentStats.aggression_at). Bei 0.0
+            bleiben die Gewichte unverändert.
+        rng (random.Random | None): Zufallsgenerator für die Auswahl,
+            None = utils.COLONY_RNG.
 
     Returns:
         str: Name der gewählten Rolle ("farmer", "hunter" oder "backbag").
@@ -84,9 +110,42 @@ def choose_role_by_score(score):
             "backbag": 0.1,
         }
 
+    if aggression > 0.0:
+        weights = adjust_weights_for_aggression(weights, aggression)
+
+    if rng is None:
+        rng = utils.COLONY_RNG
+
     roles = list(weights.keys())
     probs = list(weights.values())
-    return random.choices(roles, weights=probs, k=1)[0]
+    return rng.choices(roles, weights=probs, k=1)[0]
+
+
+def adjust_weights_for_aggression(weights, aggression):
+    """
+    Zusammenfassung der Funktion: Verschiebt Rollengewichte in Richtung
+    fluchtstarker Rollen, wenn die Gegner in der Region aggressiv sind.
+
+    Jedes Gewicht wird mit (1 + aggression * escape / max_escape)
+    multipliziert, wobei escape die Escape-Priorität der Rolle aus
+    ROLE_CONFIGS ist. Anschließend werden die Gewichte normiert.
+
+    Args:
+        weights (dict[str, float]): Ausgangsgewichte pro Rolle.
+        aggression (float): Aggressions-Schätzung der Region.
+
+    Returns:
+        dict[str, float]: Angepasste, normierte Gewichte pro Rolle.
+    """
+
+    max_escape = max(cfg["escape"] for cfg in ROLE_CONFIGS.values())
+    adjusted = {
+        role: weight
+        * (1.0 + aggression * ROLE_CONFIGS[role]["escape"] / max_escape)
+        for role, weight in weights.items()
+    }
+    total = sum(adjusted.values())
+    return {role: weight / total for role, weight in adjusted.items()}
 
 
 def apply_role_to_beast(beast: Beast, role_name: str) -> None:
@@ -97,6 +156,8 @@ def apply_role_to_beast(beast: Beast, role_name: str) -> None:
     Jede Rolle legt fest, wie stark das Beast Futter priorisiert, wie weit
     es Gegner jagt, wann es fliehen soll oder welche max. Move-Energie es
     besitzt. Diese Werte werden als Prioritäten in das Beast geschrieben.
+    Ist das Online-Tuning aktiv, wählt ROLE_BANDIT einen der
+    Prioritäten-Vektoren der Rolle aus.
 
     Args:
         beast (Beast): Das zu konfigurierende Beast.
@@ -106,12 +167,205 @@ def apply_role_to_beast(beast: Beast, role_name: str) -> None:
         None
     """
 
-    cfg = ROLE_CONFIGS[role_name]
+    if ROLE_BANDIT is None:
+        cfg = ROLE_CONFIGS[role_name]
+    else:
+        arm = ROLE_BANDIT.select(role_name)
+        cfg = ROLE_BANDIT.arm_config(role_name, arm)
+        ROLE_BANDIT.start(beast.get_id(), role_name, arm, beast.get_energy())
+
     beast.set_priority_food(cfg["food"])
     beast.set_priority_hunt(cfg["hunt"])
     beast.set_priority_kill(cfg["kill"])
     beast.set_priority_escape(cfg["escape"])
     beast.set_priority_energy(cfg["energy"])
+    beast.set_role(role_name)
+
+
+def enable_role_bandit(stats_file=None) -> RoleBandit:
+    """
+    Zusammenfassung der Funktion: Aktiviert das Online-Tuning der
+    Rollen-Prioritäten mit einem UCB1-Bandit.
+
+    Mit Statistik-Datei werden die Arm-Statistiken zusätzlich beim
+    Shutdown (über utils.register_shutdown_hook) gespeichert.
+
+    Args:
+        stats_file (str | None): JSON-Datei, aus der die Arm-Statistiken
+            geladen und in die sie gespeichert werden.
+
+    Returns:
+        RoleBandit: Der aktivierte Bandit.
+    """
+
+    global ROLE_BANDIT
+    ROLE_BANDIT = RoleBandit(build_role_arms(ROLE_CONFIGS), stats_file)
+    if stats_file is not None:
+        utils.register_shutdown_hook(save_role_bandit)
+    return ROLE_BANDIT
+
+
+def observe_role_bandit(beast: Beast, energy: float) -> None:
+    """
+    Zusammenfassung der Funktion: Meldet die aktuelle Energie eines Beasts an
+    den Bandit und zieht nach einem abgeschlossenen Fenster einen neuen Arm.
+
+    Args:
+        beast (Beast): Beast, dessen Energie gemeldet wird.
+        energy (float): Aktuelle Energie laut Server.
+
+    Returns:
+        None
+    """
+
+    if ROLE_BANDIT is None:
+        return
+    if ROLE_BANDIT.observe(beast.get_id(), energy):
+        apply_role_to_beast(beast, beast.get_role())
+
+
+def save_role_bandit() -> None:
+    """
+    Zusammenfassung der Funktion: Speichert die Arm-Statistiken, falls das
+    Online-Tuning mit einer Statistik-Datei aktiv ist.
+
+    Returns:
+        None
+    """
+
+    if ROLE_BANDIT is not None and ROLE_BANDIT.get_stats_file() is not None:
+        ROLE_BANDIT.save()
+
+
+def compute_role_quotas(colony_size: int, target_mix: dict) -> dict:
+    """
+    Zusammenfassung der Funktion: Rechnet eine Ziel-Mischung in ganzzahlige
+    Rollen-Kontingente für eine Kolonie um.
+
+    Die Kontingente werden abgerundet und der Rest an die Rollen mit dem
+    größten Nachkomma-Anteil verteilt, sodass die Summe genau der
+    Koloniegröße entspricht.
+
+    Args:
+        colony_size (int): Anzahl der Beasts in der Kolonie.
+        target_mix (dict[str, float]): Anteil pro Rolle (Summe ~1.0).
+
+    Returns:
+        dict[str, int]: Anzahl der Beasts pro Rolle.
+    """
+
+    total = sum(target_mix.values())
+    exact = {
+        role: colony_size * share / total for role, share in target_mix.items()
+    }
+    quotas = {role: int(value) for role, value in exact.items()}
+    rest = colony_size - sum(quotas.values())
+    by_fraction = sorted(
+        exact, key=lambda role: exact[role] - quotas[role], reverse=True
+    )
+    for role in by_fraction[:rest]:
+        quotas[role] += 1
+    return quotas
+
+
+def rebalance_roles(beasts, target_mix=ROLE_TARGET_MIX) -> int:
+    """
+    Zusammenfassung der Funktion: Verteilt die Rollen der Kolonie anhand der
+    laufenden Energie-Raten neu, um eine Ziel-Mischung einzuhalten.
+
+    Beasts ohne Rolle und Beasts aus überbesetzten Rollen werden in einen
+    Pool freigegeben. Aus überbesetzten Rollen werden jeweils die Beasts
+    freigegeben, die am schlechtesten zur Rolle passen (Hunter mit der
+    niedrigsten, Backbags mit der höchsten Energie-Rate). Unterbesetzte
+    Rollen werden danach aus dem Pool aufgefüllt: Hunter bekommen die
+    Beasts mit der höchsten Rate, Backbags die mit der niedrigsten, Farmer
+    den Rest. Beasts, deren Rolle passt, bleiben unverändert. Die Auswahl
+    erfolgt per heapq (O(n log k)), ohne die ganze Kolonie zu sortieren.
+
+    Args:
+        beasts (list[Beast]): Alle lebenden Beasts der Kolonie.
+        target_mix (dict[str, float]): Ziel-Anteil pro Rolle.
+
+    Returns:
+        int: Anzahl der Beasts, deren Rolle geändert wurde.
+    """
+
+    quotas = compute_role_quotas(len(beasts), target_mix)
+    members = {role: [] for role in quotas}
+    pool = []
+
+    for beast in beasts:
+        role = beast.get_role()
+        if role in members:
+            members[role].append(beast)
+        else:
+            pool.append(beast)
+
+    def rate(beast):
+        return beast.get_energy_rate()
+
+    # 1. Überbesetzte Rollen freigeben
+    for role, role_members in members.items():
+        surplus = len(role_members) - quotas[role]
+        if surplus <= 0:
+            continue
+        if role == "backbag":
+            released = heapq.nlargest(surplus, role_members, key=rate)
+        else:
+            released = heapq.nsmallest(surplus, role_members, key=rate)
+        released_ids = set(id(beast) for beast in released)
+        members[role] = [b for b in role_members if id(b) not in released_ids]
+        pool.extend(released)
+
+    # 2. Unterbesetzte Rollen aus dem Pool auffüllen
+    deficits = {
+        role: quotas[role] - len(role_members)
+        for role, role_members in members.items()
+    }
+    assignment = []
+
+    for role, pick in (
+        ("hunter", heapq.nlargest),
+        ("backbag", heapq.nsmallest),
+    ):
+        if deficits.get(role, 0) <= 0 or not pool:
+            continue
+        chosen = pick(deficits[role], pool, key=rate)
+        chosen_ids = set(id(beast) for beast in chosen)
+        pool = [beast for beast in pool if id(beast) not in chosen_ids]
+        assignment.extend((beast, role) for beast in chosen)
+
+    # alle übrigen Beasts werden Farmer
+    assignment.extend((beast, "farmer") for beast in pool)
+
+    changed = 0
+    for beast, role in assignment:
+        if beast.get_role() != role:
+            apply_role_to_beast(beast, role)
+            changed += 1
+    return changed
+
+
+def maybe_rebalance_roles() -> int:
+    """
+    Zusammenfassung der Funktion: Führt rebalance_roles() periodisch alle
+    ROLE_REBALANCE_INTERVAL Beast-Anfragen der aktuellen Sitzung aus.
+
+    Wird in control_cmd() aufgerufen, nachdem der Befehl an den Server
+    gesendet wurde und während auf dessen Antwort gewartet wird, also
+    außerhalb des kritischen Antwortpfads.
+
+    Returns:
+        int: Anzahl der geänderten Rollen (0, wenn kein Durchlauf fällig war).
+    """
+
+    session = utils.get_session_name()
+    requests = _requests_since_rebalance.get(session, 0) + 1
+    if requests < ROLE_REBALANCE_INTERVAL:
+        _requests_since_rebalance[session] = requests
+        return 0
+    _requests_since_rebalance[session] = 0
+    return rebalance_roles(utils.get_beast_list())
 
 
 async def control_cmd(server_str, websocket, my_beast):
@@ -142,6 +396,7 @@ async def control_cmd(server_str, websocket, my_beast):
     match server_str:
         case cmd.BEAST_COMMAND_REQUEST:
             id_energy_env = await websocket.recv()
+            clock = latency.start_clock()
             # print_and_flush(f"{id_energy_env = }")
             (
                 beast_id_str,
@@ -157,21 +412,25 @@ async def control_cmd(server_str, websocket, my_beast):
             new_abs_x = None
             new_abs_y = None
             abs_round = None
+            curr_beast = my_beast
 
-            for beast in utils.GLOBAL_BEAST_LIST:
+            for beast in utils.get_beast_list():
                 beast_id_list = beast.get_id()
                 if beast_id == beast_id_list:
                     beast.set_energy(energy)
+                    beast.update_energy_rate(energy)
                     beast.set_environment(environment_str)
                     server_command, (new_abs_x, new_abs_y), abs_round = (
                         decide_action(beast)
                     )
+                    curr_beast = beast
                     found = True
                     break
 
             if not found:  # Wird nur bei dem ersten Biest ausgeführt
                 my_beast.set_id(beast_id)
                 my_beast.set_energy(energy)
+                my_beast.update_energy_rate(energy)
                 my_beast.set_environment(environment_str)
                 server_command, (new_abs_x, new_abs_y), abs_round = (
                     decide_action(my_beast)
@@ -180,9 +439,22 @@ async def control_cmd(server_str, websocket, my_beast):
             # Biest hier mit Setter überschreiben
             # print_and_flush(f'sending "{server_command}"')
             await websocket.send(server_command)
+            if clock:
+                clock.lap("decide_and_send")
+            # Tuning und Rollen-Neuverteilung laufen, während der Server
+            # antwortet
+            metrics.inc("turns")
+            observe_role_bandit(curr_beast, energy)
+            maybe_rebalance_roles()
+            if clock:
+                clock.lap("tuning")
+                latency.maybe_dump_latency()
+                clock.skip()
             server_str = await websocket.recv()
+            if clock:
+                clock.lap("server_reply")
             if "ERROR" in server_str:
-                print_and_flush(server_str)
+                console.error(server_str, key="server_error")
                 success_str = "False"
                 new_beast_id_str = "None"
             else:
@@ -193,24 +465,41 @@ async def control_cmd(server_str, websocket, my_beast):
                 # Erstellt ein neues Biest
                 split_energy = energy / 2
                 score = split_energy / abs_round
-                new_beast = Beast()
+                # das neue Beast nutzt denselben Zufallsgenerator
+                new_beast = Beast(rng=curr_beast.get_rng())
                 new_beast.set_id(new_beast_id)
                 new_beast.set_abs_x(new_abs_x)
                 new_beast.set_abs_y(new_abs_y)
                 new_beast.set_round_abs(abs_round)
 
-                # neue Bestie bekommt eine zufällige Rolle
-                role_name = choose_role_by_score(score)
+                # Energie halbiert sich durch den Split, das ist kein
+                # Einkommen -> Ausgangswert für die Energie-Rate setzen
+                curr_beast.set_energy_baseline(split_energy)
+                new_beast.set_energy_baseline(split_energy)
+                new_beast.set_energy(split_energy)
+                if ROLE_BANDIT is not None:
+                    ROLE_BANDIT.rebase(curr_beast.get_id(), -split_energy)
+
+                # neue Bestie bekommt eine zufällige Rolle, abhängig von
+                # der Gegner-Aggression in der Region des Spawn-Felds
+                aggression = OPPONENT_STATS.aggression_at(new_abs_x, new_abs_y)
+                role_name = choose_role_by_score(
+                    score, aggression, curr_beast.get_rng()
+                )
                 apply_role_to_beast(new_beast, role_name)
 
-                utils.GLOBAL_BEAST_LIST.append(new_beast)
+                utils.get_beast_list().append(new_beast)
+                metrics.inc("splits")
                 log_server("S_R", server_str)
 
+            if clock:
+                clock.lap("split_bookkeeping")
+                clock.total("control_cmd")
             return True
 
         case cmd.BEAST_GONE_INFO:
             id_energy_env = await websocket.recv()
-            print_and_flush(f"{id_energy_env = }")
+            console.debug(f"{id_energy_env = }", key="beast_gone_info")
             (
                 beast_id_str,
                 energy_str,
@@ -219,14 +508,22 @@ async def control_cmd(server_str, websocket, my_beast):
             beast_id = int(beast_id_str)
             energy = float(energy_str)
             environment_str = str(environment_str)
+            if ROLE_BANDIT is not None:
+                ROLE_BANDIT.finish(beast_id, energy)
+            metrics.inc("deaths")
             await handle_beast_gone(beast_id, energy, environment_str)
             return True
         case cmd.NO_BEASTS_LEFT_INFO:
+            save_role_bandit()
             await handle_no_beasts_left()
             return True
         case cmd.SHUTDOWN_INFO:
+            save_role_bandit()
             return False
         # default, damit unser Client nicht stoppt
         case _:
-            print_and_flush(f"Unknown server message: {server_str!r}")
+            console.warning(
+                f"Unknown server message: {server_str!r}",
+                key="unknown_message",
+            )
             return True
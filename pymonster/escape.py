@@ -0,0 +1,507 @@
+"""
+Dieses Modul bewertet alle 24 Escape-Moves eines Beasts in einem Durchgang.
+
+Statt pro Gegner Feld für Feld eine Gefahrenmenge aufzubauen und jeden Move
+einzeln mit verschachtelten hypot-Schleifen zu bewerten, werden vorab
+Tabellen berechnet:
+- `DANGER_MASKS`: pro Gegner-Offset die Gefahrenmaske des eigenen 5x5-
+  Bereichs (Dilatation mit dem 5x5-Kern `DANGER_KERNEL`)
+- `DISTANCES`: euklidische Distanz für jede Differenz Move - Gegner
+
+Wie in `grid` gibt es zwei Backends: "python" verknüpft Bitmasken (ints) und
+summiert Tabellenwerte, "numpy" verknüpft boolesche Masken, bildet die
+Distanzmatrix (Moves x Gegner) per Broadcasting und sortiert mit einem
+einzigen `np.lexsort`. Beide liefern exakt die Reihenfolge von
+`Beast.score_safe_moves()`: zuerst 1er-Moves, dann längere Moves, jeweils
+nach absteigender Distanzsumme und bei Gleichstand in der Reihenfolge der
+Kandidaten.
+"""
+
+import math
+
+from . import grid
+
+# Reichweite der Escape-Moves und der Gefahrenzone um einen Gegner
+MOVE_RANGE = 2
+DANGER_RANGE = 2
+
+# Kandidaten in der bisherigen Reihenfolge (x außen, y innen)
+AREA = tuple(
+    (x, y)
+    for x in range(-MOVE_RANGE, MOVE_RANGE + 1)
+    for y in range(-MOVE_RANGE, MOVE_RANGE + 1)
+)
+CANDIDATES = tuple(move for move in AREA if move != (0, 0))
+
+# 0 = 1er-Move (Chebyshev-Distanz 1), 1 = längerer Move
+STEP_GROUPS = tuple(
+    0 if max(abs(x), abs(y)) == 1 else 1 for x, y in CANDIDATES
+)
+
+# 5x5-Dilatationskern: Offsets, die ein Gegner bedroht
+DANGER_KERNEL = tuple(
+    (kx, ky)
+    for kx in range(-DANGER_RANGE, DANGER_RANGE + 1)
+    for ky in range(-DANGER_RANGE, DANGER_RANGE + 1)
+)
+
+
+def _danger_mask(ex: int, ey: int) -> int:
+    mask = 0
+    for kx, ky in DANGER_KERNEL:
+        cell = (ex + kx, ey + ky)
+        if cell in CANDIDATES:
+            mask |= 1 << CANDIDATES.index(cell)
+    return mask
+
+
+# Gefahrenmaske (Bit i = CANDIDATES[i]) für jeden Gegner im 7x7-Sichtfeld
+DANGER_MASKS = {
+    (ex, ey): _danger_mask(ex, ey)
+    for ex in range(-grid.CENTER, grid.CENTER + 1)
+    for ey in range(-grid.CENTER, grid.CENTER + 1)
+}
+
+# Distanzen für alle Differenzen Move - Gegner (Index + DISTANCE_OFFSET)
+DISTANCE_OFFSET = MOVE_RANGE + grid.CENTER
+DISTANCES = tuple(
+    tuple(
+        math.hypot(dx, dy)
+        for dy in range(-DISTANCE_OFFSET, DISTANCE_OFFSET + 1)
+    )
+    for dx in range(-DISTANCE_OFFSET, DISTANCE_OFFSET + 1)
+)
+
+# NumPy-Varianten der Tabellen, beim ersten Aufruf des numpy-Backends gebaut
+_numpy_tables = None
+
+
+def rank_escape_moves(enemy_list: list) -> list:
+    """
+    Zusammenfassung der Funktion: Liefert alle Moves außerhalb der
+    Gefahrenzone, sortiert nach ihrer Eignung zur Flucht.
+
+    Eigene Beasts werden hier nicht berücksichtigt; das Herausfiltern
+    blockierter Moves ändert die Reihenfolge der übrigen nicht.
+
+    Args:
+        enemy_list (list[tuple[int, int]]): Relative Gegnerpositionen
+            (dx, dy) im 7x7-Sichtfeld.
+
+    Returns:
+        list[tuple[int, int]]: Sichere Moves, zuerst 1er-Moves, dann
+        längere, jeweils mit absteigender Distanzsumme zu den Gegnern.
+    """
+
+    if not enemy_list:
+        return []
+    if grid.BACKEND == "numpy":
+        return _rank_numpy(enemy_list)
+
+    danger = 0
+    for enemy in enemy_list:
+        danger |= DANGER_MASKS[enemy]
+
+    ranked = []
+    for index, (mx, my) in enumerate(CANDIDATES):
+        if danger >> index & 1:
+            continue
+        score = 0.0
+        for ex, ey in enemy_list:
+            score += DISTANCES[mx - ex + DISTANCE_OFFSET][
+                my - ey + DISTANCE_OFFSET
+            ]
+        ranked.append((STEP_GROUPS[index], -score, index))
+
+    # Tupel-Vergleich mit Index als letztem Schlüssel = stabile Sortierung
+    ranked.sort()
+    return [CANDIDATES[index] for _, _, index in ranked]
+
+
+def _load_numpy_tables():
+    global _numpy_tables
+
+    import numpy as np
+
+    if _numpy_tables is None:
+        masks = np.zeros(
+            (2 * grid.CENTER + 1, 2 * grid.CENTER + 1, len(CANDIDATES)),
+            dtype=bool,
+        )
+        for (ex, ey), mask in DANGER_MASKS.items():
+            for index in range(len(CANDIDATES)):
+                masks[ex + grid.CENTER, ey + grid.CENTER, index] = bool(
+                    mask >> index & 1
+                )
+        _numpy_tables = (
+            masks,
+            np.array(DISTANCES),
+            np.array(CANDIDATES, dtype=np.int64),
+            np.array(STEP_GROUPS, dtype=np.int64),
+        )
+    return _numpy_tables
+
+
+def _rank_numpy(enemy_list: list) -> list:
+    import numpy as np
+
+    masks, distances, candidates, groups = _load_numpy_tables()
+    enemies = np.array(enemy_list, dtype=np.int64)
+
+    # Gefahrenmaske: ODER der vorberechneten Masken aller Gegner
+    danger = masks[enemies[:, 0] + grid.CENTER, enemies[:, 1] + grid.CENTER]
+    safe = np.flatnonzero(~danger.any(axis=0))
+    if safe.size == 0:
+        return []
+
+    # Distanzmatrix Moves x Gegner; cumsum summiert in Gegner-Reihenfolge
+    # wie die Schleife in score_safe_moves (gleiche Rundung)
+    moves = candidates[safe]
+    diff = moves[:, None, :] - enemies[None, :, :] + DISTANCE_OFFSET
+    scores = distances[diff[:, :, 0], diff[:, :, 1]].cumsum(axis=1)[:, -1]
+
+    # Primär Gruppe, dann absteigender Score, dann Kandidaten-Reihenfolge
+    order = np.lexsort((safe, -scores, groups[safe]))
+    return [tuple(move) for move in moves[order].tolist()]
+
+
+##############################
+#  Mehrschritt-Escape-Suche  #
+##############################
+
+# Anzahl eigener Züge, die die Suche vorausschaut (1 = keine Suche)
+SEARCH_DEPTH = 2
+
+# Höchstens so viele nahe Gegner antworten gemeinsam, alle übrigen stehen
+SEARCH_ENEMY_LIMIT = 3
+
+# Maximale Anzahl Suchknoten pro Escape-Aufruf (Tiefe 2 braucht < 100)
+SEARCH_NODE_BUDGET = 1000
+
+# Alle eigenen Folgezüge inkl. Stehenbleiben, Bit i = AREA[i]
+ALL_LANDINGS = (1 << len(AREA)) - 1
+
+
+def _reach_mask(ox: int, oy: int) -> int:
+    mask = 0
+    for index, (x, y) in enumerate(AREA):
+        if max(abs(x - ox), abs(y - oy)) <= DANGER_RANGE:
+            mask |= 1 << index
+    return mask
+
+
+# Landefelder (Bit i = AREA[i]), die ein Gegner mit Offset (ox, oy) erreicht
+_REACH_SPAN = 2 * MOVE_RANGE + DANGER_RANGE
+REACH_MASKS = {
+    (ox, oy): _reach_mask(ox, oy)
+    for ox in range(-_REACH_SPAN, _REACH_SPAN + 1)
+    for oy in range(-_REACH_SPAN, _REACH_SPAN + 1)
+}
+
+
+# Mögliche Reichweiten-Masken eines Gegners mit Offset (ox, oy) nach
+# seiner Antwort (ein Zug aus AREA), ohne Duplikate
+REPLY_MASKS = {
+    (ox, oy): frozenset(
+        REACH_MASKS.get((ox + mx, oy + my), 0) for mx, my in AREA
+    )
+    for ox in range(-_REACH_SPAN, _REACH_SPAN + 1)
+    for oy in range(-_REACH_SPAN, _REACH_SPAN + 1)
+}
+
+
+class SearchBudgetExceeded(Exception):
+    """Die Suche hat SEARCH_NODE_BUDGET Knoten überschritten."""
+
+
+class EscapeSearch:
+    """
+    Zusammenfassung der Klasse: Adversariale Suche über eigene Züge und
+    die ungünstigsten Antworten der Gegner.
+
+    Ein Zustand besteht aus unserer Position und den Gegnerpositionen,
+    alles relativ zu unserer aktuellen Position. Wir ziehen bis zu 2 Felder
+    weit (oder bleiben stehen) und überleben, wenn kein Gegner das
+    Landefeld erreicht (Chebyshev-Distanz > 2). Danach ziehen die nahen
+    Gegner gemeinsam so, dass uns möglichst wenig Ausweichfelder bleiben.
+    Eigene Beasts blockieren Landefelder.
+
+    Die Suche beantwortet nur Ja/Nein-Fragen ("überleben wir noch d Züge?"),
+    so dass UND/ODER-Knoten beim ersten entscheidenden Kind abbrechen
+    (Alpha-Beta mit Null-Fenster). Ergebnisse landen in einer
+    Transpositionstabelle. Im letzten Halbzug werden Gegnerantworten auf
+    die erreichten Landefelder reduziert (vorberechnete Bitmasken, gleiche
+    Wirkung nur einmal), die Frage wird dann zu einem kleinen
+    Überdeckungsproblem.
+    """
+
+    def __init__(
+        self,
+        enemy_list: list,
+        blocked: set,
+        node_budget: int = SEARCH_NODE_BUDGET,
+    ):
+        """
+        Zusammenfassung der Funktion: Initialisiert die Suche.
+
+        Args:
+            enemy_list (list[tuple[int, int]]): Relative Gegnerpositionen.
+            blocked (set[tuple[int, int]]): Relative Felder eigener Beasts.
+            node_budget (int): Maximale Anzahl Suchknoten.
+        """
+
+        self._enemies = tuple(sorted(enemy_list))
+        self._blocked = frozenset(blocked)
+        self._node_budget = node_budget
+        self._nodes = 0
+        self._table = {}
+        self._blocked_masks = {}
+
+    def get_nodes(self) -> int:
+        return self._nodes
+
+    def _count_node(self) -> None:
+        self._nodes += 1
+        if self._nodes > self._node_budget:
+            raise SearchBudgetExceeded
+
+    def _blocked_mask(self, p: tuple) -> int:
+        mask = self._blocked_masks.get(p)
+        if mask is None:
+            px, py = p
+            mask = 0
+            for index, (x, y) in enumerate(AREA):
+                if (px + x, py + y) in self._blocked:
+                    mask |= 1 << index
+            self._blocked_masks[p] = mask
+        return mask
+
+    @staticmethod
+    def _reach(p: tuple, enemies) -> int:
+        px, py = p
+        mask = 0
+        for ex, ey in enemies:
+            mask |= REACH_MASKS.get((ex - px, ey - py), 0)
+        return mask
+
+    def _free_landings(self, p: tuple, enemies) -> int:
+        return ALL_LANDINGS & ~self._blocked_mask(p) & ~self._reach(p, enemies)
+
+    def survives(self, p: tuple, enemies: tuple, depth: int) -> bool:
+        """
+        Zusammenfassung der Funktion: Prüft, ob wir von Position p aus
+        (am Zug) noch `depth` eigene Züge sicher überstehen.
+
+        Args:
+            p (tuple[int, int]): Eigene Position.
+            enemies (tuple[tuple[int, int], ...]): Sortierte Gegnerpositionen.
+            depth (int): Anzahl eigener Züge.
+
+        Returns:
+            bool: True, wenn es für jede Gegnerantwort einen sicheren Zug
+            gibt.
+
+        Raises:
+            SearchBudgetExceeded: Wenn das Knotenbudget aufgebraucht ist.
+        """
+
+        key = ("our", p, enemies, depth)
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached
+        self._count_node()
+
+        free = self._free_landings(p, enemies)
+        if depth <= 1 or not free:
+            result = bool(free)
+        else:
+            px, py = p
+            result = False
+            for index, (x, y) in enumerate(AREA):
+                if free >> index & 1 and self.survives_replies(
+                    (px + x, py + y), enemies, depth - 1
+                ):
+                    result = True
+                    break
+        self._table[key] = result
+        return result
+
+    def survives_replies(self, q: tuple, enemies: tuple, depth: int) -> bool:
+        """
+        Zusammenfassung der Funktion: Prüft, ob wir auf Feld q jede
+        gemeinsame Antwort der nahen Gegner überstehen und danach noch
+        `depth` Züge sicher sind.
+
+        Args:
+            q (tuple[int, int]): Eigene Position nach unserem Zug.
+            enemies (tuple[tuple[int, int], ...]): Sortierte Gegnerpositionen.
+            depth (int): Anzahl eigener Züge nach der Antwort.
+
+        Returns:
+            bool: True, wenn keine Antwort uns einschließt.
+
+        Raises:
+            SearchBudgetExceeded: Wenn das Knotenbudget aufgebraucht ist.
+        """
+
+        if depth <= 0:
+            return True
+        key = ("enemy", q, enemies, depth)
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached
+        self._count_node()
+
+        qx, qy = q
+        # Nur Gegner, die uns in den restlichen Zügen noch erreichen können
+        horizon = 2 * MOVE_RANGE * depth + DANGER_RANGE
+        by_distance = sorted(
+            enemies, key=lambda e: max(abs(e[0] - qx), abs(e[1] - qy))
+        )
+        movers = [
+            e
+            for e in by_distance[:SEARCH_ENEMY_LIMIT]
+            if max(abs(e[0] - qx), abs(e[1] - qy)) <= horizon
+        ]
+        static = tuple(e for e in enemies if e not in movers)
+
+        if depth == 1:
+            result = not self._can_cover(q, movers, static)
+        else:
+            result = self._survives_all_replies(q, movers, static, depth)
+        self._table[key] = result
+        return result
+
+    def _can_cover(self, q: tuple, movers: list, static: tuple) -> bool:
+        # Können die Gegner gemeinsam alle freien Landefelder erreichen?
+        uncovered = self._free_landings(q, static)
+        if uncovered == 0 or not movers:
+            return uncovered == 0
+        qx, qy = q
+        options = []
+        for ex, ey in movers[:-1]:
+            masks = {
+                mask & uncovered for mask in REPLY_MASKS[(ex - qx, ey - qy)]
+            }
+            # dominierte Antworten (Teilmenge einer anderen) entfernen;
+            # nach Größe sortiert steht jede Obermenge vor ihren Teilmengen
+            kept = []
+            for mask in sorted(masks, key=lambda m: -bin(m).count("1")):
+                if not any(mask & other == mask for other in kept):
+                    kept.append(mask)
+            options.append(kept)
+        ex, ey = movers[-1]
+        return self._cover(uncovered, options, REPLY_MASKS[(ex - qx, ey - qy)])
+
+    @staticmethod
+    def _cover(uncovered: int, options: list, last: frozenset) -> bool:
+        if not options:
+            # letzter Gegner: eine Antwort muss den Rest allein abdecken
+            return any(mask & uncovered == uncovered for mask in last)
+        for mask in options[0]:
+            if EscapeSearch._cover(uncovered & ~mask, options[1:], last):
+                return True
+        return False
+
+    def _survives_all_replies(
+        self, q: tuple, movers: list, static: tuple, depth: int
+    ) -> bool:
+        qx, qy = q
+
+        def distance(e):
+            return max(abs(e[0] - qx), abs(e[1] - qy))
+
+        def replies(enemy):
+            ex, ey = enemy
+            # Vor den letzten Halbzügen nur Antworten, die näher kommen
+            # (Vorwärts-Pruning), die nächsten zuerst: findet
+            # Einschließungen früh
+            current = distance(enemy)
+            return sorted(
+                (
+                    reply
+                    for reply in ((ex + mx, ey + my) for mx, my in AREA)
+                    if distance(reply) < current
+                ),
+                key=distance,
+            ) or [enemy]
+
+        def search(index: int, placed: tuple) -> bool:
+            if index == len(movers):
+                return self.survives(q, tuple(sorted(placed)), depth)
+            for reply in replies(movers[index]):
+                if not search(index + 1, placed + (reply,)):
+                    return False
+            return True
+
+        return search(0, static)
+
+    def survival(self, move: tuple, depth: int = SEARCH_DEPTH) -> int:
+        """
+        Zusammenfassung der Funktion: Anzahl eigener Züge (1..depth), die
+        wir nach `move` sicher überstehen.
+
+        Args:
+            move (tuple[int, int]): Erster Zug, außerhalb jeder
+                Gegner-Reichweite.
+            depth (int): Suchtiefe in eigenen Zügen.
+
+        Returns:
+            int: 1, wenn uns die Gegner direkt danach einschließen können,
+            bis depth, wenn wir alle Züge sicher überstehen.
+
+        Raises:
+            SearchBudgetExceeded: Wenn das Knotenbudget aufgebraucht ist.
+        """
+
+        for remaining in range(depth - 1, 0, -1):
+            if self.survives_replies(move, self._enemies, remaining):
+                return remaining + 1
+        return 1
+
+
+def order_by_survival(
+    moves: list,
+    enemy_list: list,
+    blocked: set,
+    depth: int = SEARCH_DEPTH,
+    node_budget: int = SEARCH_NODE_BUDGET,
+) -> list:
+    """
+    Zusammenfassung der Funktion: Sortiert Escape-Moves stabil nach der
+    Anzahl Züge, die wir nach ihnen sicher überstehen.
+
+    Moves, nach denen uns die Gegner einschließen können (z. B. an einer
+    Wand eigener Beasts oder zwischen zwei Gegnern), rutschen nach hinten.
+    Innerhalb gleicher Überlebensdauer bleibt die Reihenfolge erhalten.
+    Die Tiefe wird schrittweise erhöht; reicht das Knotenbudget für eine
+    Stufe nicht, gilt das Ergebnis der vorigen Stufe (reicht es schon für
+    Tiefe 2 nicht, bleibt die Reihenfolge unverändert).
+
+    Args:
+        moves (list[tuple[int, int]]): Escape-Moves in bisheriger Reihenfolge.
+        enemy_list (list[tuple[int, int]]): Relative Gegnerpositionen.
+        blocked (set[tuple[int, int]]): Relative Felder eigener Beasts.
+        depth (int): Suchtiefe in eigenen Zügen (<= 1 = unverändert).
+        node_budget (int): Maximale Anzahl Suchknoten.
+
+    Returns:
+        list[tuple[int, int]]: Umsortierte Escape-Moves.
+    """
+
+    if depth <= 1 or not moves or not enemy_list:
+        return list(moves)
+
+    # Iterative Vertiefung: eine tiefere Stufe ersetzt die vorige nur,
+    # wenn sie innerhalb des Knotenbudgets vollständig bewertet wurde
+    search = EscapeSearch(enemy_list, blocked, node_budget)
+    survival = {}
+    for level in range(2, depth + 1):
+        try:
+            survival = {
+                move: search.survival(tuple(move), level) for move in moves
+            }
+        except SearchBudgetExceeded:
+            break
+        depth = level
+    return sorted(moves, key=lambda move: -survival.get(move, depth))
@@ -0,0 +1,167 @@
+"""
+Dieses Modul prognostiziert die Energie eines Beasts für die nächsten Runden,
+vor allem für die Entscheidung, ob sich ein Split lohnt.
+
+Grundlage sind die Werte, die `Beast.update_energy_rate()` in O(1) Zustand
+mitführt: exponentiell gewichtete Einkommens-Rate (Energie-Delta pro Runde)
+und deren Varianz. Dazu kommt die Futterdichte der Region aus
+`logic.OPPONENT_STATS`.
+
+Nach einem Split teilen sich beide Hälften das Futter der Umgebung. In
+futterreichen Regionen behält jede Hälfte fast die volle Rate, in kargen nur
+etwa die Hälfte (d = Futterdichte):
+
+    Rate pro Hälfte = Rate * (0.5 + 0.5 * d / (d + FOOD_DENSITY_HALF))
+
+Negative Raten (Bewegungskosten ohne Futter) trägt jede Hälfte voll. Die
+Prognose ist eine untere Schranke:
+
+    Energie + Runden * Rate - FORECAST_Z * sqrt(Runden * Varianz)
+
+`forecast_colony()` liefert die Prognosen für die ganze Kolonie; im
+numpy-Backend (siehe `grid`) in einem Schritt über Arrays.
+"""
+
+import math
+
+from . import grid, logic
+
+# Erst ab so vielen Energie-Deltas gilt die Prognose als belastbar
+FORECAST_MIN_SAMPLES = 10
+
+# Sicherheitsabstand der unteren Schranke in Standardabweichungen
+FORECAST_Z = 1.0
+
+# Futterdichte, bei der jede Hälfte 75 % der Rate behält
+FOOD_DENSITY_HALF = 0.05
+
+
+def half_income_rate(rate: float, food_density: float) -> float:
+    """
+    Zusammenfassung der Funktion: Schätzt die Einkommens-Rate einer Hälfte
+    nach einem Split.
+
+    Args:
+        rate (float): Bisherige Einkommens-Rate des Beasts.
+        food_density (float): Futterdichte der Region (0.0 bis 1.0).
+
+    Returns:
+        float: Erwartete Rate pro Hälfte.
+    """
+
+    if rate <= 0:
+        return rate
+    share = food_density / (food_density + FOOD_DENSITY_HALF)
+    return rate * (0.5 + 0.5 * share)
+
+
+def forecast_energy(
+    energy: float, rate: float, variance: float, rounds: int
+) -> float:
+    """
+    Zusammenfassung der Funktion: Berechnet die untere Schranke der Energie
+    nach `rounds` Runden.
+
+    Args:
+        energy (float): Aktuelle Energie.
+        rate (float): Einkommens-Rate pro Runde.
+        variance (float): Varianz des Einkommens pro Runde.
+        rounds (int): Prognose-Horizont in Runden.
+
+    Returns:
+        float: Prognostizierte Energie (pessimistisch).
+    """
+
+    return energy + rounds * rate - FORECAST_Z * math.sqrt(rounds * variance)
+
+
+def split_forecast(beast, rounds: int) -> float | None:
+    """
+    Zusammenfassung der Funktion: Prognostiziert die Energie einer Hälfte,
+    wenn sich das Beast jetzt teilt.
+
+    Args:
+        beast (Beast): Beast, das einen Split erwägt.
+        rounds (int): Prognose-Horizont in Runden.
+
+    Returns:
+        float | None: Untere Schranke der Energie einer Hälfte nach
+        `rounds` Runden, None bei weniger als FORECAST_MIN_SAMPLES
+        Energie-Deltas.
+    """
+
+    if beast.get_energy_samples() < FORECAST_MIN_SAMPLES:
+        return None
+    density = logic.OPPONENT_STATS.food_density_at(
+        beast.get_abs_x(), beast.get_abs_y()
+    )
+    return forecast_energy(
+        beast.get_energy() / 2,
+        half_income_rate(beast.get_energy_rate(), density),
+        beast.get_energy_variance(),
+        rounds,
+    )
+
+
+def forecast_colony(beasts: list, rounds: int) -> list:
+    """
+    Zusammenfassung der Funktion: Prognostiziert für alle Beasts der
+    Kolonie die Energie ohne und mit Split.
+
+    Args:
+        beasts (list[Beast]): Beasts der Kolonie.
+        rounds (int): Prognose-Horizont in Runden.
+
+    Returns:
+        list[tuple[float, float | None]]: Pro Beast (Energie ohne Split,
+        Energie einer Hälfte nach Split); die Split-Prognose ist None bei zu
+        wenigen Energie-Deltas.
+    """
+
+    if not beasts:
+        return []
+    if grid.BACKEND == "numpy":
+        return _forecast_colony_numpy(beasts, rounds)
+
+    forecasts = []
+    for beast in beasts:
+        whole = forecast_energy(
+            beast.get_energy(),
+            beast.get_energy_rate(),
+            beast.get_energy_variance(),
+            rounds,
+        )
+        forecasts.append((whole, split_forecast(beast, rounds)))
+    return forecasts
+
+
+def _forecast_colony_numpy(beasts: list, rounds: int) -> list:
+    import numpy as np
+
+    stats = logic.OPPONENT_STATS
+    data = np.array(
+        [
+            (
+                beast.get_energy(),
+                beast.get_energy_rate(),
+                beast.get_energy_variance(),
+                stats.food_density_at(beast.get_abs_x(), beast.get_abs_y()),
+                beast.get_energy_samples(),
+            )
+            for beast in beasts
+        ]
+    )
+    energy, rate, variance, density, samples = data.T
+
+    spread = FORECAST_Z * np.sqrt(rounds * variance)
+    whole = energy + rounds * rate - spread
+
+    share = density / (density + FOOD_DENSITY_HALF)
+    half_rate = np.where(rate <= 0, rate, rate * (0.5 + 0.5 * share))
+    half = energy / 2 + rounds * half_rate - spread
+
+    ready = samples >= FORECAST_MIN_SAMPLES
+    return [
+        (float(w), float(h) if r else None)
+        for w, h, r in zip(whole, half, ready)
+    ]
@@ -0,0 +1,249 @@
+"""
+Dieses Modul stellt die Sichtfeld-Operationen eines einzelnen Beasts in zwei
+austauschbaren Backends bereit.
+
+Für ein einzelnes 7x7-Sichtfeld kostet der Aufruf-Overhead von NumPy
+(Array-Erzeugung, Masken, Dispatch) mehr als die eigentliche Arbeit. Das
+Backend "python" arbeitet deshalb nur mit Listen, Tupeln, ints und bei Import
+vorberechneten Tabellen und lädt NumPy gar nicht erst. Das Backend "numpy"
+entspricht dem bisherigen Verhalten (Sichtfeld als `numpy.ndarray`) und bleibt
+für Vergleiche und für gebündelte Berechnungen über viele Beasts erhalten.
+
+Beide Backends kodieren Sichtfelder als Bytes (ein uint8 pro Zelle, ASCII des
+Symbols) und liefern sie so, dass sie mit `field[y][x]`, `len(field)` und
+Iteration über Zeilen gelesen werden können: "python" als Liste von
+`bytearray`-Zeilen, "numpy" als (7, 7)-uint8-Array über dem Puffer des
+kodierten Strings (`encode_environment()`). Zellen werden mit den
+Symbol-Konstanten (EMPTY, FOOD, ...) verglichen; alle Verbraucher in
+`beast.py` verwenden nur diese Schnittstelle.
+
+Standard ist "python" (per Benchmark gewählt, siehe
+`benchmarks/test_bench_strategies.py`).
+"""
+
+BACKENDS = ("python", "numpy")
+BACKEND = "python"
+
+# Kantenlänge des Sichtfeldes und Position des Beasts darin
+GRID_SIZE = 7
+CENTER = GRID_SIZE // 2
+CENTER_INDEX = CENTER * GRID_SIZE + CENTER
+
+# Symbole des Sichtfeldes als uint8 (ASCII)
+EMPTY = ord(".")
+FOOD = ord("*")
+BEAST = ord("B")
+WEAKER = ord("<")
+STRONGER = ord(">")
+EQUAL = ord("=")
+
+# Start-Indizes der Zeilen im linearen Environment-String
+ROW_STARTS = tuple(range(0, GRID_SIZE * GRID_SIZE, GRID_SIZE))
+
+# Alle Moves mit |dx| < 3 und |dy| < 3 (Standard-Limit der Move-Filter)
+VALID_MOVES = frozenset((dx, dy) for dx in range(-2, 3) for dy in range(-2, 3))
+
+
+def _shift_table(dx: int, dy: int) -> tuple:
+    """
+    Zusammenfassung der Funktion: Berechnet für ein um (dx, dy) verschobenes
+    Sichtfeld den Quell-Index jeder Zelle.
+
+    Args:
+        dx (int): Verschiebung in x-Richtung.
+        dy (int): Verschiebung in y-Richtung.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Pro Zeile die Quell-Indizes im linearen
+        Environment-String, -1 für Zellen außerhalb des alten Sichtfeldes.
+    """
+
+    rows = []
+    for y in range(GRID_SIZE):
+        row = []
+        for x in range(GRID_SIZE):
+            src_x = x + dx
+            src_y = y + dy
+            if 0 <= src_x < GRID_SIZE and 0 <= src_y < GRID_SIZE:
+                row.append(src_y * GRID_SIZE + src_x)
+            else:
+                row.append(-1)
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+# Vorberechnete Verschiebungstabellen für alle Moves innerhalb des Sichtfeldes
+SHIFT_TABLES = {
+    (dx, dy): _shift_table(dx, dy)
+    for dx in range(-CENTER, CENTER + 1)
+    for dy in range(-CENTER, CENTER + 1)
+}
+
+
+def set_backend(name: str) -> None:
+    """
+    Zusammenfassung der Funktion: Wählt das Backend für die Sichtfeld-
+    Operationen.
+
+    Args:
+        name (str): "python" oder "numpy".
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Bei einem unbekannten Backend.
+    """
+
+    global BACKEND
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown grid backend: {name}")
+    BACKEND = name
+
+
+def get_backend() -> str:
+    return BACKEND
+
+
+def encode_environment(env: str):
+    """
+    Zusammenfassung der Funktion: Kodiert einen Environment-String als
+    (7, 7)-uint8-Array.
+
+    Das Array ist eine Sicht (ohne Kopie) auf die Bytes des kodierten
+    Strings und daher schreibgeschützt. Es ist die kanonische Darstellung
+    für Berechnungen über viele Sichtfelder.
+
+    Args:
+        env (str): Lineare Darstellung des 7x7-Sichtfeldes (49 Zeichen).
+
+    Returns:
+        numpy.ndarray: (7, 7)-Array mit dtype uint8.
+    """
+
+    # NumPy nur für das numpy-Backend laden
+    import numpy as np
+
+    return np.frombuffer(env.encode("ascii"), dtype=np.uint8).reshape(
+        GRID_SIZE, GRID_SIZE
+    )
+
+
+def parse_grid(env: str):
+    """
+    Zusammenfassung der Funktion: Wandelt einen linearen Environment-String
+    in ein 7x7-Sichtfeld aus uint8-Symbolen um und setzt das Beast (BEAST)
+    in die Mitte.
+
+    Args:
+        env (str): Lineare Darstellung des 7x7-Sichtfeldes.
+
+    Returns:
+        list[bytearray] | numpy.ndarray: Sichtfeld im Format des aktiven
+        Backends.
+    """
+
+    if BACKEND == "numpy":
+        field = encode_environment(env)
+        if field[CENTER, CENTER] != BEAST:
+            # nur kopieren, wenn die Mitte noch nicht 'B' ist
+            field = field.copy()
+            field[CENTER, CENTER] = BEAST
+        return field
+
+    data = bytearray(env.encode("ascii"))
+    data[CENTER_INDEX] = BEAST
+    return [data[start : start + GRID_SIZE] for start in ROW_STARTS]
+
+
+def shift_grid(env: str, move: tuple[int, int]):
+    """
+    Zusammenfassung der Funktion: Simuliert das Sichtfeld nach einem Move
+    (dx, dy) des Beasts.
+
+    Alle 'B' des alten Sichtfeldes werden zu '.', Zellen außerhalb des alten
+    Sichtfeldes werden mit '.' aufgefüllt und das Beast sitzt wieder in der
+    Mitte.
+
+    Args:
+        env (str): Lineare Darstellung des aktuellen 7x7-Sichtfeldes.
+        move (tuple[int, int]): Simulierter Move (dx, dy).
+
+    Returns:
+        list[bytearray] | numpy.ndarray: Verschobenes Sichtfeld im Format
+        des aktiven Backends.
+    """
+
+    if BACKEND == "numpy":
+        return _shift_grid_numpy(env, move)
+
+    dx, dy = move
+    table = SHIFT_TABLES.get((dx, dy))
+    if table is None:
+        table = _shift_table(dx, dy)
+    source = bytearray(env.encode("ascii"))
+    source[CENTER_INDEX] = BEAST
+    source = source.replace(b"B", b".")
+    field = [
+        bytearray(source[index] if index >= 0 else EMPTY for index in row)
+        for row in table
+    ]
+    field[CENTER][CENTER] = BEAST
+    return field
+
+
+def _shift_grid_numpy(env: str, move: tuple[int, int]):
+    import numpy as np
+
+    dx, dy = move
+    field = parse_grid(env)
+    new_field = np.full((GRID_SIZE, GRID_SIZE), EMPTY, dtype=np.uint8)
+
+    # Sichtfeld so verschieben, als ob das Beast um (dx, dy) gegangen wäre
+    if abs(dx) < GRID_SIZE and abs(dy) < GRID_SIZE:
+        new_field[
+            max(0, -dy) : GRID_SIZE - max(0, dy),
+            max(0, -dx) : GRID_SIZE - max(0, dx),
+        ] = field[
+            max(0, dy) : GRID_SIZE + min(0, dy),
+            max(0, dx) : GRID_SIZE + min(0, dx),
+        ]
+
+    # 'B' entfernen, wir interessieren uns nur für Futter / Gegner
+    new_field[new_field == BEAST] = EMPTY
+
+    # Beast sitzt in der Zukunft wieder in der Mitte
+    new_field[CENTER, CENTER] = BEAST
+    return new_field
+
+
+def filter_moves(moves: list, limit: int = 3):
+    """
+    Zusammenfassung der Funktion: Behält nur Moves, deren Betrag in beiden
+    Komponenten kleiner als `limit` ist.
+
+    Args:
+        moves (list[tuple[int, int]]): Moves (dx, dy).
+        limit (int): Obergrenze (exklusiv) pro Komponente.
+
+    Returns:
+        list[tuple[int, int]] | numpy.ndarray: Gültige Moves in
+        ursprünglicher Reihenfolge, als Liste von Tupeln (python) oder als
+        (n, 2)-Array (numpy).
+    """
+
+    if BACKEND == "numpy":
+        import numpy as np
+
+        from .logic import filter_valid_moves
+
+        return filter_valid_moves(np.array(moves), limit)
+
+    if limit == 3:
+        return [(dx, dy) for dx, dy in moves if (dx, dy) in VALID_MOVES]
+    return [
+        (dx, dy)
+        for dx, dy in moves
+        if -limit < dx < limit and -limit < dy < limit
+    ]
@@ -0,0 +1,149 @@
+"""
+Dieses Modul bewertet Kill-Moves auf schwächere Gegner ('<') nach ihrem
+erwarteten Energie-Gewinn.
+
+Für jeden Kandidaten wird
+
+    EV = Trefferquote * Beute-Energie - Move-Kosten - Risiko * eigene Energie
+
+berechnet. Die Move-Kosten entsprechen `logic.calc_move_energy()` (bei Import
+in `MOVE_COSTS` vorberechnet), Trefferquote und Beute-Energie liefert
+`OpponentStats`. Das Risiko wächst mit der Zahl der Bedrohungen ('>' oder '=')
+in Reichweite des Zielfeldes: Wer dort landet, kann in der nächsten Runde
+selbst gefressen werden und verliert dann seine gesamte Energie.
+
+Wie in `grid` und `escape` gibt es zwei Backends: "python" bewertet die
+Kandidaten in einer Schleife, "numpy" bildet die Abstandsmatrix (Kandidaten x
+Bedrohungen) per Broadcasting und bewertet alle Kandidaten in einem Schritt.
+Beide liefern dieselbe Reihenfolge.
+"""
+
+from . import grid
+from .escape import AREA, DANGER_RANGE, MOVE_RANGE
+from .logic import calc_move_energy
+
+# Bedrohungen in dieser Chebyshev-Distanz zum Zielfeld zählen als Risiko
+THREAT_RANGE = DANGER_RANGE
+
+# Risiko pro Bedrohung (Anteil der eigenen Energie), gedeckelt bei 1
+KILL_THREAT_RISK = 0.25
+
+# Energie-Kosten aller Kill-Kandidaten im 5x5-Bereich
+MOVE_COSTS = {move: calc_move_energy(move) for move in AREA}
+
+_numpy_costs = None
+
+
+def kill_value(
+    move: tuple[int, int],
+    own_energy: float,
+    victim_energy: float,
+    hit_rate: float,
+    threats: list,
+) -> float:
+    """
+    Zusammenfassung der Funktion: Berechnet den erwarteten Energie-Gewinn
+    eines einzelnen Kill-Moves.
+
+    Args:
+        move (tuple[int, int]): Kill-Move (dx, dy) im 5x5-Bereich.
+        own_energy (float): Energie des jagenden Beasts.
+        victim_energy (float): Geschätzte Energie der Beute.
+        hit_rate (float): Wahrscheinlichkeit, die Beute zu erwischen.
+        threats (list[tuple[int, int]]): Relative Positionen von '>' und
+            '=' im Sichtfeld.
+
+    Returns:
+        float: Erwarteter Energie-Gewinn (negativ = lohnt sich nicht).
+    """
+
+    mx, my = move
+    count = 0
+    for tx, ty in threats:
+        if max(abs(mx - tx), abs(my - ty)) <= THREAT_RANGE:
+            count += 1
+    risk = min(1.0, count * KILL_THREAT_RISK)
+    return hit_rate * victim_energy - MOVE_COSTS[move] - risk * own_energy
+
+
+def rank_kill_moves(
+    moves: list,
+    own_energy: float,
+    victim_energy: float,
+    hit_rate: float,
+    threats: list,
+) -> list:
+    """
+    Zusammenfassung der Funktion: Sortiert Kill-Moves nach absteigendem
+    erwarteten Energie-Gewinn und verwirft unrentable Moves.
+
+    Bei gleichem Wert bleibt die Reihenfolge von `moves` erhalten.
+
+    Args:
+        moves (list[tuple[int, int]]): Kill-Moves (dx, dy) im 5x5-Bereich.
+        own_energy (float): Energie des jagenden Beasts.
+        victim_energy (float): Geschätzte Energie der Beute.
+        hit_rate (float): Wahrscheinlichkeit, die Beute zu erwischen.
+        threats (list[tuple[int, int]]): Relative Positionen von '>' und
+            '=' im Sichtfeld.
+
+    Returns:
+        list[tuple[int, int]]: Moves mit positivem Erwartungswert, der
+        beste zuerst.
+    """
+
+    if not moves:
+        return []
+    if grid.BACKEND == "numpy":
+        return _rank_numpy(moves, own_energy, victim_energy, hit_rate, threats)
+
+    scored = []
+    for index, move in enumerate(moves):
+        value = kill_value(move, own_energy, victim_energy, hit_rate, threats)
+        if value > 0:
+            scored.append((-value, index))
+
+    # Index als zweiter Schlüssel = stabile Sortierung
+    scored.sort()
+    return [moves[index] for _, index in scored]
+
+
+def _load_numpy_costs():
+    global _numpy_costs
+
+    import numpy as np
+
+    if _numpy_costs is None:
+        size = 2 * MOVE_RANGE + 1
+        _numpy_costs = np.zeros((size, size))
+        for (mx, my), cost in MOVE_COSTS.items():
+            _numpy_costs[mx + MOVE_RANGE, my + MOVE_RANGE] = cost
+    return _numpy_costs
+
+
+def _rank_numpy(
+    moves: list,
+    own_energy: float,
+    victim_energy: float,
+    hit_rate: float,
+    threats: list,
+) -> list:
+    import numpy as np
+
+    costs = _load_numpy_costs()
+    candidates = np.array(moves, dtype=np.int64)
+    move_costs = costs[
+        candidates[:, 0] + MOVE_RANGE, candidates[:, 1] + MOVE_RANGE
+    ]
+
+    # Bedrohungen pro Zielfeld: Chebyshev-Matrix (Kandidaten x Bedrohungen)
+    if threats:
+        offsets = candidates[:, None, :] - np.array(threats, dtype=np.int64)
+        counts = (np.abs(offsets).max(axis=2) <= THREAT_RANGE).sum(axis=1)
+    else:
+        counts = np.zeros(len(moves), dtype=np.int64)
+    risk = np.minimum(1.0, counts * KILL_THREAT_RISK)
+
+    values = hit_rate * victim_energy - move_costs - risk * own_energy
+    order = np.argsort(-values, kind="stable")
+    return [moves[index] for index in order if values[index] > 0]
@@ -0,0 +1,354 @@
+"""
+Dieses Modul stellt eine leichtgewichtige Latenz-Messung für die einzelnen
+Stufen von `decide_action()` und `control_cmd()` bereit.
+
+Jede Stufe (z. B. chase_food, escape, merge, log_beast) wird mit
+`time.perf_counter_ns()` gemessen und in ein Histogramm mit festen,
+logarithmisch-linearen Buckets (HDR-Stil) eingetragen. Pro Zweierpotenz
+gibt es SUB_BUCKETS Buckets, der relative Fehler einer Perzentil-Angabe
+liegt damit unter 1 / SUB_BUCKETS.
+
+Ist die Messung deaktiviert (Standard), liefert `start_clock()` None und
+die Aufrufer überspringen jede Messung mit einer einzigen if-Abfrage.
+Die Histogramme werden alle `dump_every` Züge und beim Shutdown als JSON
+geschrieben.
+"""
+
+import json
+import os
+import time
+
+from . import utils
+
+# Anzahl Sub-Buckets pro Zweierpotenz (als Bit-Anzahl)
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Größter messbarer Wert in ns (~18 Minuten), größere Werte werden gekappt
+MAX_VALUE_NS = (1 << 40) - 1
+
+LATENCY_ENABLED = False
+
+# Histogramme pro Stufe
+HISTOGRAMS = {}
+
+_dump_file = None
+_dump_every = 1000
+_turns_since_dump = 0
+
+
+def bucket_index(value: int) -> int:
+    """
+    Zusammenfassung der Funktion: Bestimmt den Bucket-Index eines Messwerts.
+
+    Werte unter 2 * SUB_BUCKETS bekommen einen eigenen Bucket, darüber
+    werden pro Zweierpotenz SUB_BUCKETS gleich breite Buckets gebildet.
+
+    Args:
+        value (int): Messwert in Nanosekunden.
+
+    Returns:
+        int: Index des Buckets.
+    """
+
+    if value < 2 * SUB_BUCKETS:
+        return max(0, value)
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index: int) -> tuple:
+    """
+    Zusammenfassung der Funktion: Liefert die Grenzen eines Buckets.
+
+    Args:
+        index (int): Index des Buckets.
+
+    Returns:
+        tuple[int, int]: Kleinster und größter Wert des Buckets in ns.
+    """
+
+    if index < 2 * SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+BUCKET_COUNT = bucket_index(MAX_VALUE_NS) + 1
+
+
+class LatencyHistogram:
+    """
+    Zusammenfassung der Klasse: Histogramm mit festen Buckets für
+    Latenzen in Nanosekunden.
+
+    Der Speicherbedarf ist unabhängig von der Anzahl der Messungen
+    (BUCKET_COUNT Zähler), das Eintragen ist O(1).
+    """
+
+    def __init__(self):
+        self._counts = [0] * BUCKET_COUNT
+        self._count = 0
+        self._total = 0
+        self._min = None
+        self._max = 0
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_total(self) -> int:
+        return self._total
+
+    def get_mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    def get_min(self) -> int:
+        return self._min or 0
+
+    def get_max(self) -> int:
+        return self._max
+
+    def record(self, value: int) -> None:
+        """
+        Zusammenfassung der Funktion: Trägt einen Messwert ein.
+
+        Args:
+            value (int): Dauer in Nanosekunden.
+
+        Returns:
+            None
+        """
+
+        value = min(value, MAX_VALUE_NS)
+        self._counts[bucket_index(value)] += 1
+        self._count += 1
+        self._total += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, q: float) -> int:
+        """
+        Zusammenfassung der Funktion: Schätzt ein Perzentil aus den Buckets.
+
+        Geliefert wird die Obergrenze des Buckets, in dem das Perzentil
+        liegt (höchstens das gemessene Maximum).
+
+        Args:
+            q (float): Perzentil zwischen 0 und 100.
+
+        Returns:
+            int: Geschätzter Wert in Nanosekunden, 0 ohne Messungen.
+        """
+
+        if self._count == 0:
+            return 0
+        rank = max(1, round(q / 100 * self._count))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_bounds(index)[1], self._max)
+        return self._max
+
+    def count_at_most(self, value: int) -> int:
+        """
+        Zusammenfassung der Funktion: Zählt die Messungen, deren Bucket
+        vollständig unterhalb von `value` liegt (für kumulative
+        Prometheus-Buckets).
+
+        Args:
+            value (int): Grenze in Nanosekunden.
+
+        Returns:
+            int: Anzahl Messungen <= value (auf Bucket-Genauigkeit).
+        """
+
+        if value >= MAX_VALUE_NS:
+            return self._count
+        last = bucket_index(value + 1)
+        return sum(self._counts[:last])
+
+    def summary(self) -> dict:
+        """
+        Zusammenfassung der Funktion: Fasst das Histogramm in Mikrosekunden
+        zusammen.
+
+        Returns:
+            dict: count, mean, min, p50, p90, p99, p999 und max in µs sowie
+            die belegten Buckets als {Untergrenze in ns: Anzahl}.
+        """
+
+        return {
+            "count": self._count,
+            "mean_us": self.get_mean() / 1000,
+            "min_us": self.get_min() / 1000,
+            "p50_us": self.percentile(50) / 1000,
+            "p90_us": self.percentile(90) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "p999_us": self.percentile(99.9) / 1000,
+            "max_us": self._max / 1000,
+            "buckets": {
+                bucket_bounds(index)[0]: count
+                for index, count in enumerate(self._counts)
+                if count
+            },
+        }
+
+
+class StageClock:
+    """
+    Zusammenfassung der Klasse: Misst aufeinanderfolgende Stufen eines
+    Ablaufs. Jeder Aufruf von lap() trägt die Zeit seit dem letzten lap()
+    (bzw. seit dem Start) in das Histogramm der Stufe ein.
+    """
+
+    __slots__ = ("_start", "_last")
+
+    def __init__(self):
+        self._start = self._last = time.perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter_ns()
+        record(stage, now - self._last)
+        self._last = now
+
+    def skip(self) -> None:
+        """Setzt den Stufenbeginn neu, ohne etwas einzutragen."""
+        self._last = time.perf_counter_ns()
+
+    def total(self, stage: str) -> None:
+        """Trägt die Gesamtzeit seit dem Start unter `stage` ein."""
+        record(stage, time.perf_counter_ns() - self._start)
+
+
+def start_clock() -> StageClock | None:
+    """
+    Zusammenfassung der Funktion: Startet eine Stufen-Messung.
+
+    Returns:
+        StageClock | None: Neue Uhr oder None, wenn die Messung deaktiviert
+        ist. Aufrufer prüfen nur `if clock:` und haben so im deaktivierten
+        Zustand keine weiteren Kosten.
+    """
+
+    if not LATENCY_ENABLED:
+        return None
+    return StageClock()
+
+
+def record(stage: str, value: int) -> None:
+    histogram = HISTOGRAMS.get(stage)
+    if histogram is None:
+        histogram = HISTOGRAMS[stage] = LatencyHistogram()
+    histogram.record(value)
+
+
+def latency_summary() -> dict:
+    return {
+        stage: histogram.summary()
+        for stage, histogram in sorted(HISTOGRAMS.items())
+    }
+
+
+def format_latency_table() -> str:
+    """
+    Zusammenfassung der Funktion: Formatiert die Histogramme als Tabelle
+    (eine Zeile pro Stufe, Werte in µs).
+
+    Returns:
+        str: Tabelle als mehrzeiliger String.
+    """
+
+    lines = ["stage | count | mean | p50 | p99 | max"]
+    for stage, s in latency_summary().items():
+        lines.append(
+            f"{stage} | {s['count']} | {s['mean_us']:.1f} | "
+            f"{s['p50_us']:.1f} | {s['p99_us']:.1f} | {s['max_us']:.1f}"
+        )
+    return "\n".join(lines)
+
+
+def dump_latency(path: str | None = None) -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt die Zusammenfassung aller
+    Histogramme als JSON.
+
+    Die Datei wird zuerst temporär geschrieben und dann ersetzt, damit
+    ein Abbruch keine halbe Datei hinterlässt.
+
+    Args:
+        path (str | None): Zielpfad, None = Pfad aus enable_latency().
+
+    Returns:
+        None
+    """
+
+    path = path or _dump_file
+    if path is None:
+        return
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(latency_summary(), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def maybe_dump_latency() -> None:
+    """
+    Zusammenfassung der Funktion: Zählt einen Zug und schreibt die
+    Histogramme, wenn seit dem letzten Schreiben `dump_every` Züge
+    vergangen sind.
+
+    Returns:
+        None
+    """
+
+    global _turns_since_dump
+
+    _turns_since_dump += 1
+    if _turns_since_dump >= _dump_every:
+        _turns_since_dump = 0
+        dump_latency()
+
+
+def enable_latency(dump_file: str | None = None, dump_every: int = 1000):
+    """
+    Zusammenfassung der Funktion: Aktiviert die Latenz-Messung.
+
+    Die Histogramme werden alle `dump_every` Züge und beim Shutdown (über
+    utils.register_shutdown_hook) in `dump_file` geschrieben.
+
+    Args:
+        dump_file (str | None): Pfad der JSON-Datei, None = nicht schreiben.
+        dump_every (int): Anzahl Züge zwischen zwei Dumps.
+
+    Returns:
+        None
+    """
+
+    global LATENCY_ENABLED, _dump_file, _dump_every
+
+    LATENCY_ENABLED = True
+    _dump_file = dump_file
+    _dump_every = max(1, dump_every)
+    utils.register_shutdown_hook(dump_latency)
+
+
+def disable_latency() -> None:
+    """
+    Zusammenfassung der Funktion: Deaktiviert die Messung und verwirft alle
+    Histogramme.
+
+    Returns:
+        None
+    """
+
+    global LATENCY_ENABLED, _dump_file, _turns_since_dump
+
+    LATENCY_ENABLED = False
+    _dump_file = None
+    _turns_since_dump = 0
+    HISTOGRAMS.clear()
+    utils.unregister_shutdown_hook(dump_latency)
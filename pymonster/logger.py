@@ -1,14 +1,70 @@
+import atexit
+import bisect
 import os
+from collections import deque
 from datetime import datetime
 import json
 import gzip
 import shutil  # für "alte Datei in Ordner schieben"
+import zlib
 
-game_round = 0
+from . import utils
+
+# Aktuelle Runde pro Sitzung (None = Einzel-Client) für log_server()
+_game_rounds = {}
 
 LOG_FOLDER = "logs"
 ARCHIVE_FOLDER = os.path.join(LOG_FOLDER, "archive")
 CHUNK_SIZE = 20000  # nach 20k Runden neue Datei
+LOGGING_ENABLED = True  # False z. B. im Offline-Simulator
+
+# Runden pro gzip-Member in den Beast-Logs (CHUNK_SIZE muss ein
+# Vielfaches sein, damit ein Member nie über zwei Chunks geht)
+MEMBER_ROUNDS = 100
+
+# Endung der Index-Datei neben jeder Beast-Log-Datei
+INDEX_SUFFIX = ".idx"
+
+# gzip-Header beim Dekomprimieren erkennen (wbits = 16 + MAX_WBITS)
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# Noch nicht geschriebene Beast-Einträge: (Sitzung, bid) -> [Datei, Block,
+# Zeilen, erste Runde, letzte Runde]
+_pending_members = {}
+
+# Stufen des Beast-Loggings
+LOG_MODES = ("full", "summary", "sampled")
+LOG_MODE = "full"
+
+# Felder im Modus "summary" (Skalare und gewählter Zug)
+SUMMARY_FIELDS = (
+    "abs_r",
+    "rel_r",
+    "bid",
+    "cmd",
+    "e",
+    "move",
+    "abs_x",
+    "abs_y",
+    "pf",
+    "ph",
+    "pk",
+    "pe",
+    "pen",
+)
+
+# Modus "sampled": jede SAMPLE_EVERY-te Runde und SAMPLE_BEAST_PERCENT %
+# der Beasts (fest per Hash der ID) werden vollständig geloggt
+SAMPLE_EVERY = 10
+SAMPLE_BEAST_PERCENT = 0
+
+# Runden, die vor einem Tod vollständig nachgeschrieben werden (nur in
+# den Modi "summary" und "sampled")
+ANOMALY_ROUNDS = 20
+
+# Letzte Einträge pro Beast, noch nicht nach Stufe gefiltert:
+# (Sitzung, bid) -> deque
+_recent_rounds = {}
 
 """
 Dieses Modul kümmert sich um das Logging für Server- und Beast-Ereignisse.
@@ -17,6 +73,27 @@ Es bietet Funktionen, um Servermeldungen sowie Zustände der Beasts in komprimie
 .ndjson.gz-Dateien zu schreiben. Beast-Logs werden in Chunks aufgeteilt und bei
 Bedarf automatisch in ein Archiv verschoben, um die Log-Dateien übersichtlich und
 handhabbar zu halten.
+
+Beast-Einträge werden pro Beast gesammelt und alle MEMBER_ROUNDS Runden als
+ein gzip-Member geschrieben. Zu jeder Log-Datei gehört eine Index-Datei
+(`<datei>.idx`, eine JSON-Zeile pro Member mit erster/letzter Runde,
+Byte-Offset und Länge). `read_beast_rounds()` springt damit direkt zum
+ersten benötigten Member, statt die Datei von vorne zu dekomprimieren.
+
+Über `set_log_mode()` lässt sich die Menge der Beast-Einträge begrenzen:
+- "full": jeder Eintrag mit allen Feldern (Standard).
+- "summary": nur SUMMARY_FIELDS (ohne Umgebung und Listen).
+- "sampled": nur jede SAMPLE_EVERY-te Runde und SAMPLE_BEAST_PERCENT %
+  der Beasts, diese vollständig.
+In den Modi "summary" und "sampled" werden die letzten ANOMALY_ROUNDS
+Einträge jedes Beasts in einem Ringpuffer zurückgehalten und erst beim
+Herausfallen nach Stufe gefiltert. Stirbt ein Beast, werden sie
+vollständig (mit "anomaly": true) geschrieben, die Runden vor einem Tod
+sind also immer komplett im Log.
+
+Läuft der Aufruf in einer Sitzung des Multi-Account-Runners
+(`utils.session_scope`), schreibt das Modul nach `LOG_FOLDER/<Sitzung>/`
+(Archiv entsprechend in `LOG_FOLDER/<Sitzung>/archive/`).
 """
 
 
@@ -40,6 +117,26 @@ def ensure_dir(path):
         os.makedirs(path)
 
 
+def get_log_folder() -> str:
+    """
+    Zusammenfassung der Funktion: Liefert den Log-Ordner der aktuellen
+    Sitzung.
+
+    Returns:
+        str: LOG_FOLDER bzw. LOG_FOLDER/<Sitzung>.
+    """
+
+    session = utils.get_session_name()
+    return LOG_FOLDER if session is None else os.path.join(LOG_FOLDER, session)
+
+
+def get_archive_folder() -> str:
+    session = utils.get_session_name()
+    if session is None:
+        return ARCHIVE_FOLDER
+    return os.path.join(get_log_folder(), "archive")
+
+
 def get_beast_log_file(bid, abs_r):
     """
     Zusammenfassung der Funktion: Bestimmt die Log-Datei (mit Chunking) für
@@ -47,7 +144,8 @@ def get_beast_log_file(bid, abs_r):
 
     Die Runden werden in Blöcke der Länge CHUNK_SIZE aufgeteilt. Für jede
     Kombination aus Beast-ID und Chunk-Index wird eine eigene komprimierte
-    .ndjson.gz-Datei im LOG_FOLDER angelegt bzw. verwendet.
+    .ndjson.gz-Datei im Log-Ordner der Sitzung (get_log_folder())
+    angelegt bzw. verwendet.
 
     Args:
         bid: Kennung des Beasts (z.B. int oder str), die im Dateinamen
@@ -61,11 +159,12 @@ def get_beast_log_file(bid, abs_r):
             - int: Berechneter Chunk-Index (0, 1, 2, ...).
     """
 
-    ensure_dir(LOG_FOLDER)
+    log_folder = get_log_folder()
+    ensure_dir(log_folder)
 
     chunk_index = abs_r // CHUNK_SIZE  # 0,1,2,...
     filename = f"beast-{bid}_c{chunk_index:04d}.ndjson.gz"
-    file_path = os.path.join(LOG_FOLDER, filename)
+    file_path = os.path.join(log_folder, filename)
     return file_path, chunk_index
 
 
@@ -75,8 +174,8 @@ def archive_previous_chunk_if_exists(bid, chunk_index):
     Beasts (falls vorhanden) ins Archiv.
 
     Für den aktuellen Chunk-Index wird geprüft, ob es eine Datei für den
-    vorherigen Index (chunk_index - 1) im LOG_FOLDER gibt. Wenn ja, wird sie
-    in den ARCHIVE_FOLDER verschoben, sofern sie dort noch nicht existiert.
+    vorherigen Index (chunk_index - 1) im Log-Ordner gibt. Wenn ja, wird sie
+    ins Archiv verschoben, sofern sie dort noch nicht existiert.
 
     Args:
         bid: Kennung des Beasts, um den Dateinamen der vorherigen Log-Datei
@@ -92,14 +191,20 @@ def archive_previous_chunk_if_exists(bid, chunk_index):
         return  # kein vorheriger Chunk
 
     prev_filename = f"beast-{bid}_c{chunk_index - 1:04d}.ndjson.gz"
-    prev_path = os.path.join(LOG_FOLDER, prev_filename)
+    prev_path = os.path.join(get_log_folder(), prev_filename)
 
     if os.path.exists(prev_path):
-        ensure_dir(ARCHIVE_FOLDER)
-        target_path = os.path.join(ARCHIVE_FOLDER, prev_filename)
+        archive_folder = get_archive_folder()
+        ensure_dir(archive_folder)
+        target_path = os.path.join(archive_folder, prev_filename)
         # nur verschieben, wenn sie nicht schon im Archiv liegt
         if not os.path.exists(target_path):
             shutil.move(prev_path, target_path)
+            # Index-Datei gehört zur Log-Datei und wandert mit
+            if os.path.exists(prev_path + INDEX_SUFFIX):
+                shutil.move(
+                    prev_path + INDEX_SUFFIX, target_path + INDEX_SUFFIX
+                )
 
 
 def log_server(servermsg: str, exceptions: str, searchstring="server"):
@@ -107,9 +212,10 @@ def log_server(servermsg: str, exceptions: str, searchstring="server"):
     Zusammenfassung der Funktion: Schreibt einen Server-Logeintrag in eine
     komprimierte .ndjson.gz-Datei.
 
-    Für Servermeldungen wird pro Tag eine Log-Datei im LOG_FOLDER geführt.
+    Für Servermeldungen wird pro Tag eine Log-Datei im Log-Ordner der
+    Sitzung geführt.
     Jeder Eintrag wird als JSON-Objekt in eine gzip-komprimierte NDJSON-Datei
-    geschrieben. Zusätzlich wird die aktuelle Spielrunde (game_round) als
+    geschrieben. Zusätzlich wird die aktuelle Spielrunde der Sitzung als
     Feld abgelegt.
 
     Args:
@@ -124,15 +230,19 @@ def log_server(servermsg: str, exceptions: str, searchstring="server"):
         None
     """
 
-    ensure_dir(LOG_FOLDER)
+    if not LOGGING_ENABLED:
+        return
+
+    log_folder = get_log_folder()
+    ensure_dir(log_folder)
 
     # Eine Datei pro Tag
     timestamp = datetime.now().strftime("%Y%m%d")
     filename = f"{searchstring}_{timestamp}.ndjson.gz"
-    file_path = os.path.join(LOG_FOLDER, filename)
+    file_path = os.path.join(log_folder, filename)
 
     eintrag = {
-        "r": game_round,
+        "r": _game_rounds.get(utils.get_session_name(), 0),
         "smsg": servermsg,
         "ex": exceptions,
     }
@@ -142,17 +252,266 @@ def log_server(servermsg: str, exceptions: str, searchstring="server"):
         f.write(line)
 
 
+def write_member(file_path: str, lines: list, first_round, last_round):
+    """
+    Zusammenfassung der Funktion: Hängt Einträge als ein gzip-Member an eine
+    Log-Datei an und trägt das Member in die Index-Datei ein.
+
+    Args:
+        file_path (str): Pfad der .ndjson.gz-Datei.
+        lines (list[bytes]): NDJSON-Zeilen inkl. Zeilenumbruch.
+        first_round (int): Runde des ersten Eintrags.
+        last_round (int): Runde des letzten Eintrags.
+
+    Returns:
+        None
+    """
+
+    member = gzip.compress(b"".join(lines), compresslevel=6)
+    with open(file_path, "ab") as f:
+        f.seek(0, os.SEEK_END)
+        offset = f.tell()
+        f.write(member)
+
+    entry = {
+        "r0": first_round,
+        "r1": last_round,
+        "off": offset,
+        "len": len(member),
+        "n": len(lines),
+    }
+    with open(file_path + INDEX_SUFFIX, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def flush_beast_log(bid) -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt die gesammelten Einträge eines
+    Beasts als gzip-Member (z. B. wenn das Beast stirbt).
+
+    Args:
+        bid: ID des Beasts.
+
+    Returns:
+        None
+    """
+
+    pending = _pending_members.pop((utils.get_session_name(), bid), None)
+    if pending is None:
+        return
+    file_path, _, lines, first_round, last_round = pending
+    write_member(file_path, lines, first_round, last_round)
+
+
+def flush_beast_logs() -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt die zurückgehaltenen und
+    gesammelten Einträge aller Beasts (Shutdown-Hook und atexit).
+
+    Returns:
+        None
+    """
+
+    drain_all_recent_rounds()
+    for session, bid in list(_pending_members):
+        with utils.session_scope(session):
+            flush_beast_log(bid)
+
+
+def set_log_mode(
+    mode: str,
+    sample_every: int | None = None,
+    sample_percent: float | None = None,
+    anomaly_rounds: int | None = None,
+) -> None:
+    """
+    Zusammenfassung der Funktion: Setzt die Stufe des Beast-Loggings.
+
+    Bereits zurückgehaltene Einträge werden vorher nach der alten Stufe
+    geschrieben.
+
+    Args:
+        mode (str): "full", "summary" oder "sampled".
+        sample_every (int | None): Jede wievielte Runde im Modus "sampled"
+            vollständig geloggt wird, None = unverändert.
+        sample_percent (float | None): Anteil der vollständig geloggten
+            Beasts in Prozent, None = unverändert.
+        anomaly_rounds (int | None): Anzahl Runden vor einem Tod, die
+            vollständig geschrieben werden, None = unverändert.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Bei einem unbekannten Modus.
+    """
+
+    global LOG_MODE, SAMPLE_EVERY, SAMPLE_BEAST_PERCENT, ANOMALY_ROUNDS
+
+    if mode not in LOG_MODES:
+        raise ValueError(f"Unknown log mode: {mode}")
+    drain_all_recent_rounds()
+    LOG_MODE = mode
+    if sample_every is not None:
+        SAMPLE_EVERY = max(1, sample_every)
+    if sample_percent is not None:
+        SAMPLE_BEAST_PERCENT = sample_percent
+    if anomaly_rounds is not None:
+        ANOMALY_ROUNDS = max(0, anomaly_rounds)
+
+
+def is_sampled(fields: dict) -> bool:
+    """
+    Zusammenfassung der Funktion: Prüft, ob ein Eintrag im Modus "sampled"
+    geschrieben wird.
+
+    Die Auswahl der Beasts hängt nur von der ID ab (crc32), ein Beast wird
+    also entweder in jeder Runde oder nur in den Stichproben-Runden
+    geloggt.
+
+    Args:
+        fields (dict): Log-Felder mit abs_r und bid.
+
+    Returns:
+        bool: True, wenn der Eintrag geschrieben wird.
+    """
+
+    if fields.get("abs_r", 0) % SAMPLE_EVERY == 0:
+        return True
+    bucket = zlib.crc32(str(fields.get("bid")).encode("utf-8")) % 100
+    return bucket < SAMPLE_BEAST_PERCENT
+
+
+def write_tiered(fields: dict) -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt einen Eintrag entsprechend der
+    aktuellen Stufe (LOG_MODE).
+
+    Args:
+        fields (dict): Vollständige Log-Felder.
+
+    Returns:
+        None
+    """
+
+    if LOG_MODE == "summary":
+        write_beast_record(
+            {key: fields[key] for key in SUMMARY_FIELDS if key in fields}
+        )
+    elif LOG_MODE == "full" or is_sampled(fields):
+        write_beast_record(fields)
+
+
+def drain_recent_rounds(bid, anomaly: bool = False) -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt alle zurückgehaltenen Einträge
+    eines Beasts.
+
+    Args:
+        bid: ID des Beasts.
+        anomaly (bool): True = vollständig und mit "anomaly": true (z. B.
+            beim Tod), False = nach Stufe gefiltert (z. B. beim Shutdown).
+
+    Returns:
+        None
+    """
+
+    recent = _recent_rounds.pop((utils.get_session_name(), bid), None)
+    if not recent:
+        return
+    for fields in recent:
+        if anomaly:
+            write_beast_record(dict(fields, anomaly=True))
+        else:
+            write_tiered(fields)
+
+
+def drain_all_recent_rounds() -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt die zurückgehaltenen Einträge
+    aller Beasts aller Sitzungen nach Stufe gefiltert.
+
+    Returns:
+        None
+    """
+
+    for session, bid in list(_recent_rounds):
+        with utils.session_scope(session):
+            drain_recent_rounds(bid)
+
+
+def log_beast_death(bid) -> None:
+    """
+    Zusammenfassung der Funktion: Schreibt beim Tod eines Beasts die
+    zurückgehaltenen Runden vollständig und danach alle gesammelten
+    Einträge des Beasts.
+
+    Args:
+        bid: ID des Beasts.
+
+    Returns:
+        None
+    """
+
+    drain_recent_rounds(bid, anomaly=True)
+    flush_beast_log(bid)
+
+
+def write_beast_record(fields: dict) -> None:
+    """
+    Zusammenfassung der Funktion: Hängt einen Eintrag an den gesammelten
+    Block seines Beasts an.
+
+    Anhand der absoluten Runde (abs_r) wird die passende Log-Datei
+    bestimmt. Die Einträge eines Beasts werden gesammelt und beim Wechsel
+    in einen neuen Block von MEMBER_ROUNDS Runden als ein gzip-Member mit
+    Index-Eintrag geschrieben. Wenn mit dem aktuellen Eintrag ein neuer
+    Chunk beginnt, wird die vorherige Chunk-Datei (falls vorhanden)
+    automatisch ins Archiv verschoben.
+
+    Args:
+        fields (dict): Log-Felder, werden als JSON-Objekt geschrieben.
+
+    Returns:
+        None
+    """
+
+    bid = fields.get("bid", "unknown")
+    abs_r = fields.get("abs_r", 0)
+    block = abs_r // MEMBER_ROUNDS
+    key = (utils.get_session_name(), bid)
+
+    line = (json.dumps(fields, ensure_ascii=False) + "\n").encode("utf-8")
+
+    pending = _pending_members.get(key)
+    if pending is not None and pending[1] == block:
+        pending[2].append(line)
+        pending[4] = abs_r
+        return
+
+    # neuer Block: gesammelte Einträge schreiben
+    flush_beast_log(bid)
+
+    # richtige Datei für diese Runde bestimmen
+    file_path, chunk_index = get_beast_log_file(bid, abs_r)
+
+    # vorherigen Chunk (falls vorhanden) ins Archiv verschieben
+    archive_previous_chunk_if_exists(bid, chunk_index)
+
+    _pending_members[key] = [file_path, block, [line], abs_r, abs_r]
+
+
 def log_beast(**fields):
     """
     Zusammenfassung der Funktion: Schreibt einen Beast-Logeintrag mit
     automatischem Chunking und Archivierung.
 
     Die Funktion erwartet Log-Daten als Keyword-Argumente (z.B. bid, abs_r,
-    Energie, Position usw.). Anhand der absoluten Runde (abs_r) wird die
-    passende Log-Datei bestimmt und ein gzip-komprimierter NDJSON-Eintrag
-    geschrieben. Wenn mit dem aktuellen Eintrag ein neuer Chunk beginnt,
-    wird die vorherige Chunk-Datei (falls vorhanden) automatisch in den
-    ARCHIVE_FOLDER verschoben.
+    Energie, Position usw.). Im Modus "full" wird der Eintrag sofort mit
+    write_beast_record() übernommen. In den anderen Modi wird er zuerst im
+    Ringpuffer des Beasts zurückgehalten, nach ANOMALY_ROUNDS Runden nach
+    Stufe gefiltert geschrieben und beim Tod (log_beast_death())
+    vollständig geschrieben.
 
     Erwartete Felder (optional, aber üblich):
         - bid: ID des Beasts.
@@ -166,18 +525,183 @@ def log_beast(**fields):
         None
     """
 
-    global game_round
-    game_round = fields.get("abs_r", 0)
-    bid = fields.get("bid", "unknown")
-    abs_r = fields.get("abs_r", 0)
+    session = utils.get_session_name()
+    _game_rounds[session] = fields.get("abs_r", 0)
+    if not LOGGING_ENABLED:
+        return
 
-    # richtige Datei für diese Runde bestimmen
-    file_path, chunk_index = get_beast_log_file(bid, abs_r)
+    if LOG_MODE == "full":
+        write_beast_record(fields)
+        return
 
-    # vorherigen Chunk (falls vorhanden) ins Archiv verschieben
-    archive_previous_chunk_if_exists(bid, chunk_index)
+    key = (session, fields.get("bid", "unknown"))
+    recent = _recent_rounds.get(key)
+    if recent is None:
+        recent = _recent_rounds[key] = deque()
+    recent.append(fields)
+    if len(recent) > ANOMALY_ROUNDS:
+        write_tiered(recent.popleft())
 
-    # Eintrag schreiben
-    line = (json.dumps(fields, ensure_ascii=False) + "\n").encode("utf-8")
-    with gzip.open(file_path, "ab", compresslevel=1) as f:
-        f.write(line)
+
+def record_round(record: dict) -> int:
+    """Runde eines Beast- (abs_r) oder Server-Eintrags (r)."""
+    return int(record.get("abs_r", record.get("r", 0)) or 0)
+
+
+def iter_members(f, offset: int = 0):
+    """
+    Zusammenfassung der Funktion: Liest ab `offset` alle vollständigen
+    gzip-Member einer Datei.
+
+    Ein unvollständiges Member am Dateiende (Datei wird gerade
+    geschrieben) wird nicht geliefert.
+
+    Args:
+        f (BinaryIO): Geöffnete Datei.
+        offset (int): Byte-Offset eines Member-Anfangs.
+
+    Yields:
+        tuple[int, int, list[bytes]]: Start- und End-Offset des Members
+        sowie seine NDJSON-Zeilen.
+    """
+
+    f.seek(offset)
+    member_start = offset
+    position = offset
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    parts = []
+    data = b""
+    while True:
+        if not data:
+            data = f.read(1 << 16)
+            if not data:
+                return
+        parts.append(decompressor.decompress(data))
+        if not decompressor.eof:
+            position += len(data)
+            data = b""
+            continue
+
+        unused = decompressor.unused_data
+        position += len(data) - len(unused)
+        lines = [line for line in b"".join(parts).split(b"\n") if line]
+        yield member_start, position, lines
+
+        member_start = position
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        parts = []
+        data = unused
+
+
+def read_round_index(file_path: str) -> list:
+    """
+    Zusammenfassung der Funktion: Liest die Index-Datei einer Beast-Log-Datei.
+
+    Eine unvollständige letzte Zeile (Abbruch beim Schreiben) wird
+    ignoriert.
+
+    Args:
+        file_path (str): Pfad der .ndjson.gz-Datei (ohne .idx).
+
+    Returns:
+        list[dict]: Ein Eintrag pro Member mit r0, r1, off, len und n, leer
+        wenn keine Index-Datei existiert.
+    """
+
+    entries = []
+    try:
+        with open(file_path + INDEX_SUFFIX, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def find_beast_log_file(bid, chunk_index: int, log_folder=None):
+    """
+    Zusammenfassung der Funktion: Sucht die Log-Datei eines Chunks im
+    Log-Ordner und in dessen Archiv.
+
+    Args:
+        bid: ID des Beasts.
+        chunk_index (int): Chunk-Index.
+        log_folder (str | None): Log-Ordner, None = Log-Ordner der
+            aktuellen Sitzung.
+
+    Returns:
+        str | None: Pfad der Datei oder None.
+    """
+
+    if log_folder is None:
+        folders = (get_log_folder(), get_archive_folder())
+    else:
+        folders = (log_folder, os.path.join(log_folder, "archive"))
+    filename = f"beast-{bid}_c{chunk_index:04d}.ndjson.gz"
+    for folder in folders:
+        path = os.path.join(folder, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_beast_rounds(
+    bid, first_round: int, last_round: int, log_folder=None
+) -> list:
+    """
+    Zusammenfassung der Funktion: Liest alle Einträge eines Beasts aus dem
+    Rundenbereich [first_round, last_round].
+
+    Über die Index-Datei wird direkt zum ersten Member gesprungen, dessen
+    letzte Runde >= first_round ist. Gelesen werden nur die Member, die den
+    Bereich abdecken, der Aufwand ist also O(Bereich) statt O(Datei).
+    Member ohne Index-Eintrag (z. B. ältere Logs) werden ab dem Ende des
+    Index sequenziell gelesen. Noch nicht geschriebene Einträge werden
+    vorher mit flush_beast_log() geschrieben.
+
+    Args:
+        bid: ID des Beasts.
+        first_round (int): Erste Runde (inklusive).
+        last_round (int): Letzte Runde (inklusive).
+        log_folder (str | None): Log-Ordner, None = Log-Ordner der
+            aktuellen Sitzung.
+
+    Returns:
+        list[dict]: Einträge in Rundenreihenfolge.
+    """
+
+    flush_beast_log(bid)
+    records = []
+    for chunk_index in range(
+        first_round // CHUNK_SIZE, last_round // CHUNK_SIZE + 1
+    ):
+        file_path = find_beast_log_file(bid, chunk_index, log_folder)
+        if file_path is None:
+            continue
+
+        entries = read_round_index(file_path)
+        position = bisect.bisect_left([e["r1"] for e in entries], first_round)
+        if position < len(entries):
+            offset = entries[position]["off"]
+        elif entries:
+            offset = entries[-1]["off"] + entries[-1]["len"]
+        else:
+            offset = 0
+
+        with open(file_path, "rb") as f:
+            for _, _, lines in iter_members(f, offset):
+                for line in lines:
+                    record = json.loads(line)
+                    abs_r = record.get("abs_r", 0)
+                    if abs_r > last_round:
+                        return records
+                    if abs_r >= first_round:
+                        records.append(record)
+    return records
+
+
+utils.register_shutdown_hook(flush_beast_logs)
+atexit.register(flush_beast_logs)
@@ -9,12 +9,12 @@ behandelt.
 """
 
 import math
-from . import utils
-import numpy as np
+from . import console, grid, latency, utils
 from .utils import print_and_flush, cmd, handle_shutdown
-from .logger import log_beast
+from .logger import log_beast, log_beast_death
+from .opponents import OpponentStats
+from .strategy import get_strategy
 
-HIGH_ENERGY_THRESHOLD = 100  # für high_energy boolean in flee_advanced()
 FIELD_WIDTH = 71
 FIELD_HEIGHT = 34
 
@@ -24,6 +24,9 @@ MAX_ABS_X = MIN_ABS_X + FIELD_WIDTH - 1  # 35  -> [-35..35]
 MIN_ABS_Y = -(FIELD_HEIGHT // 2)  # -17
 MAX_ABS_Y = MIN_ABS_Y + FIELD_HEIGHT - 1  # 16  -> [-17..16]
 
+# Gegner-Statistiken (Sichtungen und Todesfälle) für die Rollenwahl
+OPPONENT_STATS = OpponentStats(FIELD_WIDTH, FIELD_HEIGHT, MIN_ABS_X, MIN_ABS_Y)
+
 
 def filter_valid_moves(arr, limit=3):
     """
@@ -42,6 +45,9 @@ def filter_valid_moves(arr, limit=3):
         numpy.ndarray: Gefiltertes 2D-Array mit gültigen Moves.
     """
 
+    # NumPy nur für das numpy-Backend laden (siehe grid.filter_moves)
+    import numpy as np
+
     if arr.size == 0:
         # Gibt das leere Array sofort zurück, wenn es leer ist.
         # print(arr)
@@ -187,7 +193,7 @@ def check_beast_collision(move, abs_x, abs_y):
 
     Der Move wird auf die aktuelle absolute Position (abs_x, abs_y)
     angewendet, anschließend über wrap_abs_coords() gewrapped und dann
-    gegen alle Einträge in utils.GLOBAL_BEAST_LIST verglichen. Falls
+    gegen alle Einträge in utils.get_beast_list() verglichen. Falls
     irgendein Beast bereits auf der Zielposition steht, liegt eine
     Kollision vor.
 
@@ -210,7 +216,7 @@ def check_beast_collision(move, abs_x, abs_y):
     new_abs_x, new_abs_y = wrap_abs_coords(new_abs_x, new_abs_y)
 
     # Prüft das das Biest nicht kollidiert
-    for beast in utils.GLOBAL_BEAST_LIST:
+    for beast in utils.get_beast_list():
         ally_abs_x = beast.get_abs_x()
         ally_abs_y = beast.get_abs_y()
         if ally_abs_x == new_abs_x and ally_abs_y == new_abs_y:
@@ -268,7 +274,8 @@ def decide_action(curr_beast):
     Zusammenfassung der Funktion: Entscheidet die nächste Aktion eines Beasts
     (MOVE oder SPLIT) und berechnet den entsprechenden Serverbefehl.
 
-    Die Funktion aktualisiert ggf. die Energie-Priorität, ruft die
+    Die Funktion aktualisiert ggf. die Energie-Priorität (ab
+    StrategyConfig.late_game_round), ruft die
     Bewegungs- und Entscheidungslogik des Beasts auf (chase_food, hunt,
     compute_kill_list, escape, split) und entscheidet dann:
       - SPLIT: wenn split() dies erlaubt, inklusive Berechnung der
@@ -277,8 +284,12 @@ def decide_action(curr_beast):
         Kill- und Escape-Moves werden Prioritäten gemischt, gültige
         Moves gefiltert und der beste Move gewählt.
 
+    Ein Kill-Move der Vorrunde wird zu Beginn über den Energie-Gewinn in
+    OPPONENT_STATS ausgewertet (Trefferquote, Beute-Energie).
+
     Am Ende werden die Runden-Counter des Beasts erhöht und relevante
-    Informationen stehen für Logging bereit.
+    Informationen stehen für Logging bereit. Ist die Latenz-Messung aktiv,
+    wird jede Stufe einzeln in latency.HISTOGRAMS eingetragen.
 
     Args:
         curr_beast: Instanz der Beast-Klasse, für die die Aktion
@@ -292,20 +303,45 @@ def decide_action(curr_beast):
             - abs_r (int): Neue absolute Rundenzahl nach der Aktion.
     """
 
+    clock = latency.start_clock()
+    strategy = get_strategy()
     abs_r = curr_beast.get_round_abs()
-    if abs_r > 100:
-        curr_beast.set_priority_energy(1.9)
+    if abs_r > strategy.late_game_round:
+        curr_beast.set_priority_energy(strategy.late_game_priority_energy)
     # Holt sich wichtig Atribute des Beasts
     bid = curr_beast.get_id()
     abs_x = curr_beast.get_abs_x()
     abs_y = curr_beast.get_abs_y()
 
+    # Gegner-Annäherungen für die Aggressions-Schätzung zählen
+    OPPONENT_STATS.record_sighting(abs_x, abs_y, curr_beast.get_environment())
+
+    # Ergebnis des letzten Kill-Moves: Energie-Änderung plus Move-Kosten
+    pending_kill = curr_beast.get_pending_kill()
+    if pending_kill is not None:
+        OPPONENT_STATS.record_kill_attempt(
+            curr_beast.get_energy_delta() + pending_kill
+        )
+        curr_beast.set_pending_kill(None)
+    if clock:
+        clock.lap("sighting")
+
     # Ruft die Module auf
     curr_beast.chase_food()
+    if clock:
+        clock.lap("chase_food")
     curr_beast.hunt()
+    if clock:
+        clock.lap("hunt")
     curr_beast.compute_kill_list()
+    if clock:
+        clock.lap("kill_list")
     curr_beast.escape()
+    if clock:
+        clock.lap("escape")
     split_pos, do_split = curr_beast.split()
+    if clock:
+        clock.lap("split")
 
     # Überprüft ob ein Split statt finden soll
     if do_split:
@@ -329,17 +365,11 @@ def decide_action(curr_beast):
         kill_list = curr_beast.get_kill_list()
         escape_list = curr_beast.get_escape_list()
 
-        # wandelt die Listen in np.arrays um
-        food_arr_temp = np.array(food_list)
-        hunt_arr_temp = np.array(hunt_list)
-        kill_arr_temp = np.array(kill_list)
-        escape_arr_temp = np.array(escape_list)
-
-        # validiert die moves
-        food_arr = filter_valid_moves(food_arr_temp)
-        hunt_arr = filter_valid_moves(hunt_arr_temp)
-        kill_arr = filter_valid_moves(kill_arr_temp)
-        escape_arr = filter_valid_moves(escape_arr_temp)
+        # validiert die moves (Liste von Tupeln oder np.array je nach Backend)
+        food_arr = grid.filter_moves(food_list)
+        hunt_arr = grid.filter_moves(hunt_list)
+        kill_arr = grid.filter_moves(kill_list)
+        escape_arr = grid.filter_moves(escape_list)
 
         # macht mehrere Dictionary mit den arrays und die prioritäten
         food_dict = array_to_dict(food_arr, curr_beast.get_priority_food())
@@ -377,6 +407,13 @@ def decide_action(curr_beast):
         curr_beast.set_abs_y(new_abs_y)
         server_command = f"{bid} {cmd.MOVE} {d_x} {d_y}"
 
+        # Kill-Moves in der nächsten Runde über den Energie-Gewinn auswerten
+        if move in kill_list:
+            curr_beast.set_pending_kill(calc_move_energy(move))
+
+    if clock:
+        clock.lap("merge")
+
     # Runden Erhöhen um 1
     curr_beast.set_round_abs(1)
     curr_beast.set_round_rel(1)
@@ -422,6 +459,10 @@ def decide_action(curr_beast):
         pen=priority_energy,
     )
 
+    if clock:
+        clock.lap("log_beast")
+        clock.total("decide_action")
+
     return server_command, (new_abs_x, new_abs_y), abs_r
 
 
@@ -434,8 +475,10 @@ async def handle_beast_gone(
     Zusammenfassung der Funktion: Behandelt den Fall, dass ein Beast stirbt
     (verhungert oder gefressen wird).
 
-    Das entsprechende Beast wird aus der GLOBAL_BEAST_LIST entfernt und
-    eine kurze Textmeldung mit ID, Energie und Umgebung wird ausgegeben.
+    Das entsprechende Beast wird aus der Beast-Liste der Sitzung
+    (utils.get_beast_list()) entfernt, der Todesfall wird mit Umgebung und
+    Bedrohungen in OPPONENT_STATS erfasst und eine kurze Textmeldung mit
+    ID, Energie und Umgebung wird ausgegeben.
 
     Args:
         beast_id (int): ID des verstorbenen Beasts.
@@ -446,13 +489,30 @@ async def handle_beast_gone(
         None
     """
 
-    for beast in utils.GLOBAL_BEAST_LIST:
+    abs_x = None
+    abs_y = None
+    abs_round = None
+    beasts = utils.get_beast_list()
+    for beast in beasts:
         beast_id_list = beast.get_id()
         if beast_id == beast_id_list:
-            utils.GLOBAL_BEAST_LIST.remove(beast)
+            abs_x = beast.get_abs_x()
+            abs_y = beast.get_abs_y()
+            abs_round = beast.get_round_abs()
+            beasts.remove(beast)
+            break
+
+    # letzte Runden des toten Beasts vollständig ins Log schreiben
+    log_beast_death(beast_id)
 
-    print_and_flush(f"beast {beast_id} with energy {energy} gone")
-    print_and_flush(f"  environment: {environment}")
+    OPPONENT_STATS.record_death(
+        beast_id, energy, environment, abs_x, abs_y, abs_round
+    )
+
+    console.info(
+        f"beast {beast_id} with energy {energy} gone", key="beast_gone"
+    )
+    console.debug(f"  environment: {environment}", key="beast_gone_env")
 
 
 async def handle_no_beasts_left() -> None:
@@ -0,0 +1,249 @@
+"""
+Dieses Modul stellt einen optionalen Metrik-Endpunkt im
+Prometheus-Textformat bereit.
+
+Der HTTP-Server läuft über `asyncio.start_server()` in derselben
+Event-Loop wie `client_loop()`. Weil die Entscheidungslogik synchron ist,
+kann ein Scrape nur laufen, während der Client ohnehin auf den Server
+wartet. Die Antwort wird aus bereits vorhandenen Zählern erzeugt
+(O(Beasts + Buckets)), ein Scrape blockiert die Zugberechnung also nie.
+
+Exportiert werden:
+- lebende Beasts, Splits, Todesfälle und Züge
+- die Energie-Verteilung der Kolonie als Histogramm
+- die Latenz-Histogramme aus `latency.HISTOGRAMS` (pro Stufe und pro
+  Servernachricht, inkl. WebSocket-Round-Trip "server_reply")
+- die Tiefe der Warteschlange des Konsolen-Loggers (console)
+- zusätzliche Gauges, die andere Module über `register_gauge()` anmelden
+"""
+
+import asyncio
+
+from . import console, latency, utils
+
+METRIC_PREFIX = "pymonster"
+
+# Maximale Wartezeit auf die Request-Zeilen eines Scrapes in Sekunden
+REQUEST_TIMEOUT = 5.0
+
+# Obergrenzen der Energie-Buckets
+ENERGY_BUCKETS = (10, 25, 50, 75, 100, 150, 200, 300, 500)
+
+# Obergrenzen der Latenz-Buckets in Sekunden
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+# Zähler, die der Controller erhöht (ohne Kosten für Scrapes)
+COUNTERS = {
+    "turns": 0,
+    "splits": 0,
+    "deaths": 0,
+}
+
+# Zusätzliche Gauges: Name -> (Hilfetext, Funktion ohne Argumente)
+GAUGES = {
+    "log_queue_depth": (
+        "Console messages waiting to be written",
+        console.WRITER.get_queue_depth,
+    ),
+    "log_dropped_total": (
+        "Console messages dropped because the queue was full",
+        console.WRITER.get_dropped,
+    ),
+}
+
+
+def inc(name: str, amount: int = 1) -> None:
+    COUNTERS[name] += amount
+
+
+def reset_counters() -> None:
+    for name in COUNTERS:
+        COUNTERS[name] = 0
+
+
+def register_gauge(name: str, help_text: str, callback) -> None:
+    """
+    Zusammenfassung der Funktion: Meldet einen zusätzlichen Gauge an, dessen
+    Wert bei jedem Scrape über `callback()` gelesen wird.
+
+    Args:
+        name (str): Metrik-Name ohne Präfix.
+        help_text (str): Beschreibung für die HELP-Zeile.
+        callback (Callable[[], float]): Liefert den aktuellen Wert.
+
+    Returns:
+        None
+    """
+
+    GAUGES[name] = (help_text, callback)
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _header(lines: list, name: str, help_text: str, kind: str) -> str:
+    full_name = f"{METRIC_PREFIX}_{name}"
+    lines.append(f"# HELP {full_name} {help_text}")
+    lines.append(f"# TYPE {full_name} {kind}")
+    return full_name
+
+
+def _render_energy(lines: list) -> None:
+    energies = [beast.get_energy() for beast in utils.get_all_beasts()]
+    name = _header(
+        lines, "beast_energy", "Energy distribution of own beasts", "histogram"
+    )
+    for bound in ENERGY_BUCKETS:
+        count = sum(1 for energy in energies if energy <= bound)
+        lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+    lines.append(f'{name}_bucket{{le="+Inf"}} {len(energies)}')
+    lines.append(f"{name}_sum {_format_value(float(sum(energies)))}")
+    lines.append(f"{name}_count {len(energies)}")
+
+
+def _render_latency(lines: list) -> None:
+    if not latency.HISTOGRAMS:
+        return
+    name = _header(
+        lines,
+        "stage_latency_seconds",
+        "Latency per decision stage and server message",
+        "histogram",
+    )
+    for stage, histogram in sorted(latency.HISTOGRAMS.items()):
+        for bound in LATENCY_BUCKETS:
+            count = histogram.count_at_most(int(bound * 1e9))
+            lines.append(
+                f'{name}_bucket{{stage="{stage}",le="{bound}"}} {count}'
+            )
+        lines.append(
+            f'{name}_bucket{{stage="{stage}",le="+Inf"}} '
+            f"{histogram.get_count()}"
+        )
+        lines.append(
+            f'{name}_sum{{stage="{stage}"}} {histogram.get_total() / 1e9}'
+        )
+        lines.append(
+            f'{name}_count{{stage="{stage}"}} {histogram.get_count()}'
+        )
+
+
+def render_metrics() -> str:
+    """
+    Zusammenfassung der Funktion: Erzeugt alle Metriken im
+    Prometheus-Textformat (Version 0.0.4).
+
+    Returns:
+        str: Metriken, eine Zeile pro Wert, mit abschließendem Zeilenumbruch.
+    """
+
+    lines = []
+    name = _header(lines, "beasts_alive", "Number of own beasts", "gauge")
+    lines.append(f"{name} {len(utils.get_all_beasts())}")
+
+    for counter, help_text in (
+        ("turns", "Beast commands answered"),
+        ("splits", "Successful splits"),
+        ("deaths", "Own beasts that died"),
+    ):
+        name = _header(lines, f"{counter}_total", help_text, "counter")
+        lines.append(f"{name} {COUNTERS[counter]}")
+
+    _render_energy(lines)
+
+    for gauge, (help_text, callback) in sorted(GAUGES.items()):
+        name = _header(lines, gauge, help_text, "gauge")
+        lines.append(f"{name} {_format_value(callback())}")
+
+    _render_latency(lines)
+    return "\n".join(lines) + "\n"
+
+
+async def handle_scrape(reader, writer) -> None:
+    """
+    Zusammenfassung der Funktion: Beantwortet eine HTTP-Anfrage.
+
+    GET /metrics liefert die Metriken, alle anderen Pfade 404. Die Antwort
+    wird vollständig synchron erzeugt, bevor geschrieben wird, damit sie
+    einen konsistenten Stand der Kolonie zeigt.
+
+    Args:
+        reader (asyncio.StreamReader): Eingehender Datenstrom.
+        writer (asyncio.StreamWriter): Ausgehender Datenstrom.
+
+    Returns:
+        None
+    """
+
+    try:
+        request_line = await asyncio.wait_for(
+            reader.readline(), REQUEST_TIMEOUT
+        )
+        # Header lesen und verwerfen
+        while True:
+            line = await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT)
+            if line in (b"\r\n", b"\n", b""):
+                break
+
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+            status = "200 OK"
+            body = render_metrics().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            status = "404 Not Found"
+            body = b"not found\n"
+            content_type = "text/plain; charset=utf-8"
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(host: str = "127.0.0.1", port: int = 9722):
+    """
+    Zusammenfassung der Funktion: Startet den Metrik-Server in der laufenden
+    Event-Loop und aktiviert die Latenz-Messung.
+
+    Args:
+        host (str): Adresse, an die der Server gebunden wird.
+        port (int): TCP-Port (0 = freien Port wählen).
+
+    Returns:
+        asyncio.Server: Der laufende Server (mit close() beenden).
+    """
+
+    if not latency.LATENCY_ENABLED:
+        latency.enable_latency()
+    return await asyncio.start_server(handle_scrape, host, port)
@@ -0,0 +1,386 @@
+"""
+Dieses Modul sammelt Statistiken über gegnerische Beasts (Opponent Modelling).
+
+Es wertet die Sichtfelder unserer Beasts (Sichtungen von '>' und '=') sowie
+die BEAST_GONE_INFO-Nachrichten des Servers aus. Daraus werden pro Region
+des Spielfelds Aggressions-Schätzungen gebildet, die z. B. bei der
+Rollenwahl neuer Beasts berücksichtigt werden können. Nebenbei wird pro
+Region gezählt, wie viel Futter ('*') die Sichtfelder zeigen
+(Futterdichte, z. B. für die Energie-Prognose in `forecast.py`).
+
+Der Speicherbedarf ist fest begrenzt: Zähler existieren nur pro Region
+(feste Anzahl) und Todesfälle werden in einem Ringpuffer mit fester Länge
+abgelegt. Dadurch bleibt der Speicher auch über 20k+ Runden konstant.
+"""
+
+from collections import deque
+
+# Aufteilung des Spielfelds in Regionen (Spalten x Zeilen)
+REGION_COLS = 4
+REGION_ROWS = 2
+
+# Anzahl der Todesfälle, die im Ringpuffer gehalten werden
+DEATH_HISTORY_SIZE = 64
+
+# Ab dieser Anzahl Sichtungen werden die Zähler einer Region halbiert,
+# damit die Schätzung aktuell bleibt und die Zahlen nicht beliebig wachsen
+REGION_DECAY_LIMIT = 10000
+
+# Prior für die Aggressions-Schätzung: zieht die Schätzung bei wenig Daten
+# Richtung 0 (verhindert Ausreißer nach den ersten Sichtungen)
+AGGRESSION_PRIOR_VIEWS = 10.0
+
+# Schätzung der Beute bei Kills: Glättungsfaktor der Energie-Gewinne,
+# Mindestgewinn für einen Treffer und Prior (Treffer / Versuche)
+KILL_GAIN_ALPHA = 0.2
+KILL_GAIN_MIN = 5.0
+KILL_PRIOR_HITS = 1.0
+KILL_PRIOR_ATTEMPTS = 2.0
+
+# Ohne beobachtete Kills: Beute hat diesen Anteil unserer Energie ('<' ist
+# schwächer als wir, im Mittel also etwa die Hälfte)
+VICTIM_ENERGY_PRIOR = 0.5
+
+THREAT_SYMBOLS = (">", "=")
+FOOD_SYMBOL = "*"
+
+# Zellen eines Sichtfeldes ohne das Beast selbst
+VIEW_CELLS = 48
+
+# Indizes des 7x7-Strings, die im 5x5-Bereich um die Mitte liegen (ohne Mitte)
+THREAT_ZONE_INDICES = tuple(
+    y * 7 + x
+    for y in range(1, 6)
+    for x in range(1, 6)
+    if not (x == 3 and y == 3)
+)
+
+
+class OpponentStats:
+    """
+    Zusammenfassung der Klasse: Sammelt begrenzte Statistiken über Gegner
+    und leitet daraus Aggressions-Schätzungen pro Spielfeld-Region ab.
+
+    Pro Region werden die Anzahl der Sichtungen (eigene Beast-Runden in
+    dieser Region) und die Anzahl der Annäherungen stärkerer Gegner ('>'
+    oder '=' im 5x5-Bereich) gezählt. Zusätzlich werden die letzten
+    Todesfälle mit Environment und Bedrohungen in einem Ringpuffer
+    gespeichert.
+    """
+
+    def __init__(
+        self,
+        field_width: int,
+        field_height: int,
+        min_abs_x: int,
+        min_abs_y: int,
+        region_cols: int = REGION_COLS,
+        region_rows: int = REGION_ROWS,
+        history_size: int = DEATH_HISTORY_SIZE,
+    ):
+        """
+        Zusammenfassung der Funktion: Initialisiert die Zähler und den
+        Ringpuffer für Todesfälle.
+
+        Args:
+            field_width (int): Breite des Spielfelds.
+            field_height (int): Höhe des Spielfelds.
+            min_abs_x (int): Kleinste absolute X-Koordinate.
+            min_abs_y (int): Kleinste absolute Y-Koordinate.
+            region_cols (int): Anzahl der Regionen in X-Richtung.
+            region_rows (int): Anzahl der Regionen in Y-Richtung.
+            history_size (int): Länge des Ringpuffers für Todesfälle.
+        """
+
+        self._field_width = field_width
+        self._field_height = field_height
+        self._min_abs_x = min_abs_x
+        self._min_abs_y = min_abs_y
+        self._region_cols = region_cols
+        self._region_rows = region_rows
+
+        region_count = region_cols * region_rows
+        self._views = [0] * region_count
+        self._approaches = [0] * region_count
+        self._food_cells = [0] * region_count
+        self._deaths_per_region = [0] * region_count
+
+        self._deaths = deque(maxlen=history_size)
+        self._death_causes = {"eaten": 0, "starved": 0, "unknown": 0}
+
+        self._kill_attempts = 0
+        self._kill_hits = 0
+        self._victim_energy = 0.0
+
+    def region_of(self, abs_x: int, abs_y: int) -> int:
+        """
+        Zusammenfassung der Funktion: Bestimmt den Regions-Index einer
+        absoluten Spielfeldkoordinate.
+
+        Args:
+            abs_x (int): Absolute X-Koordinate.
+            abs_y (int): Absolute Y-Koordinate.
+
+        Returns:
+            int: Index der Region (0 .. region_cols * region_rows - 1).
+        """
+
+        col = (
+            ((abs_x - self._min_abs_x) % self._field_width)
+            * (self._region_cols)
+            // self._field_width
+        )
+        row = (
+            ((abs_y - self._min_abs_y) % self._field_height)
+            * (self._region_rows)
+            // self._field_height
+        )
+        return row * self._region_cols + col
+
+    def record_sighting(self, abs_x: int, abs_y: int, environment: str) -> int:
+        """
+        Zusammenfassung der Funktion: Wertet ein Sichtfeld aus und zählt
+        Annäherungen stärkerer Gegner in der zugehörigen Region.
+
+        Als Annäherung zählt jedes '>' oder '=' im 5x5-Bereich um das Beast,
+        also ein Gegner, der uns in der nächsten Runde erreichen könnte.
+        Zusätzlich wird das Futter im ganzen Sichtfeld gezählt.
+
+        Args:
+            abs_x (int): Absolute X-Position des Beasts beim Sichtfeld.
+            abs_y (int): Absolute Y-Position des Beasts beim Sichtfeld.
+            environment (str): Sichtfeld als 49-Zeichen-String.
+
+        Returns:
+            int: Anzahl der Annäherungen in diesem Sichtfeld.
+        """
+
+        approaches = 0
+        food = 0
+        if len(environment) == 49:
+            for idx in THREAT_ZONE_INDICES:
+                if environment[idx] in THREAT_SYMBOLS:
+                    approaches += 1
+            food = environment.count(FOOD_SYMBOL)
+
+        region = self.region_of(abs_x, abs_y)
+        self._views[region] += 1
+        self._approaches[region] += approaches
+        self._food_cells[region] += food
+
+        # Zähler halbieren, damit sie begrenzt bleiben und neuere Daten zählen
+        if self._views[region] >= REGION_DECAY_LIMIT:
+            self._views[region] //= 2
+            self._approaches[region] //= 2
+            self._food_cells[region] //= 2
+
+        return approaches
+
+    def record_death(
+        self,
+        beast_id: int,
+        energy: float,
+        environment: str,
+        abs_x: int | None = None,
+        abs_y: int | None = None,
+        abs_round: int | None = None,
+    ) -> dict:
+        """
+        Zusammenfassung der Funktion: Speichert einen Todesfall mit letztem
+        Environment und den Bedrohungen in der Nähe des Beasts.
+
+        Die Todesursache wird grob geschätzt: Bei (fast) keiner Restenergie
+        gilt das Beast als verhungert, ist ein stärkerer Gegner im 5x5-Bereich
+        sichtbar, gilt es als gefressen.
+
+        Args:
+            beast_id (int): ID des verstorbenen Beasts.
+            energy (float): Restenergie beim Tod.
+            environment (str): Letztes Sichtfeld als 49-Zeichen-String.
+            abs_x (int | None): Letzte bekannte absolute X-Position.
+            abs_y (int | None): Letzte bekannte absolute Y-Position.
+            abs_round (int | None): Letzte bekannte absolute Runde.
+
+        Returns:
+            dict: Der gespeicherte Eintrag des Todesfalls.
+        """
+
+        threats = []
+        if len(environment) == 49:
+            for idx, symbol in enumerate(environment):
+                if symbol in THREAT_SYMBOLS:
+                    threats.append((idx % 7 - 3, idx // 7 - 3))
+
+        near_threats = [
+            (dx, dy) for dx, dy in threats if max(abs(dx), abs(dy)) <= 2
+        ]
+
+        if energy <= 1.0:
+            cause = "starved"
+        elif near_threats:
+            cause = "eaten"
+        else:
+            cause = "unknown"
+        self._death_causes[cause] += 1
+
+        if abs_x is not None and abs_y is not None:
+            self._deaths_per_region[self.region_of(abs_x, abs_y)] += 1
+
+        entry = {
+            "bid": beast_id,
+            "e": energy,
+            "env": environment,
+            "threats": threats,
+            "near": near_threats,
+            "cause": cause,
+            "abs_x": abs_x,
+            "abs_y": abs_y,
+            "abs_r": abs_round,
+        }
+        self._deaths.append(entry)
+        return entry
+
+    def aggression_at(self, abs_x: int, abs_y: int) -> float:
+        """
+        Zusammenfassung der Funktion: Liefert die geschätzte Aggression der
+        Gegner in der Region einer Koordinate.
+
+        Die Schätzung ist die (mit einem Prior Richtung 0 geglättete)
+        durchschnittliche Anzahl an Annäherungen stärkerer Gegner pro Sichtung.
+
+        Args:
+            abs_x (int): Absolute X-Koordinate.
+            abs_y (int): Absolute Y-Koordinate.
+
+        Returns:
+            float: Aggressions-Schätzung (0.0 = keine Annäherungen).
+        """
+
+        return self.region_aggression(self.region_of(abs_x, abs_y))
+
+    def region_aggression(self, region: int) -> float:
+        """
+        Zusammenfassung der Funktion: Liefert die Aggressions-Schätzung einer
+        Region anhand ihres Index.
+
+        Args:
+            region (int): Regions-Index.
+
+        Returns:
+            float: Aggressions-Schätzung der Region.
+        """
+
+        return self._approaches[region] / (
+            self._views[region] + AGGRESSION_PRIOR_VIEWS
+        )
+
+    def food_density_at(self, abs_x: int, abs_y: int) -> float:
+        """
+        Zusammenfassung der Funktion: Liefert die geschätzte Futterdichte
+        (Anteil der Futterfelder) in der Region einer Koordinate.
+
+        Wie bei der Aggression zieht ein Prior von AGGRESSION_PRIOR_VIEWS
+        Sichtungen die Schätzung bei wenig Daten Richtung 0.
+
+        Args:
+            abs_x (int): Absolute X-Koordinate.
+            abs_y (int): Absolute Y-Koordinate.
+
+        Returns:
+            float: Futterfelder pro Sichtfeld-Zelle (0.0 bis 1.0).
+        """
+
+        region = self.region_of(abs_x, abs_y)
+        return self._food_cells[region] / (
+            (self._views[region] + AGGRESSION_PRIOR_VIEWS) * VIEW_CELLS
+        )
+
+    def record_kill_attempt(self, gain: float) -> bool:
+        """
+        Zusammenfassung der Funktion: Wertet einen Kill-Move anhand des
+        Energie-Gewinns aus, den das Beast in der Folgerunde gemeldet hat.
+
+        Ab KILL_GAIN_MIN gilt der Versuch als Treffer und der Gewinn fließt
+        in die geglättete Schätzung der Beute-Energie ein.
+
+        Args:
+            gain (float): Energie-Änderung plus Kosten des Kill-Moves.
+
+        Returns:
+            bool: True, wenn der Versuch als Treffer gezählt wurde.
+        """
+
+        self._kill_attempts += 1
+        if gain < KILL_GAIN_MIN:
+            return False
+        if self._kill_hits == 0:
+            self._victim_energy = gain
+        else:
+            self._victim_energy += KILL_GAIN_ALPHA * (
+                gain - self._victim_energy
+            )
+        self._kill_hits += 1
+        return True
+
+    def kill_hit_rate(self) -> float:
+        """
+        Zusammenfassung der Funktion: Liefert die geschätzte
+        Trefferwahrscheinlichkeit eines Kill-Moves (mit Prior).
+
+        Returns:
+            float: Wahrscheinlichkeit in (0, 1).
+        """
+
+        return (self._kill_hits + KILL_PRIOR_HITS) / (
+            self._kill_attempts + KILL_PRIOR_ATTEMPTS
+        )
+
+    def estimate_victim_energy(self, own_energy: float) -> float:
+        """
+        Zusammenfassung der Funktion: Schätzt die Energie eines schwächeren
+        Gegners ('<') im Sichtfeld.
+
+        Ohne beobachtete Kills wird VICTIM_ENERGY_PRIOR unserer Energie
+        angenommen, sonst der geglättete Gewinn bisheriger Kills, höchstens
+        aber unsere eigene Energie.
+
+        Args:
+            own_energy (float): Energie des jagenden Beasts.
+
+        Returns:
+            float: Geschätzte Energie der Beute.
+        """
+
+        if self._kill_hits == 0:
+            return own_energy * VICTIM_ENERGY_PRIOR
+        return min(self._victim_energy, own_energy)
+
+    def get_deaths(self) -> list:
+        return list(self._deaths)
+
+    def get_death_causes(self) -> dict:
+        return dict(self._death_causes)
+
+    def get_deaths_per_region(self) -> list:
+        return list(self._deaths_per_region)
+
+    def reset(self) -> None:
+        """
+        Zusammenfassung der Funktion: Setzt alle Zähler und den Ringpuffer
+        zurück (z. B. zwischen zwei Spielen oder in Tests).
+
+        Returns:
+            None
+        """
+
+        region_count = self._region_cols * self._region_rows
+        self._views = [0] * region_count
+        self._approaches = [0] * region_count
+        self._food_cells = [0] * region_count
+        self._deaths_per_region = [0] * region_count
+        self._deaths.clear()
+        for cause in self._death_causes:
+            self._death_causes[cause] = 0
+        self._kill_attempts = 0
+        self._kill_hits = 0
+        self._victim_energy = 0.0
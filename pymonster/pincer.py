@@ -0,0 +1,205 @@
+"""
+Dieses Modul koordiniert die Jagd mehrerer eigener Beasts auf denselben
+schwächeren Gegner ('<').
+
+`Beast.hunt()` arbeitet pro Beast: Zwei Jäger nahe derselben Beute laufen
+unabhängig voneinander auf sie zu, und `_is_safe_move()` blockiert dann
+einen der beiden. Der `HuntCoordinator` sammelt deshalb pro Tick (Runde) die
+Sichtungen aller Jäger in absoluten Koordinaten. Beim ersten Aufruf des
+nächsten Ticks wird einmal geplant: Sehen mindestens `PINCER_MIN_HUNTERS`
+Beasts dieselbe Beute, bekommt jeder Jäger ein eigenes Nachbarfeld der Beute
+zugeteilt. Der nächste Jäger nimmt das Feld auf seiner Seite, jeder weitere
+das Feld, das am weitesten (nach Winkel) von den bereits vergebenen Feldern
+entfernt liegt. So kommen die Jäger von gegenüberliegenden Seiten und
+schneiden der Beute die Fluchtwege ab. Die Planung ist linear in der Zahl
+der Sichtungen.
+
+`Beast.hunt()` stellt den Move zum zugeteilten Feld an den Anfang der
+Hunt-Liste, solange die Beute noch an der geplanten Stelle steht.
+
+Jede Sitzung (siehe `utils.session_scope()`) hat einen eigenen Koordinator.
+"""
+
+import math
+
+from . import utils
+from .logic import wrap_abs_coords
+
+# Ab so vielen Jägern pro Beute wird ein Zangen-Angriff geplant
+PINCER_MIN_HUNTERS = 2
+
+# Annäherungsfelder relativ zur Beute (die 8 Nachbarfelder)
+APPROACH_OFFSETS = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)
+)
+
+# Kosinus des Winkels zwischen je zwei Annäherungsfeldern
+APPROACH_COSINES = tuple(
+    tuple(
+        (ax * bx + ay * by) / (math.hypot(ax, ay) * math.hypot(bx, by))
+        for bx, by in APPROACH_OFFSETS
+    )
+    for ax, ay in APPROACH_OFFSETS
+)
+
+# Koordinator pro Sitzungsname (None = Einzel-Client)
+COORDINATORS = {}
+
+
+class HuntCoordinator:
+    """
+    Zusammenfassung der Klasse: Plant einmal pro Tick Zangen-Angriffe aus
+    den Sichtungen aller eigenen Jäger.
+
+    Zuteilungen gelten für den Tick nach den Sichtungen, aus denen sie
+    geplant wurden; Ziel- und Annäherungsfeld sind absolute Koordinaten.
+    """
+
+    def __init__(self):
+        """
+        Zusammenfassung der Funktion: Initialisiert einen Koordinator ohne
+        Sichtungen und Zuteilungen.
+        """
+
+        self._tick = None
+        self._sightings = []
+        self._assignments = {}
+
+    def get_tick(self):
+        return self._tick
+
+    def get_assignment(self, beast_id: int):
+        """
+        Zusammenfassung der Funktion: Liefert die Zuteilung eines Jägers
+        für den aktuellen Tick.
+
+        Args:
+            beast_id (int): ID des Jägers.
+
+        Returns:
+            tuple[tuple[int, int], tuple[int, int]] | None: (Beute,
+            Annäherungsfeld) in absoluten Koordinaten oder None.
+        """
+
+        return self._assignments.get(beast_id)
+
+    def observe(
+        self,
+        beast_id: int,
+        position: tuple[int, int],
+        tick: int,
+        targets: list,
+    ) -> None:
+        """
+        Zusammenfassung der Funktion: Nimmt die Sichtungen eines Jägers auf
+        und plant beim ersten Aufruf eines neuen Ticks die Zuteilungen.
+
+        Geplant wird nur aus den Sichtungen des direkt vorangehenden Ticks;
+        ältere Sichtungen werden verworfen.
+
+        Args:
+            beast_id (int): ID des Jägers.
+            position (tuple[int, int]): Absolute Position des Jägers.
+            tick (int): Absolute Runde des Jägers.
+            targets (list[tuple[int, int]]): Absolute Felder sichtbarer
+                schwächerer Gegner.
+
+        Returns:
+            None
+        """
+
+        if tick != self._tick:
+            if self._tick is not None and tick == self._tick + 1:
+                self._assignments = self._plan(self._sightings)
+            else:
+                self._assignments = {}
+            self._sightings = []
+            self._tick = tick
+
+        for target in targets:
+            self._sightings.append((target, beast_id, position))
+
+    @staticmethod
+    def _plan(sightings: list) -> dict:
+        """
+        Zusammenfassung der Funktion: Teilt Jägern, die dieselbe Beute
+        sehen, sich ergänzende Nachbarfelder der Beute zu.
+
+        Ein Jäger wird höchstens einer Beute zugeteilt (der ersten, bei der
+        er an die Reihe kommt).
+
+        Args:
+            sightings (list[tuple]): (Beute, Jäger-ID, Jäger-Position).
+
+        Returns:
+            dict[int, tuple[tuple[int, int], tuple[int, int]]]: Jäger-ID
+            auf (Beute, Annäherungsfeld).
+        """
+
+        # Sichtungen nach Beute gruppieren (ein Eintrag pro Jäger)
+        hunters_by_target = {}
+        for target, beast_id, (hx, hy) in sightings:
+            dx, dy = wrap_abs_coords(hx - target[0], hy - target[1])
+            hunters_by_target.setdefault(target, {})[beast_id] = (dx, dy)
+
+        assignments = {}
+        for target, hunters in hunters_by_target.items():
+            if len(hunters) < PINCER_MIN_HUNTERS:
+                continue
+            taken = []
+            # nächster Jäger zuerst, bei Gleichstand kleinere ID
+            order = sorted(
+                hunters.items(),
+                key=lambda item: (max(map(abs, item[1])), item[0]),
+            )
+            for beast_id, (dx, dy) in order:
+                if beast_id in assignments:
+                    continue
+                best = None
+                for index, (ox, oy) in enumerate(APPROACH_OFFSETS):
+                    if index in taken:
+                        continue
+                    spread = max(
+                        (APPROACH_COSINES[index][other] for other in taken),
+                        default=-1.0,
+                    )
+                    cost = (dx - ox) ** 2 + (dy - oy) ** 2
+                    key = (spread, cost, index)
+                    if best is None or key < best:
+                        best = key
+                if best is None:
+                    break
+                index = best[2]
+                taken.append(index)
+                ox, oy = APPROACH_OFFSETS[index]
+                cell = wrap_abs_coords(target[0] + ox, target[1] + oy)
+                assignments[beast_id] = (target, cell)
+        return assignments
+
+
+def get_coordinator() -> HuntCoordinator:
+    """
+    Zusammenfassung der Funktion: Liefert den Koordinator der aktuellen
+    Sitzung und legt ihn bei Bedarf an.
+
+    Returns:
+        HuntCoordinator: Koordinator der Sitzung.
+    """
+
+    name = utils.get_session_name()
+    coordinator = COORDINATORS.get(name)
+    if coordinator is None:
+        coordinator = COORDINATORS[name] = HuntCoordinator()
+    return coordinator
+
+
+def reset_coordinators() -> None:
+    """
+    Zusammenfassung der Funktion: Verwirft die Koordinatoren aller
+    Sitzungen (z. B. vor einem neuen Match).
+
+    Returns:
+        None
+    """
+
+    COORDINATORS.clear()
@@ -0,0 +1,282 @@
+"""
+Dieses Modul stellt einen Sampling-Profiler bereit, der im laufenden Client
+per Signal gestartet werden kann.
+
+Nach `install_profiler_signal()` startet ein SIGUSR1 an den Prozess
+(`kill -USR1 <pid>`) den Profiler für eine feste Dauer. Ein Timer-Thread
+liest in festen Abständen den Stack des Haupt-Threads (in dem die
+asyncio-Schleife läuft) über `sys._current_frames()` und zählt jede
+Aufrufkette. Am Ende wird eine Datei im "collapsed stack"-Format
+geschrieben (eine Zeile pro Aufrufkette: `a;b;c anzahl`), die direkt von
+Flamegraph-Werkzeugen wie flamegraph.pl, speedscope oder inferno gelesen
+werden kann.
+
+Der Client wird dabei nicht angehalten, die Kosten liegen bei einem
+Stack-Walk pro Intervall. Ein beim Shutdown noch laufendes Profil wird über
+die Shutdown-Hooks in utils geschrieben.
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+from . import utils
+from .logger import LOG_FOLDER, ensure_dir
+
+PROFILE_FOLDER = os.path.join(LOG_FOLDER, "profiles")
+
+# Standard-Dauer eines Profils in Sekunden
+PROFILE_DURATION = 30.0
+
+# Standard-Abstand zwischen zwei Stichproben in Sekunden
+PROFILE_INTERVAL = 0.005
+
+# Maximale Stack-Tiefe pro Stichprobe
+MAX_STACK_DEPTH = 128
+
+# Aktuell laufender Profiler (höchstens einer)
+ACTIVE_PROFILER = None
+
+_profile_duration = PROFILE_DURATION
+_profile_interval = PROFILE_INTERVAL
+_profile_folder = PROFILE_FOLDER
+
+
+def frame_name(frame) -> str:
+    """
+    Zusammenfassung der Funktion: Bildet den Namen eines Stack-Frames für
+    das collapsed-Format ("datei.py:funktion").
+
+    Semikolons und Leerzeichen sind im Format Trennzeichen und werden
+    ersetzt.
+
+    Args:
+        frame (types.FrameType): Stack-Frame.
+
+    Returns:
+        str: Name des Frames.
+    """
+
+    code = frame.f_code
+    name = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+    return name.replace(";", "_").replace(" ", "_")
+
+
+def collapse_stack(frame) -> str:
+    """
+    Zusammenfassung der Funktion: Wandelt einen Stack in eine Zeile des
+    collapsed-Formats um (äußerster Aufruf zuerst).
+
+    Args:
+        frame (types.FrameType): Innerster Frame des Stacks.
+
+    Returns:
+        str: Frame-Namen, getrennt durch ";".
+    """
+
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        names.append(frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+class SamplingProfiler:
+    """
+    Zusammenfassung der Klasse: Sampling-Profiler auf Basis eines
+    Timer-Threads, der den Stack eines Ziel-Threads periodisch abfragt.
+    """
+
+    def __init__(
+        self,
+        duration: float = PROFILE_DURATION,
+        interval: float = PROFILE_INTERVAL,
+        output_folder: str = PROFILE_FOLDER,
+        thread_id: int | None = None,
+    ):
+        """
+        Zusammenfassung der Funktion: Initialisiert den Profiler.
+
+        Args:
+            duration (float): Dauer des Profils in Sekunden.
+            interval (float): Abstand zwischen zwei Stichproben in Sekunden.
+            output_folder (str): Ordner für die collapsed-Stack-Dateien.
+            thread_id (int | None): Zu profilierender Thread, None = Haupt-
+                Thread.
+        """
+
+        self._duration = duration
+        self._interval = interval
+        self._output_folder = output_folder
+        self._thread_id = thread_id or threading.main_thread().ident
+        self._stacks = Counter()
+        self._samples = 0
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._output_path = None
+
+    def get_samples(self) -> int:
+        return self._samples
+
+    def get_stacks(self) -> Counter:
+        return Counter(self._stacks)
+
+    def get_output_path(self):
+        return self._output_path
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Zusammenfassung der Funktion: Startet den Timer-Thread.
+
+        Returns:
+            None
+        """
+
+        self._thread = threading.Thread(
+            target=self._run, name="pymonster-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def sample(self) -> None:
+        """
+        Zusammenfassung der Funktion: Nimmt eine Stichprobe des Stacks des
+        Ziel-Threads.
+
+        Returns:
+            None
+        """
+
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        self._stacks[collapse_stack(frame)] += 1
+        self._samples += 1
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self._duration
+        while not self._stop_event.wait(self._interval):
+            self.sample()
+            if time.monotonic() >= deadline:
+                break
+        self.write()
+
+    def stop(self) -> str | None:
+        """
+        Zusammenfassung der Funktion: Beendet das Profil vorzeitig und
+        wartet, bis die Datei geschrieben ist.
+
+        Returns:
+            str | None: Pfad der geschriebenen Datei.
+        """
+
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not (
+            threading.current_thread()
+        ):
+            self._thread.join()
+        return self.write()
+
+    def write(self) -> str | None:
+        """
+        Zusammenfassung der Funktion: Schreibt die gezählten Stacks als
+        collapsed-Stack-Datei. Die Datei wird pro Profil nur einmal
+        geschrieben.
+
+        Returns:
+            str | None: Pfad der Datei, None wenn keine Stichproben vorliegen.
+        """
+
+        with self._lock:
+            if self._output_path is not None or not self._stacks:
+                return self._output_path
+            ensure_dir(self._output_folder)
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(
+                self._output_folder,
+                f"profile-{os.getpid()}-{timestamp}.folded",
+            )
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in self._stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self._output_path = path
+            return path
+
+
+def start_profile() -> SamplingProfiler | None:
+    """
+    Zusammenfassung der Funktion: Startet ein neues Profil mit den
+    eingestellten Parametern, sofern nicht bereits eines läuft.
+
+    Returns:
+        SamplingProfiler | None: Der gestartete Profiler oder None, wenn
+        bereits ein Profil läuft.
+    """
+
+    global ACTIVE_PROFILER
+
+    if ACTIVE_PROFILER is not None and ACTIVE_PROFILER.is_running():
+        return None
+    ACTIVE_PROFILER = SamplingProfiler(
+        _profile_duration, _profile_interval, _profile_folder
+    )
+    # keine Ausgabe hier: die Funktion läuft im Signal-Handler, ein print()
+    # könnte eine gerade laufende Ausgabe unterbrechen
+    ACTIVE_PROFILER.start()
+    return ACTIVE_PROFILER
+
+
+def flush_profile() -> str | None:
+    """
+    Zusammenfassung der Funktion: Beendet ein laufendes Profil und schreibt
+    es (Shutdown-Hook).
+
+    Returns:
+        str | None: Pfad der geschriebenen Datei.
+    """
+
+    if ACTIVE_PROFILER is None:
+        return None
+    return ACTIVE_PROFILER.stop()
+
+
+def _handle_sigusr1(signum, frame) -> None:
+    start_profile()
+
+
+def install_profiler_signal(
+    duration: float = PROFILE_DURATION,
+    interval: float = PROFILE_INTERVAL,
+    output_folder: str = PROFILE_FOLDER,
+) -> bool:
+    """
+    Zusammenfassung der Funktion: Registriert SIGUSR1 als Auslöser für den
+    Sampling-Profiler und flush_profile() als Shutdown-Hook.
+
+    Args:
+        duration (float): Dauer eines Profils in Sekunden.
+        interval (float): Abstand zwischen zwei Stichproben in Sekunden.
+        output_folder (str): Ordner für die collapsed-Stack-Dateien.
+
+    Returns:
+        bool: True, wenn der Handler installiert wurde, False auf
+        Plattformen ohne SIGUSR1 (z. B. Windows).
+    """
+
+    global _profile_duration, _profile_interval, _profile_folder
+
+    if not hasattr(signal, "SIGUSR1"):
+        return False
+    _profile_duration = duration
+    _profile_interval = interval
+    _profile_folder = output_folder
+    signal.signal(signal.SIGUSR1, _handle_sigusr1)
+    utils.register_shutdown_hook(flush_profile)
+    return True
@@ -0,0 +1,277 @@
+"""
+Dieses Modul stellt einen Runner bereit, der mehrere Accounts in einem
+Prozess spielt.
+
+Für Scrimmages laufen mehrere Team-Accounts gleichzeitig. Statt pro
+Account einen eigenen Prozess (mit eigenem Interpreter-Start) zu
+starten, liest der Runner eine Account-Datei und führt für jeden Eintrag
+eine `client_loop()` als eigenen Task in derselben Event-Loop aus.
+
+Jede Sitzung läuft in `utils.session_scope()`:
+- eigene Beast-Liste statt `utils.GLOBAL_BEAST_LIST`
+- eigener Log-Ordner `LOG_FOLDER/<Sitzung>/`
+- `handle_shutdown()` beendet nur die Sitzung, nicht den Prozess
+- eigener Zähler für die periodische Rollen-Verteilung
+  (`controller.maybe_rebalance_roles()`)
+
+Mit --compact-logs startet der Runner die Log-Verdichtung (`compaction`)
+als eigenen Prozess; sie bündelt die Logs aller Sitzungsordner.
+
+Prozessweit geteilt bleiben die Gegnerstatistik (`logic.OPPONENT_STATS`),
+das Rollen-Tuning und die Konsolenausgabe.
+
+Format der Account-Datei (eine Zeile pro Account, # = Kommentar):
+    username password_file [hostname [port]]
+"""
+
+import argparse
+import asyncio
+import os
+import re
+from dataclasses import dataclass
+
+from . import console, logger, utils
+from .client import client_loop
+from .compaction import RESERVED_FOLDERS
+from .logger import log_server
+from .metrics import start_metrics_server
+
+
+@dataclass(frozen=True)
+class Account:
+    """
+    Zusammenfassung der Klasse: Zugangsdaten einer Sitzung.
+
+    Attributes:
+        username (str): Benutzername.
+        password_file (str): Pfad der Passwortdatei.
+        hostname (str): Host des Spielservers.
+        port (int): Port des Spielservers.
+    """
+
+    username: str
+    password_file: str
+    hostname: str = "localhost"
+    port: int = 9721
+
+
+def read_accounts(path: str) -> list:
+    """
+    Zusammenfassung der Funktion: Liest die Account-Datei des Runners.
+
+    Relative Pfade von Passwortdateien beziehen sich auf den Ordner der
+    Account-Datei.
+
+    Args:
+        path (str): Pfad der Account-Datei.
+
+    Returns:
+        list[Account]: Accounts in Dateireihenfolge.
+
+    Raises:
+        ValueError: Bei einer Zeile mit zu wenigen oder zu vielen Feldern
+            oder einem ungültigen Port.
+    """
+
+    base = os.path.dirname(os.path.abspath(path))
+    accounts = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            if not 2 <= len(fields) <= 4:
+                raise ValueError(
+                    f"{path}:{line_no}: expected 'username password_file "
+                    "[hostname [port]]'"
+                )
+            password_file = os.path.join(base, fields[1])
+            try:
+                port = int(fields[3]) if len(fields) > 3 else 9721
+            except ValueError as e:
+                raise ValueError(
+                    f"{path}:{line_no}: invalid port {fields[3]!r}"
+                ) from e
+            hostname = fields[2] if len(fields) > 2 else "localhost"
+            accounts.append(Account(fields[0], password_file, hostname, port))
+    return accounts
+
+
+def session_names(accounts: list) -> list:
+    """
+    Zusammenfassung der Funktion: Bildet eindeutige, als Ordnername
+    verwendbare Sitzungsnamen aus den Benutzernamen.
+
+    Args:
+        accounts (list[Account]): Accounts.
+
+    Returns:
+        list[str]: Ein Name pro Account (doppelte bekommen "-2", "-3", ...;
+        Namen aus compaction.RESERVED_FOLDERS sowie "." und ".." bekommen
+        "-session").
+    """
+
+    names = []
+    for account in accounts:
+        base = re.sub(r"[^A-Za-z0-9_.-]", "_", account.username) or "session"
+        # reservierte Unterordner des Log-Ordners (Archiv, Profile)
+        if base in RESERVED_FOLDERS or not base.strip("."):
+            base = f"{base}-session"
+        name = base
+        suffix = 2
+        while name in names:
+            name = f"{base}-{suffix}"
+            suffix += 1
+        names.append(name)
+    return names
+
+
+async def run_session(account: Account, name: str) -> None:
+    """
+    Zusammenfassung der Funktion: Spielt einen Account in einer isolierten
+    Sitzung.
+
+    Fehler (Verbindungsabbruch, abgelehnter Handshake oder jede andere
+    Ausnahme) beenden nur diese Sitzung und werden im Log der Sitzung
+    vermerkt; die übrigen Sitzungen laufen weiter.
+
+    Args:
+        account (Account): Zugangsdaten.
+        name (str): Name der Sitzung.
+
+    Returns:
+        None
+    """
+
+    beasts = []
+    utils.SESSIONS[name] = beasts
+    try:
+        with utils.session_scope(name, beasts):
+            try:
+                await client_loop(
+                    account.username,
+                    account.password_file,
+                    account.hostname,
+                    account.port,
+                )
+            except utils.SessionShutdown:
+                pass
+            except Exception as e:
+                console.warning(f"session {name} failed: {e!r}")
+                log_server("ERROR", f"Session failed: {e!r}")
+    finally:
+        del utils.SESSIONS[name]
+
+
+async def run_sessions(
+    accounts: list,
+    stagger: float = 0.0,
+    metrics_port: int | None = None,
+) -> None:
+    """
+    Zusammenfassung der Funktion: Führt alle Accounts gleichzeitig in einer
+    Event-Loop aus und wartet, bis alle Sitzungen beendet sind.
+
+    Args:
+        accounts (list[Account]): Accounts.
+        stagger (float): Wartezeit in Sekunden zwischen zwei Logins.
+        metrics_port (int | None): Lokaler Port für GET /metrics (über alle
+            Sitzungen), None = kein Metrik-Server.
+
+    Returns:
+        None
+    """
+
+    metrics_server = None
+    if metrics_port is not None:
+        metrics_server = await start_metrics_server(port=metrics_port)
+
+    tasks = []
+    for index, (account, name) in enumerate(
+        zip(accounts, session_names(accounts))
+    ):
+        if index and stagger > 0:
+            await asyncio.sleep(stagger)
+        tasks.append(
+            asyncio.create_task(run_session(account, name), name=name)
+        )
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+
+
+def runner_main():
+    """
+    Zusammenfassung der Funktion: CLI-Einstiegspunkt für den
+    Multi-Account-Runner.
+
+    Beispiel:
+        biester_runner accounts.txt --stagger 0.5
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Run several accounts concurrently in one process"
+    )
+    parser.add_argument(
+        "accounts_file",
+        help="File with one 'username password_file [hostname [port]]' "
+        "entry per line",
+    )
+    parser.add_argument(
+        "--stagger",
+        type=float,
+        help="Seconds between two session logins",
+        default=0.0,
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics",
+        default=None,
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=sorted(console.LEVEL_NAMES),
+        help="Minimum level of console messages",
+        default="info",
+    )
+    parser.add_argument(
+        "--log-mode",
+        choices=logger.LOG_MODES,
+        help="Beast logging tier: every field, scalars only or sampled rounds",
+        default="full",
+    )
+    parser.add_argument(
+        "--compact-logs",
+        action="store_true",
+        help="Compact and prune archived logs of all sessions in a "
+        "low-priority background process (see biester_compact)",
+    )
+    args = parser.parse_args()
+    console.set_level(args.log_level)
+    logger.set_log_mode(args.log_mode)
+    if args.compact_logs:
+        from .compaction import spawn_compactor
+
+        spawn_compactor()
+
+    accounts = read_accounts(args.accounts_file)
+    try:
+        asyncio.run(run_sessions(accounts, args.stagger, args.metrics_port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        utils.run_shutdown_hooks()
+        console.flush()
+
+
+if __name__ == "__main__":
+    runner_main()
@@ -0,0 +1,437 @@
+"""
+Dieses Modul stellt einen einfachen Offline-Simulator für Biester-Matches
+bereit.
+
+Der Simulator spielt die Rolle des Spielservers: Er verwaltet ein toroidales
+Spielfeld mit Futter und gegnerischen Beasts, erzeugt die 7x7-Sichtfelder
+und spricht mit dem Client über dasselbe Nachrichtenprotokoll wie der echte
+Server. Dadurch läuft die komplette Client-Logik (`control_cmd()`,
+Rollenwahl, Split, Tod) unverändert durch, nur ohne WebSocket.
+
+Die Spielregeln sind eine Annäherung an den Server (Move-Kosten = Distanz,
+Futter gibt feste Energie, das stärkere Beast frisst das schwächere) und
+dienen zum Vergleichen von Strategie-Konfigurationen, nicht zur exakten
+Vorhersage von Turnierergebnissen.
+"""
+
+import asyncio
+import contextlib
+import io
+import math
+import random
+from collections import deque
+
+from . import controller, logger, logic, metrics, pincer, utils
+from .beast import Beast
+from .controller import control_cmd
+from .strategy import StrategyConfig, get_strategy, set_strategy
+from .utils import cmd
+
+SIM_FOOD_COUNT = 150
+SIM_FOOD_ENERGY = 10.0
+SIM_ENEMY_COUNT = 20
+SIM_ENEMY_MIN_ENERGY = 20.0
+SIM_ENEMY_MAX_ENERGY = 200.0
+SIM_START_ENERGY = 100.0
+
+NEIGHBOUR_MOVES = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)
+)
+
+
+class OfflineMatch:
+    """
+    Zusammenfassung der Klasse: Simuliert ein Match gegen computergesteuerte
+    Gegner und treibt dabei den echten Client über `control_cmd()`.
+
+    Die Klasse implementiert `send()` und `recv()` wie eine WebSocket-
+    Verbindung, sodass sie direkt an `control_cmd()` übergeben werden kann.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        food_count: int = SIM_FOOD_COUNT,
+        enemy_count: int = SIM_ENEMY_COUNT,
+    ):
+        """
+        Zusammenfassung der Funktion: Erzeugt die Startwelt mit Futter,
+        Gegnern und einem eigenen Beast bei (0, 0).
+
+        Args:
+            seed (int): Seed für den Zufallsgenerator der Welt.
+            food_count (int): Anzahl gleichzeitig liegender Futterfelder.
+            enemy_count (int): Anzahl gegnerischer Beasts.
+        """
+
+        self._rng = random.Random(seed)
+        self._outbox = deque()
+
+        # Position -> ("own", id) oder ("enemy", index)
+        self._occupant = {}
+        self._food = set()
+
+        # eigene Beasts: id -> [x, y, energy]
+        self._own = {}
+        self._next_id = 1
+        self._pending_deaths = []
+
+        self._enemies = []
+
+        self.splits = 0
+        self.deaths = 0
+        self.kills = 0
+        self.max_beasts = 1
+
+        self._spawn_own(0, 0, SIM_START_ENERGY)
+        for _ in range(enemy_count):
+            self._enemies.append(self._spawn_enemy(len(self._enemies)))
+        for _ in range(food_count):
+            self._spawn_food()
+
+    # Welt-Helfer
+
+    def _random_free_cell(self) -> tuple[int, int]:
+        while True:
+            pos = (
+                self._rng.randint(logic.MIN_ABS_X, logic.MAX_ABS_X),
+                self._rng.randint(logic.MIN_ABS_Y, logic.MAX_ABS_Y),
+            )
+            if pos not in self._occupant and pos not in self._food:
+                return pos
+
+    def _spawn_food(self) -> None:
+        self._food.add(self._random_free_cell())
+
+    def _spawn_own(self, x: int, y: int, energy: float) -> int:
+        bid = self._next_id
+        self._next_id += 1
+        self._own[bid] = [x, y, energy]
+        self._occupant[(x, y)] = ("own", bid)
+        return bid
+
+    def _spawn_enemy(self, index: int) -> list:
+        x, y = self._random_free_cell()
+        energy = self._rng.uniform(SIM_ENEMY_MIN_ENERGY, SIM_ENEMY_MAX_ENERGY)
+        self._occupant[(x, y)] = ("enemy", index)
+        return [x, y, energy]
+
+    def _energy_of(self, occupant) -> float:
+        kind, key = occupant
+        if kind == "own":
+            return self._own[key][2]
+        return self._enemies[key][2]
+
+    def _eat_food(self, pos) -> float:
+        if pos in self._food:
+            self._food.discard(pos)
+            self._spawn_food()
+            return SIM_FOOD_ENERGY
+        return 0.0
+
+    def render_environment(self, bid: int) -> str:
+        """
+        Zusammenfassung der Funktion: Erzeugt das 7x7-Sichtfeld eines eigenen
+        Beasts als 49-Zeichen-String.
+
+        Args:
+            bid (int): ID des eigenen Beasts.
+
+        Returns:
+            str: Sichtfeld im Server-Format.
+        """
+
+        x, y, energy = self._own[bid]
+        return self.render_environment_at(x, y, energy)
+
+    def render_environment_at(self, x: int, y: int, energy: float) -> str:
+        """
+        Zusammenfassung der Funktion: Erzeugt das 7x7-Sichtfeld um eine
+        Position aus Sicht eines Beasts mit gegebener Energie.
+
+        Andere Beasts (eigene und gegnerische) erscheinen als '>', '=' oder
+        '<', je nachdem ob sie mehr, gleich viel oder weniger Energie haben.
+
+        Args:
+            x (int): Absolute X-Position.
+            y (int): Absolute Y-Position.
+            energy (float): Energie des betrachtenden Beasts.
+
+        Returns:
+            str: Sichtfeld im Server-Format.
+        """
+
+        cells = []
+        for dy in range(-3, 4):
+            for dx in range(-3, 4):
+                if dx == 0 and dy == 0:
+                    cells.append("B")
+                    continue
+                pos = logic.wrap_abs_coords(x + dx, y + dy)
+                occupant = self._occupant.get(pos)
+                if occupant is not None:
+                    other = self._energy_of(occupant)
+                    if other > energy:
+                        cells.append(">")
+                    elif other < energy:
+                        cells.append("<")
+                    else:
+                        cells.append("=")
+                elif pos in self._food:
+                    cells.append("*")
+                else:
+                    cells.append(".")
+        return "".join(cells)
+
+    # Server-Protokoll (wird von control_cmd() benutzt)
+
+    async def recv(self) -> str:
+        return self._outbox.popleft()
+
+    async def send(self, message: str) -> None:
+        """
+        Zusammenfassung der Funktion: Nimmt einen Befehl des Clients entgegen
+        und führt ihn in der simulierten Welt aus.
+
+        Args:
+            message (str): Befehl im Format "<id> MOVE|SPLIT <dx> <dy>".
+
+        Returns:
+            None
+        """
+
+        bid_str, command, dx_str, dy_str = message.split()
+        bid = int(bid_str)
+        dx = int(dx_str)
+        dy = int(dy_str)
+
+        if bid not in self._own or abs(dx) > 2 or abs(dy) > 2:
+            self._outbox.append("ERROR: invalid command")
+            return
+
+        if command == cmd.SPLIT:
+            self._outbox.append(self._apply_split(bid, dx, dy))
+        else:
+            self._apply_move(bid, dx, dy)
+            self._outbox.append("None#True")
+
+    def _apply_split(self, bid: int, dx: int, dy: int) -> str:
+        x, y, energy = self._own[bid]
+        target = logic.wrap_abs_coords(x + dx, y + dy)
+        if target in self._occupant:
+            return "None#False"
+
+        half = energy / 2
+        self._own[bid][2] = half
+        self._food.discard(target)
+        new_bid = self._spawn_own(target[0], target[1], half)
+        self.splits += 1
+        self.max_beasts = max(self.max_beasts, len(self._own))
+        return f"{new_bid}#True"
+
+    def _apply_move(self, bid: int, dx: int, dy: int) -> None:
+        state = self._own[bid]
+        x, y = state[0], state[1]
+        state[2] -= math.hypot(dx, dy)
+        target = logic.wrap_abs_coords(x + dx, y + dy)
+
+        occupant = self._occupant.get(target)
+        killed = None
+        if occupant is not None and occupant != ("own", bid):
+            if occupant[0] == "own":
+                return  # eigenes Beast blockiert das Feld
+            enemy = self._enemies[occupant[1]]
+            if state[2] > enemy[2]:
+                state[2] += enemy[2]
+                self.kills += 1
+                killed = occupant[1]
+            elif state[2] < enemy[2]:
+                enemy[2] += max(0.0, state[2])
+                self._kill_own(bid)
+                return
+            else:
+                return  # gleich stark -> kein Move
+
+        del self._occupant[(x, y)]
+        state[0], state[1] = target
+        self._occupant[target] = ("own", bid)
+        # erst nach dem Move neu spawnen, sonst kann der Gegner auf dem
+        # Zielfeld landen
+        if killed is not None:
+            self._enemies[killed] = self._spawn_enemy(killed)
+        state[2] += self._eat_food(target)
+
+        if state[2] <= 0:
+            self._kill_own(bid)
+
+    def _kill_own(self, bid: int) -> None:
+        x, y, energy = self._own.pop(bid)
+        if self._occupant.get((x, y)) == ("own", bid):
+            del self._occupant[(x, y)]
+        self._pending_deaths.append((bid, energy, x, y))
+        self.deaths += 1
+
+    def _move_enemies(self) -> None:
+        """
+        Zusammenfassung der Funktion: Bewegt alle Gegner einen Schritt.
+
+        Gegner gehen zu benachbartem Futter oder greifen benachbarte
+        schwächere eigene Beasts an, sonst bewegen sie sich zufällig.
+
+        Returns:
+            None
+        """
+
+        for index, enemy in enumerate(self._enemies):
+            x, y, energy = enemy
+            best = None
+            for dx, dy in NEIGHBOUR_MOVES:
+                pos = logic.wrap_abs_coords(x + dx, y + dy)
+                occupant = self._occupant.get(pos)
+                if (
+                    occupant is not None
+                    and occupant[0] == "own"
+                    and self._own[occupant[1]][2] < energy
+                ):
+                    best = pos
+                    break
+                if best is None and pos in self._food:
+                    best = pos
+            if best is None:
+                dx, dy = self._rng.choice(NEIGHBOUR_MOVES)
+                best = logic.wrap_abs_coords(x + dx, y + dy)
+
+            occupant = self._occupant.get(best)
+            if occupant is not None:
+                if occupant[0] != "own" or self._own[occupant[1]][2] >= energy:
+                    continue
+                enemy[2] += self._own[occupant[1]][2]
+                self._kill_own(occupant[1])
+
+            del self._occupant[(x, y)]
+            enemy[0], enemy[1] = best
+            enemy[2] += self._eat_food(best) - 0.5
+            self._occupant[best] = ("enemy", index)
+
+            if enemy[2] <= 0:
+                del self._occupant[best]
+                self._enemies[index] = self._spawn_enemy(index)
+
+    async def run(self, rounds: int, my_beast: Beast) -> int:
+        """
+        Zusammenfassung der Funktion: Spielt bis zu `rounds` Runden oder bis
+        keine eigenen Beasts mehr leben.
+
+        Args:
+            rounds (int): Maximale Anzahl Runden.
+            my_beast (Beast): Das Start-Beast des Clients.
+
+        Returns:
+            int: Anzahl gespielter Runden.
+        """
+
+        played = 0
+        for _ in range(rounds):
+            for bid in list(self._own):
+                if bid not in self._own:
+                    continue
+                energy = self._own[bid][2]
+                env = self.render_environment(bid)
+                self._outbox.append(f"{bid}#{energy}#{env}")
+                await control_cmd(cmd.BEAST_COMMAND_REQUEST, self, my_beast)
+
+            self._move_enemies()
+
+            for bid, energy, x, y in self._pending_deaths:
+                env = self.render_environment_at(x, y, energy)
+                self._outbox.append(f"{bid}#{energy}#{env}")
+                await control_cmd(cmd.BEAST_GONE_INFO, self, my_beast)
+            self._pending_deaths.clear()
+
+            played += 1
+            if not self._own:
+                break
+
+        await control_cmd(cmd.SHUTDOWN_INFO, self, my_beast)
+        return played
+
+    def own_energies(self) -> list:
+        return [state[2] for state in self._own.values()]
+
+
+def reset_client_state() -> Beast:
+    """
+    Zusammenfassung der Funktion: Setzt den globalen Client-Zustand für ein
+    neues Match zurück und legt das Start-Beast an.
+
+    Returns:
+        Beast: Das neue Start-Beast (bereits in GLOBAL_BEAST_LIST).
+    """
+
+    my_beast = Beast()
+    utils.GLOBAL_BEAST_LIST = [my_beast]
+    logic.OPPONENT_STATS.reset()
+    pincer.reset_coordinators()
+    controller._requests_since_rebalance.clear()
+    metrics.reset_counters()
+    return my_beast
+
+
+def run_match(
+    config: StrategyConfig | None = None,
+    seed: int = 0,
+    rounds: int = 1000,
+    quiet: bool = True,
+) -> dict:
+    """
+    Zusammenfassung der Funktion: Spielt ein komplettes Offline-Match mit
+    einer Strategie-Konfiguration und liefert Kennzahlen zurück.
+
+    Logging auf die Festplatte wird während des Matches abgeschaltet, die
+    Konsolenausgabe des Clients optional unterdrückt. Die aktive
+    Strategie-Konfiguration wird danach wiederhergestellt.
+
+    Args:
+        config (StrategyConfig | None): Zu testende Konfiguration,
+            None = Standardwerte.
+        seed (int): Seed für Welt und Client-Zufall.
+        rounds (int): Maximale Anzahl Runden.
+        quiet (bool): True unterdrückt die Konsolenausgabe des Clients.
+
+    Returns:
+        dict: Kennzahlen des Matches (Überlebensrunden, Energie, Splits ...).
+    """
+
+    previous_strategy = get_strategy()
+    previous_logging = logger.LOGGING_ENABLED
+    set_strategy(config or StrategyConfig())
+    logger.LOGGING_ENABLED = False
+    utils.seed_colony_rng(seed)
+
+    try:
+        my_beast = reset_client_state()
+        match = OfflineMatch(seed)
+        output = io.StringIO() if quiet else None
+        with (
+            contextlib.redirect_stdout(output)
+            if quiet
+            else contextlib.nullcontext()
+        ):
+            played = asyncio.run(match.run(rounds, my_beast))
+    finally:
+        set_strategy(previous_strategy)
+        logger.LOGGING_ENABLED = previous_logging
+
+    energies = match.own_energies()
+    return {
+        "seed": seed,
+        "rounds": played,
+        "survived": bool(energies),
+        "final_beasts": len(energies),
+        "max_beasts": match.max_beasts,
+        "total_energy": sum(energies),
+        "mean_energy": sum(energies) / len(energies) if energies else 0.0,
+        "splits": match.splits,
+        "deaths": match.deaths,
+        "kills": match.kills,
+    }
@@ -0,0 +1,137 @@
+"""
+Dieses Modul wählt beim Split das Feld, auf dem das neue Beast spawnt.
+
+Statt das erste Futterfeld der vier Nachbarfelder zu nehmen (sonst ein
+zufälliges), wird jedes der vier Felder bewertet:
+- Futter: Futterfelder im Sichtfeld, die vom Spawn-Feld aus in zwei
+  Schritten erreichbar sind (Chebyshev-Distanz <= 2, inklusive Spawn-Feld)
+- Gefahr: Anzahl der Gegner ('>' oder '='), in deren 5x5-Gefahrenzone das
+  Feld liegt (Heatmap aus `escape.DANGER_MASKS`)
+- Gedränge: Anzahl eigener Beasts im selben 5x5-Bereich
+
+Felder, auf denen bereits ein Beast steht, scheiden aus. Alle Masken sind bei
+Import vorberechnet; pro Aufruf bleiben ein Durchlauf über den
+Environment-String und einige Bit-Operationen. Bei gleicher Bewertung
+entscheidet die Reihenfolge von `SPAWN_MOVES`, die Wahl ist also
+deterministisch.
+"""
+
+from . import grid
+from .escape import CANDIDATES, DANGER_MASKS, DANGER_RANGE
+
+# Mögliche Spawn-Felder relativ zum Beast (Reihenfolge = Tie-Break)
+SPAWN_MOVES = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Gewichte der Bewertung
+SPAWN_FOOD_WEIGHT = 1.0
+SPAWN_DANGER_WEIGHT = 3.0
+SPAWN_CROWD_WEIGHT = 1.0
+
+# Symbole, auf denen ein neues Beast spawnen kann
+FREE_SYMBOLS = (".", "*")
+
+# Bit jedes Spawn-Feldes in den Masken aus escape.DANGER_MASKS
+SPAWN_BITS = tuple(1 << CANDIDATES.index(move) for move in SPAWN_MOVES)
+
+# Index jedes Spawn-Feldes im 49-Zeichen-Environment
+SPAWN_INDICES = tuple(
+    (grid.CENTER + dy) * grid.GRID_SIZE + grid.CENTER + dx
+    for dx, dy in SPAWN_MOVES
+)
+
+
+def _food_reach_mask(mx: int, my: int) -> int:
+    mask = 0
+    for y in range(grid.GRID_SIZE):
+        for x in range(grid.GRID_SIZE):
+            dx = x - grid.CENTER
+            dy = y - grid.CENTER
+            if max(abs(dx - mx), abs(dy - my)) <= DANGER_RANGE:
+                mask |= 1 << (y * grid.GRID_SIZE + x)
+    return mask
+
+
+# Sichtfeld-Zellen (Bit = Index im Environment), deren Futter vom
+# Spawn-Feld aus in zwei Schritten erreichbar ist
+FOOD_REACH_MASKS = tuple(_food_reach_mask(mx, my) for mx, my in SPAWN_MOVES)
+
+
+def score_spawn_moves(environment: str, enemies: list, allies: set) -> list:
+    """
+    Zusammenfassung der Funktion: Bewertet die vier Spawn-Felder.
+
+    Args:
+        environment (str): Sichtfeld als 49-Zeichen-String.
+        enemies (list[tuple[int, int]]): Relative Positionen von '>' und
+            '=' (ohne eigene Beasts).
+        allies (set[tuple[int, int]]): Relative Positionen eigener Beasts.
+
+    Returns:
+        list[float | None]: Bewertung pro Eintrag von SPAWN_MOVES (höher =
+        besser), None für belegte Felder.
+    """
+
+    in_view = len(environment) == grid.GRID_SIZE * grid.GRID_SIZE
+    food = 0
+    if in_view:
+        index = environment.find("*")
+        while index >= 0:
+            food |= 1 << index
+            index = environment.find("*", index + 1)
+
+    danger = [0] * len(SPAWN_MOVES)
+    for enemy in enemies:
+        mask = DANGER_MASKS.get(enemy, 0)
+        for slot, bit in enumerate(SPAWN_BITS):
+            if mask & bit:
+                danger[slot] += 1
+
+    crowd = [0] * len(SPAWN_MOVES)
+    for ally in allies:
+        mask = DANGER_MASKS.get(ally, 0)
+        for slot, bit in enumerate(SPAWN_BITS):
+            if mask & bit:
+                crowd[slot] += 1
+
+    scores = []
+    for slot, move in enumerate(SPAWN_MOVES):
+        occupied = move in allies or (
+            in_view and environment[SPAWN_INDICES[slot]] not in FREE_SYMBOLS
+        )
+        if occupied:
+            scores.append(None)
+            continue
+        reachable = (food & FOOD_REACH_MASKS[slot]).bit_count()
+        scores.append(
+            SPAWN_FOOD_WEIGHT * reachable
+            - SPAWN_DANGER_WEIGHT * danger[slot]
+            - SPAWN_CROWD_WEIGHT * crowd[slot]
+        )
+    return scores
+
+
+def choose_spawn_move(environment: str, enemies: list, allies: set):
+    """
+    Zusammenfassung der Funktion: Wählt das am besten bewertete freie
+    Spawn-Feld.
+
+    Args:
+        environment (str): Sichtfeld als 49-Zeichen-String.
+        enemies (list[tuple[int, int]]): Relative Positionen von '>' und
+            '=' (ohne eigene Beasts).
+        allies (set[tuple[int, int]]): Relative Positionen eigener Beasts.
+
+    Returns:
+        tuple[int, int] | None: Bestes Spawn-Feld (dx, dy), bei Gleichstand
+        das erste in SPAWN_MOVES; None, wenn alle Felder belegt sind.
+    """
+
+    best = None
+    best_score = None
+    for move, score in zip(
+        SPAWN_MOVES, score_spawn_moves(environment, enemies, allies)
+    ):
+        if score is not None and (best_score is None or score > best_score):
+            best = move
+            best_score = score
+    return best
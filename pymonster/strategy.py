@@ -0,0 +1,102 @@
+"""
+Dieses Modul bündelt die Strategie-Konstanten des Beast-Clients in einem
+typisierten Konfigurationsobjekt.
+
+Schwellwerte wie die Mindestenergie für einen Split oder die Runde, ab der
+Beasts in den 1er-Move-Modus wechseln, waren bisher als Literale über
+`beast.py` und `logic.py` verteilt. Mit `StrategyConfig` lassen sie sich
+zentral setzen, z. B. für Parameter-Sweeps mit dem Offline-Simulator.
+"""
+
+from dataclasses import asdict, dataclass, fields, replace
+
+
+@dataclass(frozen=True)
+class StrategyConfig:
+    """
+    Zusammenfassung der Klasse: Unveränderliche Sammlung aller
+    Strategie-Konstanten.
+
+    Attributes:
+        minimum_split_energy (float): Energie, die für einen normalen Split
+            überschritten werden muss.
+        general_energy_avg (float): Mindestwert für Energie / Runde beim
+            normalen Split. Wurde nach Analyse der Futter-Runde-Verhältnisse
+            aus den Beast-Logs vom 14.11.25 ermittelt: dieser Wert oder
+            größer kommt mit etwa 20% Wahrscheinlichkeit vor.
+        emergency_min_energy (float): Mindestenergie für den Notfall-Split.
+        emergency_min_round (int): Mindestrunde für den Notfall-Split.
+        late_game_round (int): Ab dieser Runde wird die Energie-Priorität
+            auf late_game_priority_energy gesetzt.
+        late_game_priority_energy (float): Energie-Priorität im späten
+            Spiel (< 2.0 bedeutet 1er-Move-Modus).
+        escape_search_depth (int): Eigene Züge, die die Escape-Suche gegen
+            die ungünstigsten Gegnerantworten vorausschaut (1 = keine Suche,
+            siehe escape.order_by_survival).
+        split_forecast_rounds (int): Horizont der Energie-Prognose für den
+            normalen Split in Runden (0 = nur general_energy_avg, siehe
+            forecast.py).
+        split_starvation_line (float): Energie, über der beide Hälften
+            nach split_forecast_rounds Runden voraussichtlich bleiben müssen.
+    """
+
+    minimum_split_energy: float = 80.0
+    general_energy_avg: float = 2.5
+    emergency_min_energy: float = 50.0
+    emergency_min_round: int = 100
+    late_game_round: int = 100
+    late_game_priority_energy: float = 1.9
+    escape_search_depth: int = 2
+    split_forecast_rounds: int = 20
+    split_starvation_line: float = 20.0
+
+    def with_overrides(self, **overrides) -> "StrategyConfig":
+        """
+        Zusammenfassung der Funktion: Liefert eine Kopie mit geänderten
+        Werten. Die Werte werden in den Typ des jeweiligen Feldes
+        umgewandelt (z. B. "80" -> 80.0).
+
+        Args:
+            **overrides: Neue Werte pro Feldname.
+
+        Returns:
+            StrategyConfig: Neue Konfiguration.
+
+        Raises:
+            ValueError: Wenn ein unbekannter Feldname übergeben wird.
+        """
+
+        types = {f.name: f.type for f in fields(self)}
+        converted = {}
+        for name, value in overrides.items():
+            if name not in types:
+                raise ValueError(f"Unknown strategy parameter: {name}")
+            field_type = int if types[name] in (int, "int") else float
+            converted[name] = field_type(value)
+        return replace(self, **converted)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+ACTIVE_STRATEGY = StrategyConfig()
+
+
+def get_strategy() -> StrategyConfig:
+    return ACTIVE_STRATEGY
+
+
+def set_strategy(config: StrategyConfig) -> None:
+    """
+    Zusammenfassung der Funktion: Setzt die aktive Strategie-Konfiguration
+    für alle Beasts dieses Prozesses.
+
+    Args:
+        config (StrategyConfig): Neue Konfiguration.
+
+    Returns:
+        None
+    """
+
+    global ACTIVE_STRATEGY
+    ACTIVE_STRATEGY = config
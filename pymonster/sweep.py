@@ -0,0 +1,298 @@
+"""
+Dieses Modul stellt einen Parameter-Sweep für die Strategie-Konstanten bereit.
+
+Aus einem Gitter von Werten (z. B. `minimum_split_energy=60,80,100`) werden
+alle Kombinationen als StrategyConfig erzeugt und mit mehreren Seeds im
+Offline-Simulator gespielt. Die Matches laufen über einen
+`multiprocessing.Pool` parallel auf allen Kernen, jedes Match in einem
+Worker mit eigenem Seed. Am Ende werden Überlebens- und Energie-Kennzahlen
+pro Konfiguration aggregiert und als Rangliste ausgegeben.
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import traceback
+
+from .simulation import run_match
+from .strategy import StrategyConfig
+
+
+def parse_grid(specs: list) -> dict:
+    """
+    Zusammenfassung der Funktion: Wandelt Gitter-Angaben der Kommandozeile
+    in ein Dictionary von Wertelisten um.
+
+    Args:
+        specs (list[str]): Angaben der Form "name=wert1,wert2,...".
+
+    Returns:
+        dict[str, list[str]]: Werte pro Parametername.
+
+    Raises:
+        ValueError: Wenn eine Angabe kein "=" enthält.
+    """
+
+    grid = {}
+    for spec in specs:
+        if "=" not in spec:
+            raise ValueError(
+                f"Invalid grid spec (expected name=v1,v2): {spec}"
+            )
+        name, values = spec.split("=", 1)
+        grid[name.strip()] = [v.strip() for v in values.split(",") if v]
+    return grid
+
+
+def build_configs(grid: dict, base: StrategyConfig | None = None) -> list:
+    """
+    Zusammenfassung der Funktion: Erzeugt alle Kombinationen des Gitters als
+    StrategyConfig-Objekte.
+
+    Args:
+        grid (dict[str, list[str]]): Werte pro Parametername.
+        base (StrategyConfig | None): Ausgangskonfiguration für nicht
+            variierte Parameter.
+
+    Returns:
+        list[StrategyConfig]: Alle Konfigurationen des Gitters.
+    """
+
+    base = base or StrategyConfig()
+    names = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        configs.append(base.with_overrides(**dict(zip(names, values))))
+    return configs
+
+
+def _run_job(job: tuple) -> tuple:
+    """
+    Zusammenfassung der Funktion: Führt ein einzelnes Match in einem Worker
+    aus (muss für multiprocessing auf Modulebene liegen).
+
+    Bricht das Match mit einer Ausnahme ab, wird es als gescheitert (nicht
+    überlebt, mit "error") gewertet, damit der restliche Sweep weiterläuft.
+
+    Args:
+        job (tuple): (Konfigurations-Index, Konfiguration als dict, Seed,
+            Rundenanzahl).
+
+    Returns:
+        tuple[int, dict]: Konfigurations-Index und Kennzahlen des Matches.
+    """
+
+    index, config_dict, seed, rounds = job
+    try:
+        metrics = run_match(StrategyConfig(**config_dict), seed, rounds)
+    except Exception as e:
+        print(
+            f"match failed (config {index}, seed {seed}): {e!r}\n"
+            + traceback.format_exc(),
+            file=sys.stderr,
+            flush=True,
+        )
+        metrics = {
+            "seed": seed,
+            "rounds": 0,
+            "survived": False,
+            "final_beasts": 0,
+            "max_beasts": 0,
+            "total_energy": 0.0,
+            "mean_energy": 0.0,
+            "splits": 0,
+            "deaths": 0,
+            "kills": 0,
+            "error": repr(e),
+        }
+    return index, metrics
+
+
+def aggregate_results(configs: list, results: list) -> list:
+    """
+    Zusammenfassung der Funktion: Fasst die Match-Kennzahlen pro
+    Konfiguration zusammen und sortiert nach Erfolg.
+
+    Sortiert wird nach Überlebensrate, dann durchschnittlich überlebten
+    Runden, dann durchschnittlicher Gesamtenergie (jeweils absteigend).
+
+    Args:
+        configs (list[StrategyConfig]): Alle Konfigurationen.
+        results (list[tuple[int, dict]]): (Index, Kennzahlen) pro Match.
+
+    Returns:
+        list[dict]: Eine Zeile pro Konfiguration, bestes Ergebnis zuerst.
+    """
+
+    per_config = {index: [] for index in range(len(configs))}
+    for index, metrics in results:
+        per_config[index].append(metrics)
+
+    rows = []
+    for index, matches in per_config.items():
+        if not matches:
+            continue
+        count = len(matches)
+        rows.append(
+            {
+                "config": configs[index].to_dict(),
+                "matches": count,
+                "survival_rate": sum(m["survived"] for m in matches) / count,
+                "mean_rounds": sum(m["rounds"] for m in matches) / count,
+                "mean_total_energy": sum(m["total_energy"] for m in matches)
+                / count,
+                "mean_final_beasts": sum(m["final_beasts"] for m in matches)
+                / count,
+                "mean_deaths": sum(m["deaths"] for m in matches) / count,
+                "failed": sum("error" in m for m in matches),
+            }
+        )
+
+    rows.sort(
+        key=lambda row: (
+            row["survival_rate"],
+            row["mean_rounds"],
+            row["mean_total_energy"],
+        ),
+        reverse=True,
+    )
+    return rows
+
+
+def run_sweep(
+    configs: list,
+    seeds: int = 3,
+    rounds: int = 1000,
+    workers: int | None = None,
+    base_seed: int = 0,
+) -> list:
+    """
+    Zusammenfassung der Funktion: Spielt jede Konfiguration mit mehreren
+    Seeds im Offline-Simulator und liefert die Rangliste.
+
+    Jedes Match ist ein eigener Job im Prozess-Pool. Dieselben Seeds werden
+    für alle Konfigurationen benutzt, damit die Ergebnisse vergleichbar
+    sind. Mit workers=1 läuft alles im aktuellen Prozess.
+
+    Args:
+        configs (list[StrategyConfig]): Zu testende Konfigurationen.
+        seeds (int): Anzahl Matches (Seeds) pro Konfiguration.
+        rounds (int): Maximale Runden pro Match.
+        workers (int | None): Anzahl Worker-Prozesse, None = alle Kerne.
+        base_seed (int): Erster Seed.
+
+    Returns:
+        list[dict]: Aggregierte Rangliste (siehe aggregate_results).
+    """
+
+    jobs = [
+        (index, config.to_dict(), base_seed + seed_offset, rounds)
+        for index, config in enumerate(configs)
+        for seed_offset in range(seeds)
+    ]
+
+    if workers == 1:
+        results = [_run_job(job) for job in jobs]
+    else:
+        with multiprocessing.Pool(processes=workers) as pool:
+            results = list(pool.imap_unordered(_run_job, jobs))
+
+    return aggregate_results(configs, results)
+
+
+def format_table(rows: list, varied: list, top: int | None = None) -> str:
+    """
+    Zusammenfassung der Funktion: Formatiert die Rangliste als Texttabelle.
+
+    Args:
+        rows (list[dict]): Rangliste aus aggregate_results().
+        varied (list[str]): Namen der variierten Parameter (als Spalten).
+        top (int | None): Nur die besten `top` Zeilen ausgeben.
+
+    Returns:
+        str: Tabelle als mehrzeiliger String.
+    """
+
+    header = ["rank", *varied, "survival", "rounds", "energy", "beasts"]
+    lines = [" | ".join(header)]
+    for rank, row in enumerate(rows[:top] if top else rows, start=1):
+        cells = [str(rank)]
+        cells += [str(row["config"][name]) for name in varied]
+        cells += [
+            f"{row['survival_rate']:.2f}",
+            f"{row['mean_rounds']:.1f}",
+            f"{row['mean_total_energy']:.1f}",
+            f"{row['mean_final_beasts']:.1f}",
+        ]
+        lines.append(" | ".join(cells))
+    return "\n".join(lines)
+
+
+def sweep_main():
+    """
+    Zusammenfassung der Funktion: CLI-Einstiegspunkt für den Parameter-Sweep.
+
+    Beispiel:
+        biester_sweep -g minimum_split_energy=60,80,100 \\
+            -g general_energy_avg=2.0,2.5,3.0 --seeds 5 --rounds 2000
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Run offline matches for a grid of strategy constants"
+    )
+    parser.add_argument(
+        "-g",
+        "--grid",
+        action="append",
+        default=[],
+        help="Parameter values to sweep, e.g. minimum_split_energy=60,80,100",
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=3, help="Matches per configuration"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=1000, help="Maximum rounds per match"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--base-seed", type=int, default=0, help="First seed of each run"
+    )
+    parser.add_argument(
+        "--top", type=int, default=None, help="Only print the best N rows"
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="Write full results as JSON"
+    )
+    args = parser.parse_args()
+
+    try:
+        grid = parse_grid(args.grid)
+        configs = build_configs(grid)
+    except ValueError as e:
+        parser.error(f"invalid grid: {e}")
+    rows = run_sweep(
+        configs, args.seeds, args.rounds, args.workers, args.base_seed
+    )
+
+    print(format_table(rows, list(grid), args.top))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    sweep_main()
@@ -0,0 +1,320 @@
+"""
+Dieses Modul stellt ein Online-Tuning der Rollen-Prioritäten bereit.
+
+Für jede Rolle aus ROLE_CONFIGS werden mehrere Prioritäten-Vektoren (Arme)
+gebildet. Ein Multi-Armed-Bandit (UCB1) wählt bei jeder Rollenzuweisung einen
+Arm aus und bewertet ihn anhand der Energie, die das Beast in den folgenden
+BANDIT_WINDOW Runden pro Runde gewinnt. Die Arm-Statistiken können in einer
+kleinen JSON-Datei gespeichert und beim nächsten Spiel wieder geladen werden.
+
+Auswahl und Update sind O(Anzahl Arme) und kosten nur wenige Mikrosekunden.
+"""
+
+import json
+import math
+import os
+
+# Anzahl Runden, nach denen ein Arm bewertet wird
+BANDIT_WINDOW = 50
+
+# Stärke der Exploration in UCB1 (in Energie pro Runde)
+UCB_EXPLORATION = 2.0
+
+# Alle wie viele Updates die Statistik-Datei geschrieben wird
+SAVE_EVERY_UPDATES = 20
+
+# Varianten der Basis-Prioritäten: Faktoren pro Prioritäts-Key.
+# Arm 0 ist immer die unveränderte Konfiguration aus ROLE_CONFIGS.
+ARM_VARIANTS = (
+    {},
+    {"food": 1.25},
+    {"escape": 1.25},
+    {"hunt": 1.25, "kill": 1.25},
+    {"food": 0.8, "escape": 0.8},
+)
+
+
+def build_role_arms(role_configs: dict, variants=ARM_VARIANTS) -> dict:
+    """
+    Zusammenfassung der Funktion: Erzeugt für jede Rolle die Liste der
+    Prioritäten-Vektoren (Arme) aus den Basis-Konfigurationen.
+
+    Ganzzahlige Prioritäten bleiben ganzzahlig (gerundet), die
+    Energie-Priorität bleibt ein float.
+
+    Args:
+        role_configs (dict[str, dict]): Basis-Konfiguration pro Rolle
+            (z. B. controller.ROLE_CONFIGS).
+        variants (tuple[dict]): Faktoren pro Key für jeden Arm.
+
+    Returns:
+        dict[str, list[dict]]: Liste der Arm-Konfigurationen pro Rolle.
+    """
+
+    arms = {}
+    for role, cfg in role_configs.items():
+        role_arms = []
+        for factors in variants:
+            arm_cfg = {}
+            for key, value in cfg.items():
+                scaled = value * factors.get(key, 1.0)
+                arm_cfg[key] = (
+                    int(round(scaled)) if isinstance(value, int) else scaled
+                )
+            role_arms.append(arm_cfg)
+        arms[role] = role_arms
+    return arms
+
+
+class RoleBandit:
+    """
+    Zusammenfassung der Klasse: UCB1-Bandit, der pro Rolle den besten
+    Prioritäten-Vektor anhand des Energiegewinns lernt.
+
+    Pro Rolle und Arm werden die Anzahl der Bewertungen und die Summe der
+    Rewards gespeichert. Zusätzlich merkt sich der Bandit für jedes aktive
+    Beast, welcher Arm gerade läuft und mit welcher Energie das aktuelle
+    Bewertungsfenster begonnen hat.
+    """
+
+    def __init__(self, role_arms: dict, stats_file: str | None = None):
+        """
+        Zusammenfassung der Funktion: Initialisiert leere Arm-Statistiken und
+        lädt ggf. gespeicherte Statistiken aus einer Datei.
+
+        Args:
+            role_arms (dict[str, list[dict]]): Arme pro Rolle
+                (siehe build_role_arms).
+            stats_file (str | None): Pfad zur JSON-Datei für die Statistiken.
+                None deaktiviert das Speichern.
+        """
+
+        self._role_arms = role_arms
+        self._counts = {
+            role: [0] * len(arms) for role, arms in role_arms.items()
+        }
+        self._sums = {
+            role: [0.0] * len(arms) for role, arms in role_arms.items()
+        }
+        self._active = {}
+        self._stats_file = stats_file
+        self._updates_since_save = 0
+
+        if stats_file is not None:
+            self.load(stats_file)
+
+    def get_stats_file(self) -> str | None:
+        return self._stats_file
+
+    def arm_config(self, role: str, arm: int) -> dict:
+        return self._role_arms[role][arm]
+
+    def get_counts(self, role: str) -> list:
+        return list(self._counts[role])
+
+    def get_means(self, role: str) -> list:
+        return [
+            total / count if count else 0.0
+            for total, count in zip(self._sums[role], self._counts[role])
+        ]
+
+    def select(self, role: str) -> int:
+        """
+        Zusammenfassung der Funktion: Wählt per UCB1 den nächsten Arm für
+        eine Rolle.
+
+        Noch nie bewertete Arme werden zuerst gewählt. Danach wird der Arm
+        mit dem höchsten Wert mean + c * sqrt(ln(N) / n) genommen.
+
+        Args:
+            role (str): Rollenname.
+
+        Returns:
+            int: Index des gewählten Arms.
+        """
+
+        counts = self._counts[role]
+        sums = self._sums[role]
+
+        for arm, count in enumerate(counts):
+            if count == 0:
+                return arm
+
+        log_total = math.log(sum(counts))
+        best_arm = 0
+        best_value = -math.inf
+        for arm, count in enumerate(counts):
+            value = sums[arm] / count + UCB_EXPLORATION * math.sqrt(
+                log_total / count
+            )
+            if value > best_value:
+                best_value = value
+                best_arm = arm
+        return best_arm
+
+    def update(self, role: str, arm: int, reward: float) -> None:
+        """
+        Zusammenfassung der Funktion: Verbucht einen Reward für einen Arm und
+        speichert die Statistiken periodisch.
+
+        Args:
+            role (str): Rollenname.
+            arm (int): Index des bewerteten Arms.
+            reward (float): Energiegewinn pro Runde im Bewertungsfenster.
+
+        Returns:
+            None
+        """
+
+        self._counts[role][arm] += 1
+        self._sums[role][arm] += reward
+
+        self._updates_since_save += 1
+        if (
+            self._stats_file is not None
+            and self._updates_since_save >= SAVE_EVERY_UPDATES
+        ):
+            self.save()
+
+    def start(self, beast_id: int, role: str, arm: int, energy: float) -> None:
+        """
+        Zusammenfassung der Funktion: Startet ein Bewertungsfenster für ein
+        Beast mit dem gewählten Arm.
+
+        Args:
+            beast_id (int): ID des Beasts.
+            role (str): Rolle des Beasts.
+            arm (int): Gewählter Arm.
+            energy (float): Energie zu Beginn des Fensters.
+
+        Returns:
+            None
+        """
+
+        self._active[beast_id] = [role, arm, energy, 0]
+
+    def observe(self, beast_id: int, energy: float) -> bool:
+        """
+        Zusammenfassung der Funktion: Zählt eine Runde im Bewertungsfenster
+        eines Beasts und bewertet den Arm, wenn das Fenster voll ist.
+
+        Args:
+            beast_id (int): ID des Beasts.
+            energy (float): Aktuelle Energie des Beasts.
+
+        Returns:
+            bool: True, wenn das Fenster abgeschlossen wurde und für das
+            Beast ein neuer Arm gewählt werden sollte, sonst False.
+        """
+
+        state = self._active.get(beast_id)
+        if state is None:
+            return False
+
+        state[3] += 1
+        if state[3] < BANDIT_WINDOW:
+            return False
+
+        role, arm, start_energy, rounds = state
+        self.update(role, arm, (energy - start_energy) / rounds)
+        del self._active[beast_id]
+        return True
+
+    def rebase(self, beast_id: int, energy_change: float) -> None:
+        """
+        Zusammenfassung der Funktion: Verschiebt die Start-Energie eines
+        laufenden Fensters, z. B. wenn ein Split die Energie halbiert.
+
+        Args:
+            beast_id (int): ID des Beasts.
+            energy_change (float): Energieänderung, die nicht als Gewinn
+                oder Verlust zählen soll.
+
+        Returns:
+            None
+        """
+
+        state = self._active.get(beast_id)
+        if state is not None:
+            state[2] += energy_change
+
+    def finish(self, beast_id: int, energy: float) -> None:
+        """
+        Zusammenfassung der Funktion: Schließt das Fenster eines gestorbenen
+        Beasts ab. Die verlorene Energie wird als Reward verbucht.
+
+        Args:
+            beast_id (int): ID des Beasts.
+            energy (float): Restenergie beim Tod.
+
+        Returns:
+            None
+        """
+
+        state = self._active.pop(beast_id, None)
+        if state is None:
+            return
+        role, arm, start_energy, rounds = state
+        self.update(role, arm, (energy - start_energy) / max(1, rounds))
+
+    def save(self, path: str | None = None) -> None:
+        """
+        Zusammenfassung der Funktion: Schreibt die Arm-Statistiken als JSON.
+
+        Die Datei wird zuerst temporär geschrieben und dann ersetzt, damit
+        ein Abbruch keine halbe Datei hinterlässt.
+
+        Args:
+            path (str | None): Zielpfad der JSON-Datei, None = eigene
+                Statistik-Datei.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: Wenn weder path noch eine Statistik-Datei gesetzt
+                ist.
+        """
+
+        if path is None:
+            path = self._stats_file
+        if path is None:
+            raise ValueError("No stats file to save the bandit to")
+
+        data = {
+            role: {"n": self._counts[role], "sum": self._sums[role]}
+            for role in self._counts
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        self._updates_since_save = 0
+
+    def load(self, path: str) -> None:
+        """
+        Zusammenfassung der Funktion: Lädt gespeicherte Arm-Statistiken.
+
+        Fehlt die Datei, bleiben die Statistiken leer. Rollen oder Arme, die
+        nicht mehr zur aktuellen Konfiguration passen, werden ignoriert.
+
+        Args:
+            path (str): Pfad der JSON-Datei.
+
+        Returns:
+            None
+        """
+
+        if not os.path.exists(path):
+            return
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        for role, stats in data.items():
+            if role not in self._counts:
+                continue
+            if len(stats["n"]) != len(self._counts[role]):
+                continue
+            self._counts[role] = [int(n) for n in stats["n"]]
+            self._sums[role] = [float(total) for total in stats["sum"]]
@@ -4,28 +4,134 @@ Konstanten bereit, die von mehreren Modulen des Beast-Clients verwendet
 werden.
 
 Es enthält:
-- Eine globale Liste aller Beasts (`GLOBAL_BEAST_LIST`)
-- Eine Utility-Funktion zur konsistenten Konsolenausgabe (`print_and_flush`)
+- Eine globale Liste aller Beasts (`GLOBAL_BEAST_LIST`) bzw. pro Sitzung
+  des Multi-Account-Runners eine eigene Liste (`get_beast_list`,
+  `session_scope`)
+- Einen seedbaren Zufallsgenerator der Kolonie (`COLONY_RNG`)
+- Eine Utility-Funktion zur konsistenten Konsolenausgabe (`print_and_flush`,
+  Hülle um den gepufferten Konsolen-Logger in `console`)
 - Eine strukturierte Sammlung aller vom Server verwendeten Kommandos (`cmd`)
-- Eine Shutdown-Routine, die das Programm kontrolliert beendet
+- Eine Shutdown-Routine, die das Programm kontrolliert beendet, inkl.
+  registrierbarer Shutdown-Hooks (`register_shutdown_hook`)
 """
 
 from collections import namedtuple
+import contextlib
+import contextvars
 import os
+import random
 import signal
-import sys
+
+from . import console
 
 GLOBAL_BEAST_LIST = []
 
+# Sitzung des Multi-Account-Runners (runner), None = Einzel-Client.
+# Jeder asyncio-Task hat eine eigene Kopie des Kontexts, die Werte gelten
+# also nur für die Sitzung, in deren Task sie gesetzt wurden.
+SESSION_NAME = contextvars.ContextVar("session_name", default=None)
+SESSION_BEASTS = contextvars.ContextVar("session_beasts", default=None)
+
+# Beast-Listen aller laufenden Sitzungen: Name -> Liste (z. B. für Metriken)
+SESSIONS = {}
+
+# Zufallsgenerator der Kolonie: alle Zufallsentscheidungen (Random-Moves,
+# Split-Fallback, Rollenwahl) laufen hierüber, damit Läufe reproduzierbar sind
+COLONY_RNG = random.Random()
+
+# Funktionen, die handle_shutdown() vor dem Beenden aufruft (z. B. um
+# Messdaten oder Profile zu schreiben)
+SHUTDOWN_HOOKS = []
+
+
+def seed_colony_rng(seed) -> None:
+    """
+    Zusammenfassung der Funktion: Setzt den Seed des Kolonie-Zufallsgenerators.
+
+    Der Generator wird an Ort und Stelle neu geseedet, sodass auch Beasts,
+    die bereits eine Referenz auf COLONY_RNG halten, die neue Sequenz nutzen.
+
+    Args:
+        seed (int | None): Seed-Wert, None = zufälliger Seed aus dem System.
+
+    Returns:
+        None
+    """
+
+    COLONY_RNG.seed(seed)
+
+
+class SessionShutdown(Exception):
+    """Beendet eine Sitzung des Multi-Account-Runners statt des Prozesses."""
+
+
+def get_beast_list() -> list:
+    """
+    Zusammenfassung der Funktion: Liefert die Beast-Liste der aktuellen
+    Sitzung.
+
+    Returns:
+        list[Beast]: Liste der Sitzung, außerhalb einer Sitzung
+        GLOBAL_BEAST_LIST.
+    """
+
+    beasts = SESSION_BEASTS.get()
+    return GLOBAL_BEAST_LIST if beasts is None else beasts
+
+
+def get_all_beasts() -> list:
+    """
+    Zusammenfassung der Funktion: Liefert die Beasts aller Sitzungen und
+    der globalen Liste.
+
+    Returns:
+        list[Beast]: Alle eigenen Beasts des Prozesses.
+    """
+
+    beasts = list(GLOBAL_BEAST_LIST)
+    for session_beasts in SESSIONS.values():
+        beasts.extend(session_beasts)
+    return beasts
+
+
+def get_session_name() -> str | None:
+    return SESSION_NAME.get()
+
+
+@contextlib.contextmanager
+def session_scope(name: str | None, beasts: list | None = None):
+    """
+    Zusammenfassung der Funktion: Setzt Sitzungsname und Beast-Liste für
+    den aktuellen Kontext und stellt sie beim Verlassen wieder her.
+
+    Args:
+        name (str | None): Name der Sitzung (None = Einzel-Client).
+        beasts (list | None): Eigene Beast-Liste der Sitzung, None = die
+            aktuelle Liste nicht ändern.
+
+    Yields:
+        None
+    """
+
+    name_token = SESSION_NAME.set(name)
+    beasts_token = None if beasts is None else SESSION_BEASTS.set(beasts)
+    try:
+        yield
+    finally:
+        if beasts_token is not None:
+            SESSION_BEASTS.reset(beasts_token)
+        SESSION_NAME.reset(name_token)
+
 
 def print_and_flush(message: str):
     """
-    Zusammenfassung der Funktion: Gibt eine Nachricht aus und erzwingt das
-    sofortige Flushen des Ausgabestreams.
+    Zusammenfassung der Funktion: Gibt eine Nachricht über den gepufferten
+    Konsolen-Logger mit Level INFO aus.
 
-    Dies stellt sicher, dass Nachrichten auch in Umgebungen mit asynchroner
-    Protokollierung oder Puffern sofort sichtbar sind (z. B. Logging über
-    Pipes oder WebSocket-Ausgaben).
+    Früher wurde hier nach jedem print() der Ausgabestream geflusht. Das
+    Schreiben und Flushen übernimmt jetzt der Hintergrund-Thread in
+    console, sodass eine langsame Pipe den Event-Loop nicht blockiert.
+    Beim Shutdown wird die Ausgabe vollständig geschrieben.
 
     Args:
         message (str): Die auszugebende Zeichenkette.
@@ -34,8 +140,7 @@ def print_and_flush(message: str):
         None
     """
 
-    print(message)
-    sys.stdout.flush()
+    console.info(message)
 
 
 Command = namedtuple(
@@ -60,22 +165,80 @@ cmd = Command(
 )
 
 
+def register_shutdown_hook(hook) -> None:
+    """
+    Zusammenfassung der Funktion: Registriert eine Funktion, die beim
+    Shutdown aufgerufen wird. Eine Funktion wird höchstens einmal
+    registriert.
+
+    Args:
+        hook (Callable[[], None]): Aufzurufende Funktion ohne Argumente.
+
+    Returns:
+        None
+    """
+
+    if hook not in SHUTDOWN_HOOKS:
+        SHUTDOWN_HOOKS.append(hook)
+
+
+def unregister_shutdown_hook(hook) -> None:
+    if hook in SHUTDOWN_HOOKS:
+        SHUTDOWN_HOOKS.remove(hook)
+
+
+def run_shutdown_hooks() -> None:
+    """
+    Zusammenfassung der Funktion: Ruft alle registrierten Shutdown-Hooks in
+    Registrierungsreihenfolge auf.
+
+    Fehler eines Hooks werden ausgegeben, verhindern aber nicht die
+    Ausführung der übrigen Hooks.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    for hook in list(SHUTDOWN_HOOKS):
+        try:
+            hook()
+        except Exception as e:
+            console.error(f"Shutdown hook {hook.__name__} failed: {e!r}")
+
+
 async def handle_shutdown():
     """
     Zusammenfassung der Funktion: Führt einen kontrollierten Programm-Shutdown aus.
 
     Die Funktion dient als zentraler Punkt für das Beenden des Clients.
-    Sie gibt zunächst eine Abschiedsnachricht aus und sendet anschließend
+    Sie ruft zunächst alle registrierten Shutdown-Hooks auf, gibt dann
+    eine Abschiedsnachricht aus, wartet, bis die Konsolenausgabe
+    geschrieben ist, und sendet anschließend
     ein SIGTERM-Signal an den aktuellen Prozess, um das Programm sauber
     zu beenden.
 
+    Innerhalb einer Sitzung des Multi-Account-Runners wird nur diese
+    Sitzung beendet (SessionShutdown), die übrigen Sitzungen laufen weiter.
+
     Args:
         None
 
     Returns:
         None
+
+    Raises:
+        SessionShutdown: Wenn der Aufruf aus einer Sitzung kommt.
     """
 
+    session = get_session_name()
+    if session is not None:
+        print_and_flush(f"session {session} finished")
+        raise SessionShutdown(session)
+
+    run_shutdown_hooks()
     print_and_flush("bye")
-    sys.stdout.flush()
+    console.flush()
     os.kill(os.getpid(), signal.SIGTERM)
@@ -0,0 +1,444 @@
+"""
+Dieses Modul stellt einen lokalen HTTP-Server für die Log-Visualisierung
+(`index.html`) bereit.
+
+Der Browser muss die Log-Dateien nicht mehr komplett laden: Der Server
+liest die `.ndjson.gz`-Chunks direkt und liefert nur Fenster von
+Einträgen als paginiertes JSON aus. Dafür wird jede Datei einmal
+gescannt und ein dünnes Index-Array aufgebaut. Die Log-Dateien bestehen aus
+einzelnen gzip-Membern, deshalb kann ab jedem Member-Anfang dekomprimiert
+werden. Alle INDEX_STRIDE Einträge merkt sich der Index (Eintragsnummer,
+Runde, Byte-Offset des Members). Ein Fenster kostet damit höchstens
+INDEX_STRIDE übersprungene Einträge plus ein Member, unabhängig von der
+Dateigröße. Existiert eine Index-Datei von `log_beast()` (`.idx`), wird der
+Index daraus übernommen und nur der Rest gescannt. Wächst eine Datei
+(laufendes Spiel), wird nur der neue Teil nachindiziert.
+
+Endpunkte:
+- GET /                      -> index.html
+- GET /api/files             -> Liste der Log-Dateien
+- GET /api/records?file=F&start=N&count=M
+                             -> Einträge N..N+M-1 einer Datei
+- GET /api/records?file=F&round=R&count=M
+                             -> Einträge ab der ersten Runde >= R
+"""
+
+import argparse
+import bisect
+import json
+import os
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from . import logger
+from .logger import iter_members, record_round
+
+# Anzahl Einträge zwischen zwei Index-Punkten
+INDEX_STRIDE = 256
+
+# Standard- und Maximalgröße eines Fensters
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
+
+
+class ChunkIndex:
+    """
+    Zusammenfassung der Klasse: Dünner Index über die gzip-Member einer
+    Log-Datei für Zugriffe nach Eintragsnummer oder Runde.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # parallele Listen: Eintragsnummer, Runde, Byte-Offset
+        self._entry_records = []
+        self._entry_rounds = []
+        self._entry_offsets = []
+        self._records = 0
+        self._scanned_offset = 0
+        self._since_entry = INDEX_STRIDE
+        self._first_round = None
+        self._last_round = None
+        self._last_line = None
+
+    def get_total(self) -> int:
+        return self._records
+
+    def get_first_round(self):
+        return self._first_round
+
+    def get_last_round(self):
+        return self._last_round
+
+    def _add_entry(self, start: int, first_round: int) -> None:
+        self._entry_records.append(self._records)
+        self._entry_rounds.append(first_round)
+        self._entry_offsets.append(start)
+        self._since_entry = 0
+        if self._first_round is None:
+            self._first_round = first_round
+
+    def _load_sidecar(self, size: int) -> None:
+        """
+        Zusammenfassung der Funktion: Übernimmt die Member aus der
+        Index-Datei von log_beast(), ohne die Log-Datei zu dekomprimieren.
+
+        Args:
+            size (int): Aktuelle Größe der Log-Datei.
+
+        Returns:
+            None
+        """
+
+        for entry in logger.read_round_index(self._path):
+            if entry["off"] != self._scanned_offset:
+                break
+            end = entry["off"] + entry["len"]
+            if end > size:
+                break
+            if self._since_entry >= INDEX_STRIDE:
+                self._add_entry(entry["off"], entry["r0"])
+            self._records += entry["n"]
+            self._since_entry += entry["n"]
+            self._scanned_offset = end
+            self._last_round = entry["r1"]
+
+    def refresh(self) -> None:
+        """
+        Zusammenfassung der Funktion: Indiziert neu hinzugekommene Member.
+        Ist die Datei kleiner geworden (ersetzt), wird neu aufgebaut.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            size = os.path.getsize(self._path)
+            if size < self._scanned_offset:
+                self._reset()
+            if size == self._scanned_offset:
+                return
+            self._load_sidecar(size)
+            if size == self._scanned_offset:
+                return
+            self._last_line = None
+            with open(self._path, "rb") as f:
+                for start, end, lines in iter_members(f, self._scanned_offset):
+                    if not lines:
+                        self._scanned_offset = end
+                        continue
+                    if self._since_entry >= INDEX_STRIDE:
+                        self._add_entry(
+                            start, record_round(json.loads(lines[0]))
+                        )
+                    self._records += len(lines)
+                    self._since_entry += len(lines)
+                    self._scanned_offset = end
+                    self._last_line = lines[-1]
+            if self._last_line is not None:
+                self._last_round = record_round(json.loads(self._last_line))
+
+    def _iter_from_entry(self, entry: int):
+        """Liefert (Eintragsnummer, Zeile) ab einem Index-Punkt."""
+        record_no = self._entry_records[entry]
+        with open(self._path, "rb") as f:
+            for _, end, lines in iter_members(f, self._entry_offsets[entry]):
+                if end > self._scanned_offset:
+                    return
+                for line in lines:
+                    yield record_no, line
+                    record_no += 1
+
+    def read_window(self, start: int, count: int) -> list:
+        """
+        Zusammenfassung der Funktion: Liest `count` Einträge ab der
+        Eintragsnummer `start`.
+
+        Args:
+            start (int): Erste Eintragsnummer (0-basiert).
+            count (int): Anzahl Einträge.
+
+        Returns:
+            list[dict]: Die Einträge (weniger am Dateiende).
+        """
+
+        if start >= self._records or count <= 0:
+            return []
+        entry = bisect.bisect_right(self._entry_records, start) - 1
+        records = []
+        for record_no, line in self._iter_from_entry(entry):
+            if record_no < start:
+                continue
+            records.append(json.loads(line))
+            if len(records) >= count:
+                break
+        return records
+
+    def find_round(self, round_number: int) -> int:
+        """
+        Zusammenfassung der Funktion: Sucht den ersten Eintrag mit einer
+        Runde >= round_number.
+
+        Args:
+            round_number (int): Gesuchte Runde.
+
+        Returns:
+            int: Eintragsnummer (get_total(), wenn keine solche Runde
+            existiert).
+        """
+
+        if not self._records:
+            return 0
+        entry = max(
+            0, bisect.bisect_left(self._entry_rounds, round_number) - 1
+        )
+        for record_no, line in self._iter_from_entry(entry):
+            if record_round(json.loads(line)) >= round_number:
+                return record_no
+        return self._records
+
+
+class LogLibrary:
+    """
+    Zusammenfassung der Klasse: Verwaltet die Indizes aller Log-Dateien im
+    Log-Ordner und im Archiv.
+    """
+
+    def __init__(self, log_folder: str = logger.LOG_FOLDER):
+        self._log_folder = os.path.abspath(log_folder)
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, name: str) -> str:
+        """
+        Zusammenfassung der Funktion: Wandelt einen relativen Dateinamen in
+        einen Pfad innerhalb des Log-Ordners um.
+
+        Args:
+            name (str): Name relativ zum Log-Ordner (z. B.
+                "archive/beast-1_c0000.ndjson.gz").
+
+        Returns:
+            str: Absoluter Pfad.
+
+        Raises:
+            ValueError: Wenn der Pfad aus dem Log-Ordner herausführt oder
+                keine .ndjson.gz-Datei ist.
+        """
+
+        path = os.path.abspath(os.path.join(self._log_folder, name))
+        if os.path.commonpath(
+            [path, self._log_folder]
+        ) != self._log_folder or not path.endswith(".ndjson.gz"):
+            raise ValueError(f"Invalid log file: {name}")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(name)
+        return path
+
+    def get_index(self, name: str) -> ChunkIndex:
+        path = self.resolve(name)
+        with self._lock:
+            index = self._indexes.get(path)
+            if index is None:
+                index = self._indexes[path] = ChunkIndex(path)
+        index.refresh()
+        return index
+
+    def list_files(self) -> list:
+        """
+        Zusammenfassung der Funktion: Listet alle Log-Dateien im Log-Ordner
+        und im Archiv.
+
+        Returns:
+            list[dict]: name, kind ("beast" oder "server") und size pro
+            Datei, sortiert nach Name.
+        """
+
+        files = []
+        for root, _, names in os.walk(self._log_folder):
+            for name in names:
+                if not name.endswith(".ndjson.gz"):
+                    continue
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, self._log_folder)
+                # Bündel der Verdichtung (game_*) enthalten Beast-Einträge
+                kind = (
+                    "beast"
+                    if name.startswith(("beast-", "game_"))
+                    else "server"
+                )
+                files.append(
+                    {
+                        "name": rel.replace(os.sep, "/"),
+                        "kind": kind,
+                        "size": os.path.getsize(path),
+                    }
+                )
+        files.sort(key=lambda entry: entry["name"])
+        return files
+
+    def records(self, name: str, start=None, round_number=None, count=None):
+        """
+        Zusammenfassung der Funktion: Liefert ein Fenster von Einträgen als
+        JSON-fähiges Dictionary.
+
+        Args:
+            name (str): Dateiname relativ zum Log-Ordner.
+            start (int | None): Erste Eintragsnummer.
+            round_number (int | None): Alternativ: erste Runde.
+            count (int | None): Fenstergröße (höchstens MAX_PAGE_SIZE).
+
+        Returns:
+            dict: file, total, first_round, last_round, start und records.
+        """
+
+        index = self.get_index(name)
+        if start is None:
+            start = index.find_round(round_number) if round_number else 0
+        count = min(count or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        return {
+            "file": name,
+            "total": index.get_total(),
+            "first_round": index.get_first_round(),
+            "last_round": index.get_last_round(),
+            "start": start,
+            "records": index.read_window(start, count),
+        }
+
+
+class VizRequestHandler(BaseHTTPRequestHandler):
+    """
+    Zusammenfassung der Klasse: HTTP-Handler für index.html und die
+    JSON-Endpunkte.
+    """
+
+    library = None
+    html_path = None
+
+    def log_message(self, format, *args):
+        # keine Zeile pro Request auf stderr
+        pass
+
+    def _send(self, status, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data, status=HTTPStatus.OK) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._send(status, body, "application/json; charset=utf-8")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        def param(name, cast=str):
+            values = query.get(name)
+            return cast(values[0]) if values else None
+
+        try:
+            if url.path in ("/", "/index.html"):
+                with open(self.html_path, "rb") as f:
+                    self._send(
+                        HTTPStatus.OK, f.read(), "text/html; charset=utf-8"
+                    )
+            elif url.path == "/api/files":
+                self._send_json({"files": self.library.list_files()})
+            elif url.path == "/api/records":
+                self._send_json(
+                    self.library.records(
+                        param("file"),
+                        start=param("start", int),
+                        round_number=param("round", int),
+                        count=param("count", int),
+                    )
+                )
+            else:
+                self._send_json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+        except FileNotFoundError as e:
+            self._send_json({"error": f"not found: {e}"}, HTTPStatus.NOT_FOUND)
+        except (TypeError, ValueError) as e:
+            self._send_json({"error": str(e)}, HTTPStatus.BAD_REQUEST)
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    log_folder: str = logger.LOG_FOLDER,
+    html_path: str | None = None,
+) -> ThreadingHTTPServer:
+    """
+    Zusammenfassung der Funktion: Erzeugt den Visualisierungs-Server.
+
+    Args:
+        host (str): Adresse, an die der Server gebunden wird.
+        port (int): TCP-Port (0 = freien Port wählen).
+        log_folder (str): Ordner mit den Log-Dateien.
+        html_path (str | None): Pfad zu index.html, None = index.html im
+            aktuellen Verzeichnis bzw. neben dem Paket.
+
+    Returns:
+        ThreadingHTTPServer: Server, mit serve_forever() starten.
+    """
+
+    if html_path is None:
+        html_path = "index.html"
+        if not os.path.isfile(html_path):
+            html_path = os.path.join(
+                os.path.dirname(os.path.dirname(__file__)), "index.html"
+            )
+
+    handler = type(
+        "BoundVizRequestHandler",
+        (VizRequestHandler,),
+        {"library": LogLibrary(log_folder), "html_path": html_path},
+    )
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def viz_main():
+    """
+    Zusammenfassung der Funktion: CLI-Einstiegspunkt für den
+    Visualisierungs-Server.
+
+    Beispiel:
+        biester_viz --log-folder logs --port 8765
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Serve index.html and stream records from gzip logs"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("-p", "--port", type=int, default=8765, help="Port")
+    parser.add_argument(
+        "--log-folder", default=logger.LOG_FOLDER, help="Folder with logs"
+    )
+    parser.add_argument("--html", default=None, help="Path to index.html")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.log_folder, args.html)
+    print(f"Serving {args.log_folder} on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    viz_main()
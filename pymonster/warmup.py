@@ -0,0 +1,101 @@
+"""
+Dieses Modul wärmt die Entscheidungslogik vor dem ersten Zug auf.
+
+Der erste Aufruf von `decide_action()` ist deutlich langsamer als die
+folgenden: Codepfade (im numpy-Backend auch NumPy) werden zum ersten Mal
+durchlaufen, Puffer angelegt, der Log-Ordner erstellt und zlib/json
+initialisiert. Das passiert
+sonst, während der Server bereits auf unsere erste Antwort wartet.
+
+`warm_up()` wird deshalb während des Login-Handshakes aufgerufen (nach dem
+Senden der Zugangsdaten, vor dem Warten auf die Antwort) und entscheidet
+einige Runden auf synthetischen Umgebungen. Dabei bleibt der Spielzustand
+unberührt: eigene Beast-Liste, eigene Gegnerstatistik, wiederhergestellte
+Jagd-Koordinatoren, kein Logging, keine Latenz-Messung und derselbe Zustand
+des Kolonie-Zufallsgenerators.
+"""
+
+import gzip
+import json
+import time
+
+from . import latency, logger, logic, pincer, utils
+from .beast import Beast
+from .opponents import OpponentStats
+
+# Synthetische 7x7-Umgebungen (leer, Futter, Gegner, gemischt)
+SYNTHETIC_ENVIRONMENTS = (
+    "........................B........................",
+    "*.*.*.*.*.*.*.*.*.*.*.*.B.*.*.*.*.*.*.*.*.*.*.*.*",
+    ">..<..=..*.....<...>....B..*=..<.....>..*.<.....>",
+    "..*.....<...*.....*...*.B......*.>.*..........<..",
+)
+
+# Runden pro Umgebung
+WARM_UP_ROUNDS = 3
+
+
+def prepare_log_folders() -> None:
+    """
+    Zusammenfassung der Funktion: Legt Log- und Archiv-Ordner der Sitzung an
+    und initialisiert json und zlib mit einem Beispiel-Eintrag.
+
+    Returns:
+        None
+    """
+
+    if not logger.LOGGING_ENABLED:
+        return
+    logger.ensure_dir(logger.get_log_folder())
+    logger.ensure_dir(logger.get_archive_folder())
+    sample = json.dumps({"abs_r": 0, "env": SYNTHETIC_ENVIRONMENTS[0]})
+    gzip.compress(sample.encode("utf-8"))
+
+
+def warm_up(rounds: int = WARM_UP_ROUNDS) -> float:
+    """
+    Zusammenfassung der Funktion: Entscheidet `rounds` Runden pro
+    synthetischer Umgebung, ohne den Spielzustand zu verändern.
+
+    Args:
+        rounds (int): Runden pro Umgebung.
+
+    Returns:
+        float: Dauer des Aufwärmens in Sekunden.
+    """
+
+    start = time.perf_counter()
+    prepare_log_folders()
+
+    rng_state = utils.COLONY_RNG.getstate()
+    opponent_stats = logic.OPPONENT_STATS
+    logging_enabled = logger.LOGGING_ENABLED
+    latency_enabled = latency.LATENCY_ENABLED
+    game_rounds = dict(logger._game_rounds)
+    coordinators = dict(pincer.COORDINATORS)
+
+    logic.OPPONENT_STATS = OpponentStats(
+        logic.FIELD_WIDTH, logic.FIELD_HEIGHT, logic.MIN_ABS_X, logic.MIN_ABS_Y
+    )
+    logger.LOGGING_ENABLED = False
+    latency.LATENCY_ENABLED = False
+    try:
+        for environment in SYNTHETIC_ENVIRONMENTS:
+            beast = Beast()
+            beast.set_id(-1)
+            with utils.session_scope(utils.get_session_name(), [beast]):
+                for _ in range(rounds):
+                    beast.set_energy(100.0)
+                    beast.update_energy_rate(100.0)
+                    beast.set_environment(environment)
+                    logic.decide_action(beast)
+    finally:
+        utils.COLONY_RNG.setstate(rng_state)
+        logic.OPPONENT_STATS = opponent_stats
+        logger.LOGGING_ENABLED = logging_enabled
+        latency.LATENCY_ENABLED = latency_enabled
+        logger._game_rounds.clear()
+        logger._game_rounds.update(game_rounds)
+        pincer.COORDINATORS.clear()
+        pincer.COORDINATORS.update(coordinators)
+    return time.perf_counter() - start
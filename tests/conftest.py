@@ -1,11 +1,19 @@
 # tests/conftest.py
 import pytest
 from pymonster.beast import Beast
-from pymonster import utils
+from pymonster import grid, logic, utils
+from pymonster.opponents import OpponentStats
+
+
+@pytest.fixture(params=grid.BACKENDS)
+def backend(request, monkeypatch):
+    """Führt einen Test mit jedem Sichtfeld-Backend aus."""
+    monkeypatch.setattr(grid, "BACKEND", request.param)
+    return request.param
 
 
 @pytest.fixture
-def beast():
+def beast(backend):
     """Standard-Beast-Fixure, die in vielen Tests wiederverwendet wird."""
     b = Beast()
     b.set_id(1)
@@ -18,6 +26,16 @@ def beast():
     return b
 
 
+@pytest.fixture
+def stats(monkeypatch):
+    """Frische Gegnerstatistik, als logic.OPPONENT_STATS eingesetzt."""
+    fresh = OpponentStats(
+        logic.FIELD_WIDTH, logic.FIELD_HEIGHT, logic.MIN_ABS_X, logic.MIN_ABS_Y
+    )
+    monkeypatch.setattr(logic, "OPPONENT_STATS", fresh)
+    return fresh
+
+
 def fill49(s: str) -> str:
     """Füllt einen Environment-String auf exakt 49 Zeichen auf."""
     if len(s) >= 49:
@@ -1,4 +1,4 @@
-import numpy as np
+from pymonster import grid
 from .conftest import fill49
 
 # Test: parse_environment & locate_food_list
@@ -9,8 +9,10 @@ def test_parse_environment_shape_and_center(beast):
     beast.set_environment(env)
 
     field = beast.parse_environment(env)
-    assert field.shape == (7, 7)
-    assert field[3][3] == "B"
+    assert len(field) == 7
+    assert all(len(row) == 7 for row in field)
+    assert field[3][3] == grid.BEAST
+    assert field[0][1] == grid.WEAKER
 
 
 def test_locate_food_list_single_food(beast):
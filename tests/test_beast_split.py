@@ -1,4 +1,5 @@
 from pymonster import utils
+from pymonster.beast import Beast
 from .conftest import fill49
 
 
@@ -26,7 +27,7 @@ def test_split_normal_conditions_met(beast):
     beast.set_food_list(food_moves)
 
     # mehrere eigene Beasts -> kein Notfall-Split
-    utils.GLOBAL_BEAST_LIST = [beast, object()]
+    utils.GLOBAL_BEAST_LIST = [beast, Beast()]
 
     move, do_split = beast.split()
     assert do_split is True
@@ -45,7 +46,7 @@ def test_split_not_enough_energy(beast):
     beast.set_environment(env)
 
     # Mehr als ein Beast -> kein Notfall-Split
-    utils.GLOBAL_BEAST_LIST = [beast, object()]
+    utils.GLOBAL_BEAST_LIST = [beast, Beast()]
 
     move, do_split = beast.split()
     assert do_split is False
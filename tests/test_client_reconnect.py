@@ -0,0 +1,159 @@
+"""Tests für das Wiederverbinden des Clients (client.reconnect) mit einer
+lokalen, gezielt abbrechenden WebSocket-Attrappe."""
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+from websockets.exceptions import ConnectionClosedError, InvalidHandshake
+
+from pymonster import client, logger, utils
+
+
+class FlakyWebSocket:
+    """
+    WebSocket-Attrappe: liefert die vorgegebenen Nachrichten und bricht
+    danach mit ConnectionClosedError ab (wie ein Verbindungsabbruch).
+    """
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.sent = []
+        self.closed = False
+
+    async def send(self, message):
+        if self.closed:
+            raise ConnectionClosedError(None, None)
+        self.sent.append(message)
+
+    async def recv(self):
+        if not self.messages:
+            self.closed = True
+            raise ConnectionClosedError(None, None)
+        return self.messages.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def flaky_server(tmp_path, monkeypatch):
+    """Ersetzt Verbindungsaufbau, control_cmd und Shutdown des Clients."""
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", False)
+    monkeypatch.setattr(utils, "GLOBAL_BEAST_LIST", [])
+    monkeypatch.setattr(client, "RECONNECT_BASE_DELAY", 0.0)
+    password_file = tmp_path / "pw"
+    password_file.write_text("secret\n", encoding="utf-8")
+
+    state = {"connections": [], "handled": [], "beasts": [], "shutdown": 0}
+    script = []
+
+    async def open_connection(hostname, port):
+        item = script.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        state["connections"].append(item)
+        return item
+
+    async def control_cmd(server_str, websocket, my_beast):
+        state["handled"].append(server_str)
+        state["beasts"].append(my_beast)
+        return server_str != utils.cmd.SHUTDOWN_INFO
+
+    async def handle_shutdown():
+        state["shutdown"] += 1
+
+    monkeypatch.setattr(client, "open_connection", open_connection)
+    monkeypatch.setattr(client, "control_cmd", control_cmd)
+    monkeypatch.setattr(client, "handle_shutdown", handle_shutdown)
+    return str(password_file), script, state
+
+
+def test_reconnect_keeps_colony_and_logs_in_again(flaky_server):
+    password_file, script, state = flaky_server
+    script.extend(
+        [
+            FlakyWebSocket(["welcome", "A", "B"]),
+            ConnectionRefusedError("server restarting"),
+            FlakyWebSocket(["welcome back", "C", utils.cmd.SHUTDOWN_INFO]),
+        ]
+    )
+
+    asyncio.run(client.client_loop("team", password_file, "host", 1))
+
+    assert state["handled"] == ["A", "B", "C", utils.cmd.SHUTDOWN_INFO]
+    # dasselbe Start-Beast und dieselbe Kolonie vor und nach dem Abbruch
+    assert len({id(beast) for beast in state["beasts"]}) == 1
+    assert utils.GLOBAL_BEAST_LIST == [state["beasts"][0]]
+    first, second = state["connections"]
+    assert first.sent == second.sent == ["team:secret"]
+    assert first.closed and second.closed
+    assert state["shutdown"] == 1
+
+
+def test_gives_up_after_max_reconnects(flaky_server):
+    password_file, script, state = flaky_server
+    script.extend(
+        [FlakyWebSocket(["welcome", "A"])]
+        + [ConnectionRefusedError("down")] * 3
+    )
+
+    asyncio.run(
+        client.client_loop("team", password_file, "host", 1, max_reconnects=3)
+    )
+
+    assert state["handled"] == ["A"]
+    assert script == []
+    assert state["shutdown"] == 1
+
+
+class RejectingWebSocket(FlakyWebSocket):
+    """WebSocket-Attrappe, deren Login mit einem Protokollfehler scheitert."""
+
+    async def recv(self):
+        raise InvalidHandshake("rejected during login")
+
+
+def test_reconnect_survives_handshake_and_login_errors(flaky_server):
+    _, script, state = flaky_server
+    rejecting = RejectingWebSocket([])
+    good = FlakyWebSocket(["welcome back"])
+    script.extend([InvalidHandshake("bad status"), rejecting, good])
+
+    websocket = asyncio.run(
+        client.reconnect("host", 1, "team", "secret", max_attempts=3)
+    )
+
+    assert websocket is good
+    # halb offene Verbindung nach fehlgeschlagenem Login geschlossen
+    assert rejecting.closed
+    assert not good.closed
+    assert state["connections"] == [rejecting, good]
+
+
+def test_backoff_delay_is_jittered_and_capped(monkeypatch):
+    monkeypatch.setattr(client, "RECONNECT_BASE_DELAY", 1.0)
+    monkeypatch.setattr(client, "RECONNECT_MAX_DELAY", 8.0)
+
+    delays = [client.backoff_delay(attempt) for attempt in range(10)]
+
+    assert all(0 <= delay <= min(8.0, 2**n) for n, delay in enumerate(delays))
+    assert len(set(delays)) > 1
+
+
+def test_client_import_defers_optional_modules():
+    script = (
+        "import sys\n"
+        "import pymonster.client\n"
+        "print(sorted(m for m in ('pymonster.metrics', 'pymonster.profiler',"
+        " 'pymonster.compaction', 'pymonster.logic', 'numpy')"
+        " if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
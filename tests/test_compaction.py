@@ -0,0 +1,182 @@
+"""Tests für die Verdichtung und Bereinigung alter Logs (compaction)."""
+
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from pymonster import compaction, logger, utils
+
+DAY = 86400
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(tmp_path))
+    monkeypatch.setattr(logger, "ARCHIVE_FOLDER", str(tmp_path / "archive"))
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", True)
+    monkeypatch.setattr(logger, "_pending_members", {})
+    monkeypatch.setattr(logger, "CHUNK_SIZE", 100)
+    monkeypatch.setattr(logger, "MEMBER_ROUNDS", 10)
+    monkeypatch.setattr(compaction, "BUNDLE_MEMBER_ROUNDS", 50)
+    return tmp_path
+
+
+def write_rounds(first: int, last: int, bid: int = 1) -> None:
+    for abs_r in range(first, last + 1):
+        logger.log_beast(abs_r=abs_r, bid=bid, e=float(abs_r))
+    logger.flush_beast_logs()
+
+
+def age_files(folder, seconds: float) -> None:
+    stamp = time.time() - seconds
+    for root, _, names in os.walk(folder):
+        for name in names:
+            os.utime(os.path.join(root, name), (stamp, stamp))
+
+
+def test_compaction_bundles_archived_chunks(log_folder):
+    write_rounds(1, 250)
+    write_rounds(1, 120, bid=2)
+    age_files(log_folder / "archive", 120)
+
+    result = compaction.compact_logs(str(log_folder))
+
+    assert result["files"] == 3
+    # Archiv enthält nur noch Bündel, laufende Chunks bleiben liegen
+    assert sorted(os.listdir(log_folder / "archive")) == ["bundles"]
+    assert os.path.exists(log_folder / "beast-1_c0002.ndjson.gz")
+    manifest = compaction.load_manifest(str(log_folder / "archive/bundles"))
+    ((name, entry),) = manifest["bundles"].items()
+    assert name.startswith("game_")
+    assert entry["records"] == 298
+    assert {s["name"] for s in entry["sources"]} == {
+        "beast-1_c0000.ndjson.gz",
+        "beast-1_c0001.ndjson.gz",
+        "beast-2_c0000.ndjson.gz",
+    }
+
+    with gzip.open(log_folder / "archive/bundles" / name, "rt") as f:
+        assert sum(1 for _ in f) == 298
+    records = compaction.read_beast_rounds(1, 95, 210, str(log_folder))
+    assert [r["abs_r"] for r in records] == list(range(95, 211))
+    assert [
+        r["abs_r"]
+        for r in compaction.read_bundled_rounds(2, 0, 3, str(log_folder))
+    ] == [1, 2, 3]
+
+
+def test_interrupted_pass_is_repaired(log_folder):
+    write_rounds(1, 150)
+    age_files(log_folder / "archive", 120)
+    bundle_folder = log_folder / "archive/bundles"
+    bundle_folder.mkdir()
+    source = log_folder / "archive" / "beast-1_c0000.ndjson.gz"
+    name = f"game_{compaction.file_day(str(source))}.ndjson.gz"
+    # Reste eines abgebrochenen Durchgangs ohne Manifest-Eintrag
+    (bundle_folder / name).write_bytes(b"\x1f\x8b\x08garbage")
+    (bundle_folder / (name + ".idx")).write_text('{"r0": 1}\n')
+
+    compaction.compact_logs(str(log_folder))
+
+    with gzip.open(bundle_folder / name, "rt") as f:
+        assert [json.loads(line)["abs_r"] for line in f] == list(range(1, 100))
+    assert len(logger.read_round_index(str(bundle_folder / name))) == 2
+
+
+def test_budgets_remove_oldest_bundles(log_folder):
+    bundle_folder = log_folder / "archive/bundles"
+    bundle_folder.mkdir(parents=True)
+    now = time.time()
+    manifest = {"version": 1, "bundles": {}}
+    for age in (40, 3, 2, 1):
+        day = time.strftime("%Y%m%d", time.localtime(now - age * DAY))
+        name = f"game_{day}.ndjson.gz"
+        (bundle_folder / name).write_bytes(b"x" * 1000)
+        manifest["bundles"][name] = {"kind": "game", "day": day}
+    compaction.save_manifest(str(bundle_folder), manifest)
+
+    removed = compaction.enforce_budgets(
+        str(log_folder), max_bytes=2500, max_age_days=30, now=now
+    )
+
+    assert len(removed) == 2
+    remaining = compaction.load_manifest(str(bundle_folder))["bundles"]
+    assert sorted(remaining) == sorted(os.listdir(bundle_folder))[:2]
+    assert len(remaining) == 2
+
+
+def test_compaction_covers_session_folders(log_folder):
+    write_rounds(1, 150)
+    with utils.session_scope("alice", []):
+        write_rounds(1, 150)
+        logger.log_server("hello", "")
+    # Server-Log eines vergangenen Tages
+    day = time.strftime("%Y%m%d", time.localtime(time.time() - 2 * DAY))
+    server_log = log_folder / "alice" / f"server_{day}.ndjson.gz"
+    next((log_folder / "alice").glob("server_*")).rename(server_log)
+    age_files(log_folder, 2 * DAY)
+
+    result = compaction.compact_logs(str(log_folder))
+
+    assert result["files"] == 5
+    assert os.listdir(log_folder / "alice" / "archive") == []
+    assert not server_log.exists()
+    bundles = compaction.load_manifest(str(log_folder / "archive/bundles"))[
+        "bundles"
+    ]
+    sessions = {entry["session"] for entry in bundles.values()}
+    assert sessions == {None, "alice"}
+    assert any(name.startswith("game_alice_") for name in bundles)
+    assert any(name.startswith("server_alice_") for name in bundles)
+    # gleiche Beast-ID in zwei Sitzungen bleibt getrennt
+    assert [
+        r["abs_r"]
+        for r in compaction.read_bundled_rounds(
+            1, 95, 105, str(log_folder), session="alice"
+        )
+    ] == list(range(95, 106))
+    assert (
+        len(compaction.read_bundled_rounds(1, 95, 105, str(log_folder))) == 11
+    )
+
+
+def test_budgets_count_session_archives(log_folder):
+    bundle_folder = log_folder / "archive/bundles"
+    bundle_folder.mkdir(parents=True)
+    now = time.time()
+    day = time.strftime("%Y%m%d", time.localtime(now - DAY))
+    name = f"game_{day}.ndjson.gz"
+    (bundle_folder / name).write_bytes(b"x" * 1000)
+    compaction.save_manifest(
+        str(bundle_folder),
+        {"version": 1, "bundles": {name: {"kind": "game", "day": day}}},
+    )
+    (log_folder / "bob" / "archive").mkdir(parents=True)
+    (log_folder / "bob" / "archive" / "loose.bin").write_bytes(b"x" * 1000)
+
+    assert compaction.enforce_budgets(str(log_folder), max_bytes=1500) == [
+        name
+    ]
+
+
+def test_read_beast_rounds_uses_given_log_folder(log_folder, monkeypatch):
+    write_rounds(1, 150)
+    with utils.session_scope("alice", []):
+        write_rounds(1, 30, bid=1)
+    age_files(log_folder / "archive", 120)
+    compaction.compact_logs(str(log_folder))
+    # laufender Client schreibt woanders hin
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(log_folder / "other"))
+    monkeypatch.setattr(
+        logger, "ARCHIVE_FOLDER", str(log_folder / "other" / "archive")
+    )
+
+    records = compaction.read_beast_rounds(1, 90, 110, str(log_folder))
+    assert [r["abs_r"] for r in records] == list(range(90, 111))
+    records = compaction.read_beast_rounds(
+        1, 20, 40, str(log_folder), session="alice"
+    )
+    assert [r["abs_r"] for r in records] == list(range(20, 31))
@@ -0,0 +1,72 @@
+"""Tests für den gepufferten Konsolen-Logger (console) und die Hülle
+utils.print_and_flush."""
+
+import io
+
+import pytest
+
+from pymonster import console, metrics, utils
+from pymonster.console import ConsoleWriter, RateLimiter
+
+
+@pytest.fixture
+def console_level():
+    previous = console.CONSOLE_LEVEL
+    yield
+    console.set_level(previous)
+
+
+def test_writer_keeps_order_and_flushes():
+    writer = ConsoleWriter()
+    out = io.StringIO()
+    for idx in range(100):
+        writer.write(out, f"line {idx}\n")
+
+    assert writer.flush()
+    assert out.getvalue().splitlines() == [f"line {i}" for i in range(100)]
+    assert writer.get_queue_depth() == 0
+
+
+def test_writer_drops_when_queue_is_full():
+    writer = ConsoleWriter(max_queue=0)
+
+    assert writer.write(io.StringIO(), "x\n") is False
+    assert writer.get_dropped() == 1
+
+
+def test_rate_limiter_reports_suppressed_messages():
+    limiter = RateLimiter(interval=1.0, burst=2)
+
+    results = [limiter.allow("gone", now=0.1 * i) for i in range(5)]
+    assert [allowed for allowed, _ in results] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    # neues Fenster: die 3 unterdrückten Meldungen werden gemeldet
+    assert limiter.allow("gone", now=1.5) == (True, 3)
+    # andere Schlüssel sind unabhängig
+    assert limiter.allow("other", now=0.3) == (True, 0)
+
+
+def test_levels_and_shim(capsys, console_level):
+    console.set_level("warning")
+    utils.print_and_flush("hidden info")
+    console.error("visible error")
+    console.set_level(console.INFO)
+    utils.print_and_flush("shown info")
+    console.flush()
+
+    out = capsys.readouterr().out
+    assert "hidden info" not in out
+    assert "[ERROR] visible error" in out
+    assert "shown info" in out
+
+
+def test_queue_depth_is_exported_as_metric():
+    text = metrics.render_metrics()
+
+    assert "pymonster_log_queue_depth " in text
+    assert "pymonster_log_dropped_total " in text
@@ -0,0 +1,128 @@
+"""Tests für die periodische Rollen-Neuverteilung in controller
+(compute_role_quotas, rebalance_roles, maybe_rebalance_roles) und die
+laufende Energie-Rate der Beasts."""
+
+import pytest
+
+from pymonster import controller, utils
+from pymonster.beast import Beast
+
+
+def make_colony(rates, role=None):
+    colony = []
+    for idx, rate in enumerate(rates):
+        b = Beast()
+        b.set_id(idx + 1)
+        b._energy_rate = rate
+        if role is not None:
+            controller.apply_role_to_beast(b, role)
+        colony.append(b)
+    return colony
+
+
+def test_update_energy_rate_tracks_deltas():
+    """Die Rate folgt dem Energie-Delta, der erste Wert ist nur Baseline."""
+    b = Beast()
+    assert b.update_energy_rate(50.0) == 0.0
+
+    for energy in range(52, 152, 2):
+        rate = b.update_energy_rate(float(energy))
+
+    assert rate == pytest.approx(2.0, abs=0.05)
+
+
+def test_energy_baseline_ignores_split_drop():
+    b = Beast()
+    b.update_energy_rate(100.0)
+    b.set_energy_baseline(50.0)
+
+    assert b.update_energy_rate(50.0) == 0.0
+
+
+def test_compute_role_quotas_sums_to_colony_size():
+    for size in range(0, 25):
+        quotas = controller.compute_role_quotas(
+            size, controller.ROLE_TARGET_MIX
+        )
+        assert sum(quotas.values()) == size
+
+    assert controller.compute_role_quotas(10, controller.ROLE_TARGET_MIX) == {
+        "farmer": 4,
+        "hunter": 3,
+        "backbag": 3,
+    }
+
+
+def test_rebalance_roles_assigns_by_energy_rate():
+    """Beste Raten werden Hunter, schlechteste Backbag, Rest Farmer."""
+    colony = make_colony([float(r) for r in range(10)])
+
+    changed = controller.rebalance_roles(colony)
+
+    assert changed == 10
+    roles = {b.get_energy_rate(): b.get_role() for b in colony}
+    assert [roles[r] for r in (9.0, 8.0, 7.0)] == ["hunter"] * 3
+    assert [roles[r] for r in (0.0, 1.0, 2.0)] == ["backbag"] * 3
+    assert [roles[r] for r in (3.0, 4.0, 5.0, 6.0)] == ["farmer"] * 4
+    # Prioritäten kommen aus ROLE_CONFIGS
+    hunter = next(b for b in colony if b.get_role() == "hunter")
+    assert (
+        hunter.get_priority_escape()
+        == controller.ROLE_CONFIGS["hunter"]["escape"]
+    )
+
+
+def test_rebalance_roles_keeps_matching_roles():
+    """Eine Kolonie, die schon der Ziel-Mischung entspricht, bleibt stabil."""
+    colony = make_colony([float(r) for r in range(10)])
+    controller.rebalance_roles(colony)
+
+    # Raten ändern sich, Mischung stimmt aber weiterhin
+    for b in colony:
+        b._energy_rate = -b.get_energy_rate()
+
+    assert controller.rebalance_roles(colony) == 0
+
+
+def test_rebalance_roles_releases_worst_fitting_hunters():
+    colony = make_colony([5.0, 1.0, 3.0, 4.0], role="hunter")
+
+    controller.rebalance_roles(colony)
+
+    roles = [b.get_role() for b in colony]
+    # Quoten für 4 Beasts: 2 Farmer, 1 Hunter, 1 Backbag
+    assert roles.count("hunter") == 1
+    assert colony[0].get_role() == "hunter"
+    assert colony[1].get_role() == "backbag"
+
+
+def test_maybe_rebalance_roles_runs_periodically(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        controller, "rebalance_roles", lambda beasts: calls.append(beasts)
+    )
+    monkeypatch.setattr(controller, "_requests_since_rebalance", {})
+    utils.GLOBAL_BEAST_LIST = []
+
+    for _ in range(controller.ROLE_REBALANCE_INTERVAL * 2):
+        controller.maybe_rebalance_roles()
+
+    assert len(calls) == 2
+
+
+def test_rebalance_counter_is_per_session(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        controller,
+        "rebalance_roles",
+        lambda beasts: calls.append(utils.get_session_name()),
+    )
+    monkeypatch.setattr(controller, "_requests_since_rebalance", {})
+
+    # zwei Sitzungen abwechselnd: jede erreicht ihr Intervall selbst
+    for _ in range(controller.ROLE_REBALANCE_INTERVAL):
+        for name in ("red", "blue"):
+            with utils.session_scope(name, []):
+                controller.maybe_rebalance_roles()
+
+    assert calls == ["red", "blue"]
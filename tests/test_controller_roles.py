@@ -1,7 +1,7 @@
 """Tests für Rollen-Presets und die rollenbasierte Auswahlfunktion in controller
  (ROLE_CONFIGS und choose_role_by_score)."""
 
-from pymonster import controller
+from pymonster import controller, utils
 
 
 def test_role_configs_structure():
@@ -21,7 +21,8 @@ def test_role_configs_structure():
 
 
 # Zufälle sind nicht testbar daher werden ganz elegant die Codestellen mit
-# random-Anwendung durch eine fake Funktion mithilfe monkeypatching manipuliert. 
+# Zufallsgenerator (utils.COLONY_RNG) durch eine fake Funktion mithilfe
+# monkeypatching manipuliert. 
 # Änderung liegt nur im Scope unseren tests.
 # Danach wird monkeypatching die Funktionalitäten des alten Codes zurückführen.
 
@@ -36,7 +37,7 @@ def test_choose_role_by_score_low_uses_backbag_heavy_weights(monkeypatch):
         # egal, was zurückkommt – wir wollen nur die übergebenen Parameter testen
         return [population[0]]
 
-    monkeypatch.setattr(controller.random, "choices", fake_choices)
+    monkeypatch.setattr(utils.COLONY_RNG, "choices", fake_choices)
 
     role = controller.choose_role_by_score(1.0)
 
@@ -57,7 +58,7 @@ def test_choose_role_by_score_mid_uses_mixed_weights(monkeypatch):
         captured["k"] = k
         return [population[1]]  # egal, wir testen nur Argumente
 
-    monkeypatch.setattr(controller.random, "choices", fake_choices)
+    monkeypatch.setattr(utils.COLONY_RNG, "choices", fake_choices)
 
     role = controller.choose_role_by_score(2.0)
 
@@ -77,7 +78,7 @@ def test_choose_role_by_score_high_uses_hunter_heavy_weights(monkeypatch):
         captured["k"] = k
         return [population[1]]
 
-    monkeypatch.setattr(controller.random, "choices", fake_choices)
+    monkeypatch.setattr(utils.COLONY_RNG, "choices", fake_choices)
 
     role = controller.choose_role_by_score(3.0)
 
@@ -0,0 +1,129 @@
+import random
+
+import pytest
+
+from pymonster import forecast, grid, utils
+from pymonster.beast import ENERGY_RATE_ALPHA, Beast
+from .conftest import fill49
+
+
+def feed(beast, start, deltas):
+    """Meldet dem Beast eine Energie-Folge wie der Controller."""
+    energy = start
+    beast.set_energy(energy)
+    beast.update_energy_rate(energy)
+    for delta in deltas:
+        energy += delta
+        beast.set_energy(energy)
+        beast.update_energy_rate(energy)
+
+
+def prepare_split(beast):
+    beast.set_environment(fill49(""))
+    beast.set_hunt_list([])
+    beast.set_escape_list([])
+    beast.set_food_list([(0, -1), (1, 0), (-1, 0), (0, 1)])
+    utils.GLOBAL_BEAST_LIST = [beast, Beast()]
+
+
+def test_energy_variance_tracks_income_spread():
+    steady = Beast()
+    feed(steady, 100.0, [2.0] * 50)
+    noisy = Beast()
+    feed(noisy, 100.0, [6.0, -2.0] * 25)
+
+    assert steady.get_energy_samples() == 50
+    assert steady.get_energy_variance() < 0.1
+    assert noisy.get_energy_rate() == pytest.approx(
+        steady.get_energy_rate(), abs=0.5
+    )
+    # Varianz nähert sich der Streuung der Deltas (4^2)
+    assert noisy.get_energy_variance() == pytest.approx(16.0, rel=0.2)
+
+
+def test_energy_rate_unchanged_by_variance():
+    beast = Beast()
+    deltas = [3.0, -1.0, 10.0, 0.5]
+    feed(beast, 50.0, deltas)
+    rate = 0.0
+    for delta in deltas:
+        rate += ENERGY_RATE_ALPHA * (delta - rate)
+    assert beast.get_energy_rate() == rate
+
+
+def test_food_density_counts_food_in_view(stats):
+    env = fill49("*" * 12 + "." * 12 + "B")
+    for _ in range(30):
+        stats.record_sighting(0, 0, env)
+    density = stats.food_density_at(0, 0)
+    assert density == pytest.approx(12 * 30 / (40 * 48))
+    assert stats.food_density_at(30, 15) == 0.0
+    stats.reset()
+    assert stats.food_density_at(0, 0) == 0.0
+
+
+def test_split_forecast_needs_samples(stats):
+    beast = Beast()
+    feed(beast, 100.0, [1.0] * (forecast.FORECAST_MIN_SAMPLES - 1))
+    assert forecast.split_forecast(beast, 20) is None
+    feed(beast, 100.0, [1.0] * forecast.FORECAST_MIN_SAMPLES)
+    assert forecast.split_forecast(beast, 20) is not None
+
+
+def test_half_income_rate_depends_on_food_density():
+    assert forecast.half_income_rate(4.0, 0.0) == 2.0
+    assert forecast.half_income_rate(4.0, forecast.FOOD_DENSITY_HALF) == 3.0
+    # Verluste trägt jede Hälfte voll
+    assert forecast.half_income_rate(-1.5, 0.3) == -1.5
+
+
+def test_split_blocked_by_falling_income(beast, stats):
+    # hoher Lebenszeit-Durchschnitt, aber seit Runden nur Verluste
+    feed(beast, 200.0, [-3.0] * 30)
+    beast.set_round_abs(10)
+    prepare_split(beast)
+    assert beast.get_energy() / beast.get_round_abs() > 2.5
+    assert beast.split() == (None, False)
+
+
+def test_split_allowed_by_steady_income(beast, stats):
+    # niedriger Lebenszeit-Durchschnitt, aber stetiges Einkommen
+    feed(beast, 80.0, [1.0] * 30)
+    beast.set_round_abs(200)
+    prepare_split(beast)
+    assert beast.get_energy() / beast.get_round_abs() < 2.5
+    assert beast.split()[1] is True
+
+
+def test_forecast_colony_backends_agree(monkeypatch, stats):
+    rng = random.Random(9)
+    beasts = []
+    for _ in range(20):
+        b = Beast()
+        b.set_abs_x(rng.randint(-35, 35))
+        b.set_abs_y(rng.randint(-17, 16))
+        feed(
+            b,
+            rng.uniform(20, 300),
+            [rng.uniform(-3, 5) for _ in range(rng.randint(0, 20))],
+        )
+        beasts.append(b)
+        stats.record_sighting(
+            b.get_abs_x(),
+            b.get_abs_y(),
+            "".join(rng.choice(".*") for _ in range(49)),
+        )
+
+    monkeypatch.setattr(grid, "BACKEND", "numpy")
+    expected = forecast.forecast_colony(beasts, 15)
+    monkeypatch.setattr(grid, "BACKEND", "python")
+    result = forecast.forecast_colony(beasts, 15)
+
+    assert len(result) == len(beasts)
+    for (whole, half), (exp_whole, exp_half) in zip(result, expected):
+        assert whole == pytest.approx(exp_whole)
+        if exp_half is None:
+            assert half is None
+        else:
+            assert half == pytest.approx(exp_half)
+    assert forecast.forecast_colony([], 15) == []
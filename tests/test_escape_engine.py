@@ -0,0 +1,133 @@
+import itertools
+import random
+
+from pymonster import escape, strategy, utils
+from pymonster.beast import Beast
+
+
+def reference_escape(beast):
+    """Bisherige Implementierung von Beast.escape() als Referenz."""
+    enemy_list = beast.get_enemy_positions()
+    if not enemy_list:
+        return []
+    our_moves = [
+        (x, y) for x in range(-2, 3) for y in range(-2, 3) if (x, y) != (0, 0)
+    ]
+    danger = set()
+    for ex, ey in enemy_list:
+        for gx in range(ex - 2, ex + 3):
+            for gy in range(ey - 2, ey + 3):
+                if -2 <= gx <= 2 and -2 <= gy <= 2:
+                    danger.add((gx, gy))
+    safe = [m for m in our_moves if m not in danger]
+    safe = [m for m in safe if beast._is_safe_move(m)]
+    one_step = [m for m in safe if max(abs(m[0]), abs(m[1])) == 1]
+    longer = [m for m in safe if max(abs(m[0]), abs(m[1])) != 1]
+    result = []
+    for group in (one_step, longer):
+        if group:
+            result.extend(beast.score_safe_moves(group, enemy_list)[0])
+    return result
+
+
+def test_escape_matches_reference_order(beast, monkeypatch):
+    # ohne Mehrschritt-Suche bleibt die bisherige Reihenfolge exakt gleich
+    monkeypatch.setattr(
+        strategy,
+        "ACTIVE_STRATEGY",
+        strategy.StrategyConfig(escape_search_depth=1),
+    )
+    rng = random.Random(5)
+    for _ in range(200):
+        env = "".join(rng.choice("......*<>=") for _ in range(49))
+        beast.set_environment(env)
+        allies = []
+        for idx in range(rng.randint(0, 4)):
+            ally = Beast()
+            ally.set_id(idx + 2)
+            ally.set_abs_x(10 + rng.randint(-2, 2))
+            ally.set_abs_y(10 + rng.randint(-2, 2))
+            allies.append(ally)
+        utils.GLOBAL_BEAST_LIST = [beast] + allies
+        assert beast.escape() == reference_escape(beast)
+
+
+def test_rank_escape_moves_all_dangerous(backend):
+    # vier Gegner diagonal neben uns bedrohen den gesamten 5x5-Bereich
+    enemies = [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+    assert escape.rank_escape_moves(enemies) == []
+
+
+def test_rank_escape_moves_one_step_first(backend):
+    moves = escape.rank_escape_moves([(-3, 0)])
+    # weiter weg vom Gegner zuerst, Gleichstand in Kandidaten-Reihenfolge
+    assert moves[:5] == [(1, -1), (1, 1), (1, 0), (0, -1), (0, 1)]
+    first_longer = next(
+        i for i, (x, y) in enumerate(moves) if max(abs(x), abs(y)) == 2
+    )
+    assert all(max(abs(x), abs(y)) == 1 for x, y in moves[:first_longer])
+
+
+def brute_force_survival(move, enemies, blocked):
+    """Tiefe 2 ohne Pruning: alle gemeinsamen Antworten, alle Folgezüge."""
+
+    def reaches(a, b):
+        return max(abs(a[0] - b[0]), abs(a[1] - b[1])) <= 2
+
+    for joint in itertools.product(
+        *[[(ex + x, ey + y) for x, y in escape.AREA] for ex, ey in enemies]
+    ):
+        landings = [
+            (move[0] + x, move[1] + y)
+            for x, y in escape.AREA
+            if (move[0] + x, move[1] + y) not in blocked
+        ]
+        if not any(all(not reaches(q, e) for e in joint) for q in landings):
+            return 1
+    return 2
+
+
+def test_escape_search_matches_brute_force():
+    rng = random.Random(1)
+    trapped = 0
+    for _ in range(120):
+        enemies = [
+            (rng.randint(-3, 3), rng.randint(-3, 3))
+            for _ in range(rng.randint(1, 2))
+        ]
+        enemies = [e for e in enemies if e != (0, 0)]
+        blocked = {
+            (rng.randint(-5, 5), rng.randint(-5, 5))
+            for _ in range(rng.randint(0, 20))
+        }
+        search = escape.EscapeSearch(enemies, blocked)
+        for move in escape.rank_escape_moves(enemies):
+            expected = brute_force_survival(move, enemies, blocked)
+            trapped += expected == 1
+            assert search.survival(move, 2) == expected
+    # die Stichprobe enthält tatsächlich Fallen
+    assert trapped > 0
+
+
+def test_order_by_survival_moves_traps_back():
+    # Gegner links, Wand eigener Beasts rechts: (1, 0) führt in die Falle
+    enemies = [(-3, 0)]
+    blocked = {(x, y) for x in range(2, 6) for y in range(-2, 3)}
+    moves = [(1, 0), (0, 1)]
+    search = escape.EscapeSearch(enemies, blocked)
+    assert search.survival((1, 0), 2) == 1
+    assert search.survival((0, 1), 2) == 2
+    assert escape.order_by_survival(moves, enemies, blocked) == [
+        (0, 1),
+        (1, 0),
+    ]
+
+
+def test_order_by_survival_keeps_order_without_budget():
+    enemies = [(-3, 0)]
+    blocked = {(x, y) for x in range(2, 6) for y in range(-2, 3)}
+    moves = [(1, 0), (0, 1)]
+    assert (
+        escape.order_by_survival(moves, enemies, blocked, node_budget=0)
+        == moves
+    )
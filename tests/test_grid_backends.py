@@ -0,0 +1,101 @@
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from pymonster import grid
+
+
+def random_env(rng):
+    return "".join(rng.choice(".*<>=B") for _ in range(49))
+
+
+def as_rows(field):
+    return [[int(cell) for cell in row] for row in field]
+
+
+def test_set_backend_rejects_unknown(monkeypatch):
+    monkeypatch.setattr(grid, "BACKEND", "python")
+    with pytest.raises(ValueError):
+        grid.set_backend("cupy")
+    grid.set_backend("numpy")
+    assert grid.get_backend() == "numpy"
+
+
+def test_parse_grid_backends_agree(monkeypatch):
+    rng = random.Random(7)
+    for _ in range(50):
+        env = random_env(rng)
+        monkeypatch.setattr(grid, "BACKEND", "numpy")
+        expected = as_rows(grid.parse_grid(env))
+        monkeypatch.setattr(grid, "BACKEND", "python")
+        assert as_rows(grid.parse_grid(env)) == expected
+
+
+@pytest.mark.parametrize("move", [(0, 0), (1, 0), (-2, 1), (3, -3), (5, 2)])
+def test_shift_grid_backends_agree(monkeypatch, move):
+    rng = random.Random(11)
+    for _ in range(20):
+        env = random_env(rng)
+        monkeypatch.setattr(grid, "BACKEND", "numpy")
+        expected = as_rows(grid.shift_grid(env, move))
+        monkeypatch.setattr(grid, "BACKEND", "python")
+        assert as_rows(grid.shift_grid(env, move)) == expected
+
+
+def test_encode_environment_is_uint8_view():
+    env = "*" * 24 + "B" + "<" * 24
+    field = grid.encode_environment(env)
+    assert field.shape == (7, 7)
+    assert field.dtype == np.uint8
+    assert not field.flags.writeable
+    assert isinstance(field.base.base, bytes)
+    assert field[3, 3] == grid.BEAST
+    assert field[0, 0] == grid.FOOD
+    assert field[6, 6] == grid.WEAKER
+
+
+def test_shift_grid_clears_old_center(backend):
+    # Futter in der Mitte gilt als Position des Beasts und verschwindet
+    env = "." * 24 + "*" + "." * 24
+    field = grid.shift_grid(env, (1, 0))
+    assert field[3][2] == grid.EMPTY
+    assert field[3][3] == grid.BEAST
+
+
+@pytest.mark.parametrize("limit", [3, 5])
+def test_filter_moves_backends_agree(monkeypatch, limit):
+    moves = [(0, 0), (3, 0), (2, -2), (-4, 1), (1, 2), (2, 2), (-2, 3)]
+    monkeypatch.setattr(grid, "BACKEND", "numpy")
+    expected = [
+        tuple(int(v) for v in m) for m in grid.filter_moves(moves, limit)
+    ]
+    monkeypatch.setattr(grid, "BACKEND", "python")
+    assert grid.filter_moves(moves, limit) == expected
+    assert grid.filter_moves([], limit) == []
+
+
+def test_python_backend_does_not_import_numpy():
+    script = (
+        "import sys\n"
+        "from pymonster import logger, logic, utils\n"
+        "from pymonster.beast import Beast\n"
+        "from pymonster.warmup import SYNTHETIC_ENVIRONMENTS\n"
+        "logger.LOGGING_ENABLED = False\n"
+        "b = Beast()\n"
+        "b.set_id(1)\n"
+        "b.set_energy(100.0)\n"
+        "b.set_environment(SYNTHETIC_ENVIRONMENTS[2])\n"
+        "utils.GLOBAL_BEAST_LIST = [b]\n"
+        "logic.decide_action(b)\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from pymonster import grid, kills, logger, logic
+from pymonster.opponents import KILL_GAIN_MIN, VICTIM_ENERGY_PRIOR
+from .conftest import fill49
+
+
+def test_rank_kill_moves_backends_agree(monkeypatch):
+    rng = random.Random(3)
+    area = list(kills.AREA)
+    for _ in range(200):
+        moves = rng.sample(area, rng.randint(1, 6))
+        threats = [
+            (rng.randint(-3, 3), rng.randint(-3, 3))
+            for _ in range(rng.randint(0, 4))
+        ]
+        args = (
+            moves,
+            rng.uniform(10, 200),
+            rng.uniform(0, 100),
+            rng.uniform(0.1, 0.9),
+            threats,
+        )
+        monkeypatch.setattr(grid, "BACKEND", "numpy")
+        expected = kills.rank_kill_moves(*args)
+        monkeypatch.setattr(grid, "BACKEND", "python")
+        assert kills.rank_kill_moves(*args) == expected
+
+
+def test_rank_kill_moves_prefers_cheap_and_unthreatened(backend):
+    # ohne Bedrohung gewinnt der billigere Move
+    moves = [(2, 2), (1, 0)]
+    assert kills.rank_kill_moves(moves, 100.0, 50.0, 0.5, []) == [
+        (1, 0),
+        (2, 2),
+    ]
+    # ein '>' neben (1, 0) macht den Umweg zu (-2, -2) attraktiver
+    ranked = kills.rank_kill_moves(
+        [(1, 0), (-2, -2)], 60.0, 50.0, 0.5, [(3, 0)]
+    )
+    assert ranked == [(-2, -2), (1, 0)]
+    # zu viele Bedrohungen: Move lohnt sich nicht mehr
+    threats = [(3, 0), (3, 1), (2, -2)]
+    assert kills.rank_kill_moves([(1, 0)], 60.0, 50.0, 0.5, threats) == []
+
+
+def test_kill_value_matches_formula():
+    value = kills.kill_value((1, 1), 80.0, 40.0, 0.5, [(3, 3), (-3, -3)])
+    assert value == pytest.approx(20.0 - 2**0.5 - 0.25 * 80.0)
+
+
+def test_kill_tracker_estimates(stats):
+    assert stats.kill_hit_rate() == pytest.approx(0.5)
+    assert stats.estimate_victim_energy(60.0) == 60.0 * VICTIM_ENERGY_PRIOR
+
+    assert not stats.record_kill_attempt(KILL_GAIN_MIN - 1)
+    assert stats.record_kill_attempt(30.0)
+    assert stats.kill_hit_rate() == pytest.approx(2 / 4)
+    assert stats.estimate_victim_energy(60.0) == 30.0
+    # nie mehr als die eigene Energie (sonst wäre die Beute stärker)
+    assert stats.estimate_victim_energy(20.0) == 20.0
+
+    stats.reset()
+    assert stats.kill_hit_rate() == pytest.approx(0.5)
+
+
+def test_compute_kill_list_avoids_guarded_target(beast, stats):
+    rows = [
+        ".......",
+        ".......",
+        ".......",
+        ".<.B.<>",
+        ".......",
+        ".......",
+        ".......",
+    ]
+    beast.set_environment(fill49("".join(rows)))
+    # '>' direkt neben (2, 0): Risiko frisst den erwarteten Gewinn
+    assert beast.compute_kill_list() == [(-2, 0)]
+
+
+def test_decide_action_records_kill_outcome(beast, stats, monkeypatch):
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", False)
+    rows = [
+        ".......",
+        ".......",
+        ".......",
+        "...B<..",
+        ".......",
+        ".......",
+        ".......",
+    ]
+    beast.update_energy_rate(100.0)
+    beast.set_environment(fill49("".join(rows)))
+    logic.decide_action(beast)
+    assert beast.get_pending_kill() == pytest.approx(1.0)
+
+    # nächste Runde: 39 Energie gewonnen, Move hat 1 gekostet
+    beast.set_energy(139.0)
+    beast.update_energy_rate(139.0)
+    beast.set_environment(fill49(""))
+    logic.decide_action(beast)
+    assert beast.get_pending_kill() is None
+    assert stats.estimate_victim_energy(100.0) == pytest.approx(40.0)
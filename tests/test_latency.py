@@ -0,0 +1,114 @@
+"""Tests für die Latenz-Messung pro Stufe (latency) und die Shutdown-Hooks
+in utils."""
+
+import asyncio
+import json
+
+import pytest
+
+from pymonster import latency, logger, logic, utils
+from pymonster.latency import (
+    BUCKET_COUNT,
+    LatencyHistogram,
+    bucket_bounds,
+    bucket_index,
+)
+from .conftest import fill49
+
+
+@pytest.fixture
+def enabled_latency(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", False)
+    monkeypatch.setattr(utils, "SHUTDOWN_HOOKS", [])
+    path = tmp_path / "latency.json"
+    latency.enable_latency(str(path), dump_every=3)
+    yield path
+    latency.disable_latency()
+
+
+def test_buckets_are_contiguous():
+    """Jeder Wert liegt in genau dem Bucket, dessen Grenzen ihn enthalten."""
+    for value in list(range(0, 5000)) + [10**6, 123456789, 2**39]:
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+    assert bucket_index(latency.MAX_VALUE_NS) == BUCKET_COUNT - 1
+
+
+def test_percentile_relative_error_is_bounded():
+    hist = LatencyHistogram()
+    for value in range(1, 100_001):
+        hist.record(value * 100)
+
+    p50 = hist.percentile(50)
+    p99 = hist.percentile(99)
+
+    assert p50 == pytest.approx(5_000_000, rel=1 / latency.SUB_BUCKETS)
+    assert p99 == pytest.approx(9_900_000, rel=1 / latency.SUB_BUCKETS)
+    assert hist.percentile(100) == hist.get_max() == 10_000_000
+    assert hist.get_min() == 100
+
+
+def test_disabled_latency_records_nothing(beast, monkeypatch):
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", False)
+    beast.set_environment(fill49("...*" + "." * 45))
+
+    assert latency.start_clock() is None
+    logic.decide_action(beast)
+
+    assert latency.HISTOGRAMS == {}
+
+
+def test_decide_action_records_every_stage(beast, enabled_latency):
+    beast.set_environment(fill49("...*" + "." * 45))
+
+    logic.decide_action(beast)
+
+    for stage in (
+        "sighting",
+        "chase_food",
+        "hunt",
+        "kill_list",
+        "escape",
+        "split",
+        "merge",
+        "log_beast",
+        "decide_action",
+    ):
+        assert latency.HISTOGRAMS[stage].get_count() == 1
+
+
+def test_histograms_are_dumped_periodically_and_on_shutdown(
+    enabled_latency, monkeypatch
+):
+    killed = []
+    monkeypatch.setattr(utils.os, "kill", lambda *args: killed.append(args))
+    latency.record("escape", 1500)
+
+    latency.maybe_dump_latency()
+    latency.maybe_dump_latency()
+    assert not enabled_latency.exists()
+    latency.maybe_dump_latency()
+    assert json.loads(enabled_latency.read_text())["escape"]["count"] == 1
+
+    latency.record("escape", 2500)
+    asyncio.run(utils.handle_shutdown())
+
+    assert json.loads(enabled_latency.read_text())["escape"]["count"] == 2
+    assert killed
+
+
+def test_failing_shutdown_hook_does_not_stop_others(monkeypatch):
+    monkeypatch.setattr(utils, "SHUTDOWN_HOOKS", [])
+    calls = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    utils.register_shutdown_hook(broken)
+    utils.register_shutdown_hook(lambda: calls.append("ok"))
+    utils.register_shutdown_hook(broken)
+
+    utils.run_shutdown_hooks()
+
+    assert calls == ["ok"]
+    assert len(utils.SHUTDOWN_HOOKS) == 2
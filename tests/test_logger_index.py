@@ -0,0 +1,84 @@
+"""Tests für die gepufferten gzip-Member und den Runden-Index (logger)."""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from pymonster import logger, utils
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(tmp_path))
+    monkeypatch.setattr(logger, "ARCHIVE_FOLDER", str(tmp_path / "archive"))
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", True)
+    monkeypatch.setattr(logger, "_pending_members", {})
+    monkeypatch.setattr(logger, "MEMBER_ROUNDS", 10)
+    monkeypatch.setattr(logger, "CHUNK_SIZE", 100)
+    return tmp_path
+
+
+def write_rounds(first: int, last: int, bid: int = 1) -> None:
+    for abs_r in range(first, last + 1):
+        logger.log_beast(abs_r=abs_r, bid=bid, e=float(abs_r))
+
+
+def test_members_are_written_per_round_block(log_folder):
+    write_rounds(1, 35)
+    path = str(log_folder / "beast-1_c0000.ndjson.gz")
+
+    # Runden 30-35 warten noch im Puffer
+    entries = logger.read_round_index(path)
+    assert [(e["r0"], e["r1"], e["n"]) for e in entries] == [
+        (1, 9, 9),
+        (10, 19, 10),
+        (20, 29, 10),
+    ]
+    assert entries[1]["off"] == entries[0]["off"] + entries[0]["len"]
+
+    logger.flush_beast_logs()
+
+    # die Datei bleibt eine normale .ndjson.gz-Datei
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        rounds = [json.loads(line)["abs_r"] for line in f]
+    assert rounds == list(range(1, 36))
+    assert logger.read_round_index(path)[-1]["r1"] == 35
+
+
+def test_read_beast_rounds_across_chunks_and_archive(log_folder):
+    write_rounds(1, 250)
+    write_rounds(1, 20, bid=2)
+
+    records = logger.read_beast_rounds(1, 95, 105)
+
+    assert [r["abs_r"] for r in records] == list(range(95, 106))
+    assert all(r["bid"] == 1 for r in records)
+    # ältere Chunks liegen samt Index im Archiv
+    archived = sorted(os.listdir(log_folder / "archive"))
+    assert "beast-1_c0000.ndjson.gz.idx" in archived
+    assert [r["abs_r"] for r in logger.read_beast_rounds(1, 249, 400)] == [
+        249,
+        250,
+    ]
+
+
+def test_read_beast_rounds_without_index_falls_back_to_scan(log_folder):
+    write_rounds(1, 50)
+    logger.flush_beast_logs()
+    os.remove(log_folder / "beast-1_c0000.ndjson.gz.idx")
+
+    records = logger.read_beast_rounds(1, 42, 44)
+
+    assert [r["abs_r"] for r in records] == [42, 43, 44]
+
+
+def test_shutdown_hook_flushes_pending_members(log_folder):
+    write_rounds(1, 5)
+    assert logger.flush_beast_logs in utils.SHUTDOWN_HOOKS
+
+    utils.run_shutdown_hooks()
+
+    path = str(log_folder / "beast-1_c0000.ndjson.gz")
+    assert logger.read_round_index(path)[0]["n"] == 5
@@ -0,0 +1,85 @@
+"""Tests für die Stufen des Beast-Loggings (logger.set_log_mode)."""
+
+import pytest
+
+from pymonster import logger
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(tmp_path))
+    monkeypatch.setattr(logger, "ARCHIVE_FOLDER", str(tmp_path / "archive"))
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", True)
+    monkeypatch.setattr(logger, "_pending_members", {})
+    monkeypatch.setattr(logger, "_recent_rounds", {})
+    for name in (
+        "LOG_MODE",
+        "SAMPLE_EVERY",
+        "SAMPLE_BEAST_PERCENT",
+        "ANOMALY_ROUNDS",
+    ):
+        monkeypatch.setattr(logger, name, getattr(logger, name))
+    return tmp_path
+
+
+def write_rounds(first: int, last: int, bid: int = 1) -> None:
+    for abs_r in range(first, last + 1):
+        logger.log_beast(
+            abs_r=abs_r, bid=bid, e=float(abs_r), env="." * 49, fl=[[1, 0]]
+        )
+
+
+def test_summary_mode_keeps_full_rounds_before_death(log_folder):
+    logger.set_log_mode("summary", anomaly_rounds=5)
+    write_rounds(1, 30)
+
+    logger.log_beast_death(1)
+
+    records = logger.read_beast_rounds(1, 0, 100)
+    assert [r["abs_r"] for r in records] == list(range(1, 31))
+    assert all("env" not in r for r in records[:25])
+    assert records[0]["e"] == 1.0
+    assert all(r["anomaly"] and r["env"] for r in records[25:])
+
+
+def test_sampled_mode_logs_every_nth_round(log_folder):
+    logger.set_log_mode("sampled", sample_every=10, anomaly_rounds=0)
+    write_rounds(1, 45)
+    logger.flush_beast_logs()
+
+    records = logger.read_beast_rounds(1, 0, 100)
+
+    assert [r["abs_r"] for r in records] == [10, 20, 30, 40]
+    assert records[0]["fl"] == [[1, 0]]
+
+
+def test_sampled_beasts_are_chosen_by_id(log_folder):
+    logger.set_log_mode("sampled", sample_every=1000, sample_percent=50)
+    logged = [
+        bid
+        for bid in range(200)
+        if logger.is_sampled({"abs_r": 1, "bid": bid})
+    ]
+
+    assert 60 < len(logged) < 140
+    assert logged == [
+        bid
+        for bid in range(200)
+        if logger.is_sampled({"abs_r": 7, "bid": bid})
+    ]
+
+
+def test_shutdown_writes_held_back_rounds_filtered(log_folder):
+    logger.set_log_mode("sampled", sample_every=5, anomaly_rounds=20)
+    write_rounds(1, 12)
+
+    logger.flush_beast_logs()
+
+    records = logger.read_beast_rounds(1, 0, 100)
+    assert [r["abs_r"] for r in records] == [5, 10]
+    assert not any(r.get("anomaly") for r in records)
+
+
+def test_unknown_log_mode_is_rejected(log_folder):
+    with pytest.raises(ValueError):
+        logger.set_log_mode("verbose")
@@ -0,0 +1,94 @@
+"""Tests für den Prometheus-Metrik-Endpunkt (metrics)."""
+
+import asyncio
+
+import pytest
+
+from pymonster import latency, metrics, utils
+from pymonster.beast import Beast
+from pymonster.simulation import run_match
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics(monkeypatch):
+    monkeypatch.setattr(metrics, "GAUGES", {})
+    monkeypatch.setattr(utils, "SHUTDOWN_HOOKS", [])
+    metrics.reset_counters()
+    yield
+    metrics.reset_counters()
+    latency.disable_latency()
+
+
+def make_colony(energies):
+    colony = []
+    for bid, energy in enumerate(energies, start=1):
+        b = Beast()
+        b.set_id(bid)
+        b.set_energy(energy)
+        colony.append(b)
+    return colony
+
+
+def test_render_metrics_reports_colony(monkeypatch):
+    monkeypatch.setattr(
+        utils, "GLOBAL_BEAST_LIST", make_colony([20.0, 60.0, 250.0])
+    )
+    metrics.inc("splits", 2)
+    metrics.register_gauge("log_queue_depth", "Queued records", lambda: 7)
+
+    text = metrics.render_metrics()
+
+    assert "pymonster_beasts_alive 3\n" in text
+    assert "pymonster_splits_total 2\n" in text
+    assert 'pymonster_beast_energy_bucket{le="50"} 1\n' in text
+    assert 'pymonster_beast_energy_bucket{le="300"} 3\n' in text
+    assert "pymonster_beast_energy_sum 330\n" in text
+    assert "pymonster_log_queue_depth 7\n" in text
+    assert "# TYPE pymonster_deaths_total counter" in text
+
+
+def test_latency_histograms_are_cumulative():
+    latency.enable_latency()
+    for value in (5_000, 40_000, 2_000_000):
+        latency.record("server_reply", value)
+
+    text = metrics.render_metrics()
+
+    prefix = 'pymonster_stage_latency_seconds_bucket{stage="server_reply",'
+    assert f'{prefix}le="1e-05"}} 1' in text
+    assert f'{prefix}le="0.0001"}} 2' in text
+    assert f'{prefix}le="0.0025"}} 3' in text
+    assert f'{prefix}le="+Inf"}} 3' in text
+
+
+def test_http_scrape_and_not_found(monkeypatch):
+    monkeypatch.setattr(utils, "GLOBAL_BEAST_LIST", make_colony([10.0]))
+
+    async def scrape(path):
+        server = await metrics.start_metrics_server(port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+        return response.decode()
+
+    response = asyncio.run(scrape("/metrics"))
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert "version=0.0.4" in response
+    assert "pymonster_beasts_alive 1" in response
+
+    assert asyncio.run(scrape("/")).startswith("HTTP/1.1 404")
+
+
+def test_offline_match_updates_counters():
+    result = run_match(seed=3, rounds=150)
+
+    assert metrics.COUNTERS["turns"] > 0
+    assert metrics.COUNTERS["splits"] == result["splits"]
+    assert metrics.COUNTERS["deaths"] == result["deaths"]
@@ -0,0 +1,124 @@
+"""Tests für die Gegner-Statistiken in opponents.OpponentStats sowie die
+Anbindung an logic.handle_beast_gone und controller.choose_role_by_score."""
+
+import asyncio
+
+import pytest
+
+from pymonster import controller, logic, utils
+from pymonster.opponents import OpponentStats, REGION_DECAY_LIMIT
+from .conftest import fill49
+
+
+def test_region_of_covers_whole_field(stats):
+    """Prüft, dass Ecken des Spielfelds in unterschiedliche Regionen fallen."""
+    top_left = stats.region_of(logic.MIN_ABS_X, logic.MIN_ABS_Y)
+    bottom_right = stats.region_of(logic.MAX_ABS_X, logic.MAX_ABS_Y)
+
+    assert top_left == 0
+    assert bottom_right == 7
+    # gewrappte Koordinaten landen in derselben Region
+    assert stats.region_of(logic.MAX_ABS_X + 1, 0) == stats.region_of(
+        logic.MIN_ABS_X, 0
+    )
+
+
+def test_record_sighting_counts_only_threats_in_5x5(stats):
+    """'>' im 5x5 zählt als Annäherung, '>' im äußeren Ring und '<' nicht."""
+    rows = [
+        ">......",
+        ".......",
+        "....>..",
+        "...B...",
+        "..<....",
+        ".....=.",
+        ".......",
+    ]
+    env = fill49("".join(rows))
+
+    approaches = stats.record_sighting(0, 0, env)
+    assert approaches == 2
+
+
+def test_aggression_grows_with_approaches(stats):
+    calm = fill49("." * 49)
+    rows = [
+        ".......",
+        ".......",
+        "...>...",
+        "...B...",
+        ".......",
+        ".......",
+        ".......",
+    ]
+    threat = fill49("".join(rows))
+
+    for _ in range(50):
+        stats.record_sighting(-30, -10, calm)
+        stats.record_sighting(30, 10, threat)
+
+    assert stats.aggression_at(-30, -10) == 0.0
+    assert stats.aggression_at(30, 10) > 0.5
+
+
+def test_region_counters_stay_bounded(stats):
+    env = fill49("." * 49)
+    for _ in range(REGION_DECAY_LIMIT + 10):
+        stats.record_sighting(0, 0, env)
+
+    region = stats.region_of(0, 0)
+    assert stats._views[region] < REGION_DECAY_LIMIT
+
+
+def test_death_history_is_a_ring_buffer():
+    stats = OpponentStats(71, 34, -35, -17, history_size=3)
+    env = fill49("." * 49)
+    for bid in range(10):
+        stats.record_death(bid, 5.0, env)
+
+    deaths = stats.get_deaths()
+    assert [d["bid"] for d in deaths] == [7, 8, 9]
+    assert stats.get_death_causes()["unknown"] == 10
+
+
+def test_record_death_classifies_cause(stats):
+    rows = [
+        ".......",
+        ".......",
+        ".......",
+        "...B>..",
+        ".......",
+        ".......",
+        ".......",
+    ]
+    env = fill49("".join(rows))
+
+    entry = stats.record_death(1, 20.0, env, 0, 0, 50)
+    assert entry["cause"] == "eaten"
+    assert entry["near"] == [(1, 0)]
+
+    entry = stats.record_death(2, 0.0, fill49("." * 49))
+    assert entry["cause"] == "starved"
+
+
+def test_handle_beast_gone_records_death(beast, stats):
+    """handle_beast_gone entfernt das Beast und speichert den Todesfall."""
+    env = fill49("." * 49)
+
+    asyncio.run(logic.handle_beast_gone(beast.get_id(), 3.0, env))
+
+    assert utils.GLOBAL_BEAST_LIST == []
+    (entry,) = stats.get_deaths()
+    assert entry["bid"] == 1
+    assert (entry["abs_x"], entry["abs_y"]) == (10, 10)
+
+
+def test_adjust_weights_for_aggression_prefers_escape_roles():
+    weights = {"farmer": 0.4, "hunter": 0.3, "backbag": 0.3}
+
+    adjusted = controller.adjust_weights_for_aggression(weights, 1.0)
+
+    assert sum(adjusted.values()) == pytest.approx(1.0)
+    # hunter hat die höchste Escape-Priorität in ROLE_CONFIGS
+    assert adjusted["hunter"] > weights["hunter"]
+    assert adjusted["backbag"] < weights["backbag"]
@@ -0,0 +1,93 @@
+import pytest
+
+from pymonster import pincer, utils
+from pymonster.beast import Beast
+
+
+@pytest.fixture(autouse=True)
+def coordinators(monkeypatch):
+    monkeypatch.setattr(pincer, "COORDINATORS", {})
+
+
+def env_with(*cells):
+    """Leeres Sichtfeld mit Beast in der Mitte und '<' auf `cells`."""
+    chars = ["."] * 49
+    chars[24] = "B"
+    for x, y in cells:
+        chars[y * 7 + x] = "<"
+    return "".join(chars)
+
+
+def make_hunter(bid, abs_x, abs_y, env):
+    b = Beast()
+    b.set_id(bid)
+    b.set_energy(100.0)
+    b.set_abs_x(abs_x)
+    b.set_abs_y(abs_y)
+    b.set_environment(env)
+    return b
+
+
+def test_plan_assigns_opposite_sides():
+    coordinator = pincer.HuntCoordinator()
+    target = (5, 5)
+    coordinator.observe(1, (3, 5), 0, [target])
+    coordinator.observe(2, (3, 6), 0, [target])
+    coordinator.observe(3, (0, 0), 0, [(-10, -10)])
+    assert coordinator.get_assignment(1) is None
+
+    coordinator.observe(1, (3, 5), 1, [])
+    # nächster Jäger kommt von seiner Seite, der zweite von gegenüber
+    assert coordinator.get_assignment(1) == (target, (4, 5))
+    assert coordinator.get_assignment(2) == (target, (6, 5))
+    # einzelner Jäger: kein Zangen-Angriff
+    assert coordinator.get_assignment(3) is None
+
+
+def test_plan_uses_only_previous_tick():
+    coordinator = pincer.HuntCoordinator()
+    coordinator.observe(1, (3, 5), 0, [(5, 5)])
+    coordinator.observe(2, (7, 5), 0, [(5, 5)])
+    coordinator.observe(1, (3, 5), 2, [])
+    assert coordinator.get_assignment(1) is None
+    assert coordinator.get_tick() == 2
+
+
+def test_plan_wraps_around_field_edge():
+    coordinator = pincer.HuntCoordinator()
+    target = (35, 0)
+    coordinator.observe(1, (-35, 0), 0, [target])
+    coordinator.observe(2, (33, 0), 0, [target])
+    coordinator.observe(1, (-35, 0), 1, [])
+    assert coordinator.get_assignment(1) == (target, (-35, 0))
+    assert coordinator.get_assignment(2) == (target, (34, 0))
+
+
+def test_hunt_puts_pincer_move_first(backend):
+    # Beute bei (5, 5); Jäger 1 links davon, Jäger 2 links unterhalb
+    hunter_a = make_hunter(1, 3, 5, env_with((5, 3)))
+    hunter_b = make_hunter(2, 4, 3, env_with((4, 5)))
+    utils.GLOBAL_BEAST_LIST = [hunter_a, hunter_b]
+
+    hunter_a.hunt()
+    assert hunter_b.hunt() == [(1, 2)]
+
+    hunter_a.set_round_abs(1)
+    hunter_b.set_round_abs(1)
+    hunter_a.hunt()
+    # Jäger 2 umläuft die Beute zur gegenüberliegenden Seite (6, 5)
+    assert hunter_b.hunt() == [(2, 2), (1, 2)]
+
+
+def test_hunt_ignores_own_beasts_as_prey(backend):
+    # eigenes schwächeres Beast bei (5, 5) erscheint beiden als '<'
+    hunter_a = make_hunter(1, 3, 5, env_with((5, 3)))
+    hunter_b = make_hunter(2, 4, 3, env_with((4, 5)))
+    weak = make_hunter(3, 5, 5, env_with())
+    utils.GLOBAL_BEAST_LIST = [hunter_a, hunter_b, weak]
+
+    hunter_a.hunt()
+    hunter_b.hunt()
+    hunter_a.set_round_abs(1)
+    hunter_a.hunt()
+    assert pincer.get_coordinator().get_assignment(1) is None
@@ -0,0 +1,78 @@
+"""Tests für den per SIGUSR1 startbaren Sampling-Profiler (profiler)."""
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from pymonster import profiler, utils
+from pymonster.profiler import SamplingProfiler, collapse_stack
+
+
+def busy_wait(seconds: float) -> int:
+    deadline = time.monotonic() + seconds
+    loops = 0
+    while time.monotonic() < deadline:
+        loops += 1
+    return loops
+
+
+def test_collapse_stack_is_outermost_first():
+    def inner():
+        return collapse_stack(sys._getframe())
+
+    stack = inner()
+
+    frames = stack.split(";")
+    assert frames[-1] == "test_profiler.py:inner"
+    assert frames[-2] == (
+        "test_profiler.py:test_collapse_stack_is_outermost_first"
+    )
+    assert " " not in stack
+
+
+def test_profiler_writes_collapsed_stacks(tmp_path):
+    prof = SamplingProfiler(
+        duration=5.0, interval=0.001, output_folder=str(tmp_path)
+    )
+    prof.start()
+    busy_wait(0.2)
+    path = prof.stop()
+
+    assert prof.get_samples() > 10
+    lines = open(path, encoding="utf-8").read().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("test_profiler.py:busy_wait" in line for line in lines)
+    # ein zweites stop() schreibt keine neue Datei
+    assert prof.stop() == path
+    assert len(os.listdir(tmp_path)) == 1
+
+
+@pytest.mark.skipif(
+    not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 not available"
+)
+def test_sigusr1_starts_profile_flushed_on_shutdown(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "SHUTDOWN_HOOKS", [])
+    monkeypatch.setattr(profiler, "ACTIVE_PROFILER", None)
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        assert profiler.install_profiler_signal(60.0, 0.001, str(tmp_path))
+        os.kill(os.getpid(), signal.SIGUSR1)
+        busy_wait(0.1)
+
+        active = profiler.ACTIVE_PROFILER
+        assert active is not None and active.is_running()
+        # ein zweites Signal startet kein weiteres Profil
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert profiler.ACTIVE_PROFILER is active
+
+        utils.run_shutdown_hooks()
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    assert not active.is_running()
+    (written,) = os.listdir(tmp_path)
+    assert written.endswith(".folded")
@@ -0,0 +1,159 @@
+"""Tests für den Multi-Account-Runner (runner) und isolierte Sitzungen."""
+
+import asyncio
+import os
+
+import pytest
+from websockets.exceptions import InvalidHandshake
+
+from pymonster import compaction, logger, runner, utils
+from pymonster.beast import Beast
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(tmp_path / "logs"))
+    monkeypatch.setattr(
+        logger, "ARCHIVE_FOLDER", str(tmp_path / "logs" / "archive")
+    )
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", True)
+    monkeypatch.setattr(logger, "_pending_members", {})
+    monkeypatch.setattr(logger, "_recent_rounds", {})
+    monkeypatch.setattr(utils, "GLOBAL_BEAST_LIST", [])
+    return tmp_path / "logs"
+
+
+def test_read_accounts(tmp_path):
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text(
+        "# Team-Accounts\n"
+        "alice alice.pw\n"
+        "\n"
+        "bob secrets/bob.pw game.example 9000  # zweiter Server\n",
+        encoding="utf-8",
+    )
+
+    accounts = runner.read_accounts(str(accounts_file))
+
+    assert accounts == [
+        runner.Account("alice", str(tmp_path / "alice.pw")),
+        runner.Account(
+            "bob", str(tmp_path / "secrets/bob.pw"), "game.example", 9000
+        ),
+    ]
+
+
+def test_read_accounts_rejects_bad_lines(tmp_path):
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text("alice\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        runner.read_accounts(str(accounts_file))
+
+
+def test_session_names_are_unique_and_safe():
+    accounts = [
+        runner.Account("team a", "pw"),
+        runner.Account("team a", "pw"),
+        runner.Account("../b", "pw"),
+    ]
+
+    assert runner.session_names(accounts) == ["team_a", "team_a-2", ".._b"]
+
+
+def test_session_names_avoid_reserved_log_folders():
+    accounts = [
+        runner.Account("archive", "pw"),
+        runner.Account("profiles", "pw"),
+        runner.Account("archive-session", "pw"),
+        runner.Account("..", "pw"),
+    ]
+
+    names = runner.session_names(accounts)
+
+    assert names == [
+        "archive-session",
+        "profiles-session",
+        "archive-session-2",
+        "..-session",
+    ]
+    assert not set(names) & set(compaction.RESERVED_FOLDERS)
+
+
+def test_sessions_have_isolated_registries_and_logs(log_folder, monkeypatch):
+    seen = {}
+
+    async def fake_client_loop(username, password_file, hostname, port):
+        beast = Beast()
+        beast.set_id(1)
+        utils.get_beast_list().append(beast)
+        await asyncio.sleep(0)
+        # beide Sitzungen laufen gleichzeitig, jede sieht nur ihr Beast
+        seen[username] = (
+            list(utils.get_beast_list()),
+            len(utils.get_all_beasts()),
+        )
+        logger.log_beast(abs_r=1, bid=1, e=100.0)
+        logger.log_server("SMSG", username)
+        await utils.handle_shutdown()
+
+    monkeypatch.setattr(runner, "client_loop", fake_client_loop)
+    accounts = [runner.Account("red", "pw"), runner.Account("blue", "pw")]
+
+    asyncio.run(runner.run_sessions(accounts))
+    logger.flush_beast_logs()
+
+    assert len(seen["red"][0]) == 1 and len(seen["blue"][0]) == 1
+    assert seen["red"][0][0] is not seen["blue"][0][0]
+    assert seen["red"][1] == 2
+    assert utils.GLOBAL_BEAST_LIST == []
+    assert utils.SESSIONS == {}
+    for name in ("red", "blue"):
+        files = os.listdir(log_folder / name)
+        assert "beast-1_c0000.ndjson.gz" in files
+        with utils.session_scope(name):
+            assert logger.read_beast_rounds(1, 0, 10)[0]["e"] == 100.0
+
+
+def test_failing_session_does_not_cancel_others(log_folder, monkeypatch):
+    finished = []
+
+    async def fake_client_loop(username, password_file, hostname, port):
+        if username == "rejected":
+            raise InvalidHandshake("server rejected WebSocket connection")
+        await asyncio.sleep(0.01)
+        finished.append(username)
+        await utils.handle_shutdown()
+
+    monkeypatch.setattr(runner, "client_loop", fake_client_loop)
+    accounts = [runner.Account("rejected", "pw"), runner.Account("ok", "pw")]
+
+    asyncio.run(runner.run_sessions(accounts))
+
+    assert finished == ["ok"]
+    assert utils.SESSIONS == {}
+    assert any(
+        name.startswith("server_")
+        for name in os.listdir(log_folder / "rejected")
+    )
+
+
+def test_runner_main_starts_compactor(tmp_path, monkeypatch):
+    accounts_file = tmp_path / "accounts.txt"
+    accounts_file.write_text("alice alice.pw\n", encoding="utf-8")
+    started = []
+
+    async def fake_run_sessions(accounts, stagger, metrics_port):
+        return None
+
+    monkeypatch.setattr(runner, "run_sessions", fake_run_sessions)
+    monkeypatch.setattr(
+        compaction, "spawn_compactor", lambda: started.append(True)
+    )
+    monkeypatch.setattr(
+        "sys.argv", ["biester_runner", str(accounts_file), "--compact-logs"]
+    )
+
+    runner.runner_main()
+
+    assert started == [True]
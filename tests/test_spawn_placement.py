@@ -0,0 +1,66 @@
+from pymonster import spawn, utils
+from pymonster.beast import Beast
+from .conftest import fill49
+
+
+def env_with(**cells):
+    """Leeres Sichtfeld mit Beast in der Mitte; cells: Symbol -> [(dx, dy)]."""
+    chars = ["."] * 49
+    chars[24] = "B"
+    for symbol, positions in cells.items():
+        for dx, dy in positions:
+            chars[(3 + dy) * 7 + 3 + dx] = symbol
+    return "".join(chars)
+
+
+def food(*positions):
+    return env_with(**{"*": positions})
+
+
+def test_empty_view_picks_first_candidate():
+    assert spawn.choose_spawn_move(fill49("." * 49), [], set()) == (0, -1)
+    assert spawn.choose_spawn_move("", [], set()) == (0, -1)
+
+
+def test_prefers_food_reachable_from_spawn_cell():
+    # Futter direkt neben (0, -1), aber ein Futter-Cluster rechts
+    env = food((0, -1), (3, 0), (3, 1), (3, -1))
+    assert spawn.score_spawn_moves(env, [], set()) == [1.0, 1.0, 1.0, 4.0]
+    assert spawn.choose_spawn_move(env, [], set()) == (1, 0)
+
+
+def test_avoids_danger_heatmap():
+    env = food((3, 0), (3, 1), (3, -1))
+    # '>' bei (3, 2) bedroht (1, 0), aber nicht (-1, 0)
+    assert spawn.choose_spawn_move(env, [(3, 2)], set()) == (0, -1)
+    assert spawn.score_spawn_moves(env, [(3, 2)], set())[3] == 0.0
+
+
+def test_avoids_crowding_and_occupied_cells():
+    env = food((0, 3), (1, 3))
+    scores = spawn.score_spawn_moves(env, [], {(0, 2), (1, 2)})
+    assert scores[1] == 0.0
+    assert spawn.choose_spawn_move(env, [], {(0, 1)}) == (0, -1)
+
+    blocked = env_with(**{"<": [(0, -1), (1, 0)], ">": [(0, 1)]})
+    assert spawn.choose_spawn_move(blocked, [], set()) == (-1, 0)
+    assert spawn.choose_spawn_move(blocked, [], {(-1, 0)}) is None
+
+
+def test_split_uses_spawn_evaluator(beast):
+    beast.set_energy(100.0)
+    beast.set_round_abs(30)
+    beast.set_hunt_list([])
+    beast.set_escape_list([])
+    beast.set_food_list([(0, -1), (1, 0), (-1, 0), (0, 1)])
+    beast.set_environment(food((0, -1), (-3, 0), (-3, 1), (-3, -1)))
+    other = Beast()
+    other.set_id(2)
+    other.set_abs_x(9)
+    other.set_abs_y(10)
+    utils.GLOBAL_BEAST_LIST = [beast, other]
+
+    # (-1, 0) ist vom eigenen Beast belegt -> bestes freies Feld
+    assert beast.split() == ((0, -1), True)
+    other.set_abs_x(30)
+    assert beast.split() == ((-1, 0), True)
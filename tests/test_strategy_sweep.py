@@ -0,0 +1,186 @@
+"""Tests für die Strategie-Konfiguration (strategy.StrategyConfig), den
+Offline-Simulator (simulation.run_match) und den Parameter-Sweep (sweep)."""
+
+import pytest
+
+from pymonster import strategy, sweep, utils
+from pymonster.beast import Beast
+from pymonster.simulation import OfflineMatch, run_match
+from pymonster.strategy import StrategyConfig
+from .conftest import fill49
+
+
+def test_with_overrides_converts_types():
+    cfg = StrategyConfig().with_overrides(
+        minimum_split_energy="60", emergency_min_round="250"
+    )
+
+    assert cfg.minimum_split_energy == 60.0
+    assert cfg.emergency_min_round == 250
+    assert isinstance(cfg.emergency_min_round, int)
+    # Original bleibt unverändert (frozen dataclass)
+    assert StrategyConfig().minimum_split_energy == 80.0
+
+
+def test_with_overrides_rejects_unknown_parameter():
+    with pytest.raises(ValueError):
+        StrategyConfig().with_overrides(split_energy=10)
+
+
+def test_split_reads_active_strategy(beast, monkeypatch):
+    """Eine höhere Mindestenergie in der Konfiguration verhindert den Split."""
+    beast.set_energy(100.0)
+    beast.set_round_abs(30)
+    beast.set_hunt_list([])
+    beast.set_escape_list([])
+    beast.set_food_list([(0, -1), (1, 0), (-1, 0), (0, 1)])
+    beast.set_environment(fill49("." * 49))
+    utils.GLOBAL_BEAST_LIST = [beast, Beast()]
+
+    assert beast.split()[1] is True
+
+    monkeypatch.setattr(
+        strategy,
+        "ACTIVE_STRATEGY",
+        StrategyConfig(minimum_split_energy=150.0),
+    )
+    assert beast.split() == (None, False)
+
+
+def test_offline_match_renders_relative_strength():
+    match = OfflineMatch(seed=0, food_count=0, enemy_count=0)
+    match._own[1][2] = 50.0
+    match._occupant[(1, 0)] = ("enemy", 0)
+    match._enemies.append([1, 0, 80.0])
+    match._food.add((0, -1))
+
+    env = match.render_environment(1)
+
+    assert len(env) == 49
+    assert env[3 * 7 + 3] == "B"
+    assert env[3 * 7 + 4] == ">"
+    assert env[2 * 7 + 3] == "*"
+
+
+def assert_occupancy_consistent(match):
+    for bid, (x, y, _) in match._own.items():
+        assert match._occupant[(x, y)] == ("own", bid)
+    for index, (x, y, _) in enumerate(match._enemies):
+        assert match._occupant[(x, y)] == ("enemy", index)
+    assert len(match._occupant) == len(match._own) + len(match._enemies)
+
+
+def test_kill_respawns_enemy_off_the_landing_cell(monkeypatch):
+    match = OfflineMatch(seed=0, food_count=0, enemy_count=0)
+    match._own[1][2] = 100.0
+    match._occupant[(1, 0)] = ("enemy", 0)
+    match._enemies.append([1, 0, 20.0])
+    # erster Zufallswurf trifft genau das Zielfeld des Angreifers
+    draws = iter([1, 0, 5, 5])
+    monkeypatch.setattr(match._rng, "randint", lambda a, b: next(draws))
+
+    match._apply_move(1, 1, 0)
+
+    assert match.kills == 1
+    assert match._own[1][:2] == [1, 0]
+    assert match._enemies[0][:2] == [5, 5]
+    assert_occupancy_consistent(match)
+
+
+def test_long_match_with_kills_keeps_occupancy(monkeypatch):
+    matches = []
+    original_init = OfflineMatch.__init__
+
+    def remember(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        matches.append(self)
+
+    monkeypatch.setattr(OfflineMatch, "__init__", remember)
+    config = StrategyConfig().with_overrides(
+        minimum_split_energy=60, late_game_round=50
+    )
+
+    result = run_match(config=config, seed=1, rounds=150)
+
+    assert result["kills"] > 0
+    assert_occupancy_consistent(matches[0])
+
+
+def test_run_match_is_reproducible():
+    first = run_match(seed=3, rounds=60)
+    second = run_match(seed=3, rounds=60)
+
+    assert first == second
+    assert first["rounds"] <= 60
+    # globaler Zustand wird wiederhergestellt
+    assert strategy.get_strategy() == StrategyConfig()
+
+
+def test_parse_grid_and_build_configs():
+    grid = sweep.parse_grid(
+        ["minimum_split_energy=60,80", "general_energy_avg=2.0,2.5,3.0"]
+    )
+    configs = sweep.build_configs(grid)
+
+    assert grid["minimum_split_energy"] == ["60", "80"]
+    assert len(configs) == 6
+    assert {c.general_energy_avg for c in configs} == {2.0, 2.5, 3.0}
+
+    with pytest.raises(ValueError):
+        sweep.parse_grid(["minimum_split_energy"])
+
+
+def test_aggregate_results_ranks_survival_first():
+    configs = [StrategyConfig(), StrategyConfig(minimum_split_energy=60.0)]
+    base = {"rounds": 100, "total_energy": 500.0, "final_beasts": 2}
+    results = [
+        (0, {**base, "survived": False, "deaths": 3}),
+        (1, {**base, "survived": True, "deaths": 0, "total_energy": 10.0}),
+    ]
+
+    rows = sweep.aggregate_results(configs, results)
+
+    assert rows[0]["config"]["minimum_split_energy"] == 60.0
+    assert rows[0]["survival_rate"] == 1.0
+    assert "minimum_split_energy" in sweep.format_table(
+        rows, ["minimum_split_energy"]
+    )
+
+
+def test_run_sweep_in_process():
+    configs = sweep.build_configs({"minimum_split_energy": ["60", "120"]})
+
+    rows = sweep.run_sweep(configs, seeds=2, rounds=20, workers=1)
+
+    assert len(rows) == 2
+    assert all(row["matches"] == 2 for row in rows)
+
+
+def test_run_sweep_survives_failing_match(monkeypatch, capsys):
+    def flaky_run_match(config, seed, rounds):
+        if seed == 1:
+            raise KeyError((-1, -13))
+        return run_match(config, seed, rounds)
+
+    monkeypatch.setattr(sweep, "run_match", flaky_run_match)
+    configs = sweep.build_configs({"minimum_split_energy": ["60"]})
+
+    (row,) = sweep.run_sweep(configs, seeds=2, rounds=20, workers=1)
+
+    assert row["matches"] == 2
+    assert row["failed"] == 1
+    assert row["survival_rate"] <= 0.5
+    assert "match failed" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "spec", ["bogus=1", "minimum_split_energy=abc", "minimum_split_energy"]
+)
+def test_sweep_main_reports_bad_grid(monkeypatch, capsys, spec):
+    monkeypatch.setattr("sys.argv", ["biester_sweep", "-g", spec])
+
+    with pytest.raises(SystemExit) as excinfo:
+        sweep.sweep_main()
+
+    assert excinfo.value.code == 2
+    assert "invalid grid" in capsys.readouterr().err
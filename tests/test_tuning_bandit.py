@@ -0,0 +1,133 @@
+"""Tests für das Online-Tuning der Rollen-Prioritäten in tuning.RoleBandit
+und die Anbindung über controller.apply_role_to_beast."""
+
+import json
+
+import pytest
+
+from pymonster import controller, tuning, utils
+from pymonster.beast import Beast
+
+
+@pytest.fixture
+def bandit():
+    return tuning.RoleBandit(tuning.build_role_arms(controller.ROLE_CONFIGS))
+
+
+def test_build_role_arms_keeps_base_config_and_types():
+    arms = tuning.build_role_arms(controller.ROLE_CONFIGS)
+
+    for role, cfg in controller.ROLE_CONFIGS.items():
+        assert len(arms[role]) == len(tuning.ARM_VARIANTS)
+        # Arm 0 ist die unveränderte Basis-Konfiguration
+        assert arms[role][0] == cfg
+        for arm_cfg in arms[role]:
+            assert isinstance(arm_cfg["food"], int)
+            assert isinstance(arm_cfg["energy"], float)
+
+
+def test_select_tries_every_arm_first(bandit):
+    seen = []
+    for _ in range(len(tuning.ARM_VARIANTS)):
+        arm = bandit.select("farmer")
+        seen.append(arm)
+        bandit.update("farmer", arm, 0.0)
+
+    assert sorted(seen) == list(range(len(tuning.ARM_VARIANTS)))
+
+
+def test_select_converges_to_best_arm(bandit):
+    """Arm 2 liefert den höchsten Reward und wird am häufigsten gezogen."""
+    for _ in range(500):
+        arm = bandit.select("hunter")
+        bandit.update("hunter", arm, 3.0 if arm == 2 else 0.0)
+
+    counts = bandit.get_counts("hunter")
+    assert counts.index(max(counts)) == 2
+    assert bandit.get_means("hunter")[2] == pytest.approx(3.0)
+
+
+def test_observe_rewards_energy_gain_per_round(bandit):
+    bandit.start(7, "backbag", 1, 40.0)
+
+    for _ in range(tuning.BANDIT_WINDOW - 1):
+        assert bandit.observe(7, 60.0) is False
+    assert bandit.observe(7, 90.0) is True
+
+    assert bandit.get_counts("backbag")[1] == 1
+    expected = 50.0 / tuning.BANDIT_WINDOW
+    assert bandit.get_means("backbag")[1] == pytest.approx(expected)
+
+
+def test_rebase_and_finish(bandit):
+    bandit.start(3, "farmer", 0, 100.0)
+    bandit.observe(3, 100.0)
+    # Split halbiert die Energie -> kein Verlust
+    bandit.rebase(3, -50.0)
+    bandit.finish(3, 50.0)
+
+    assert bandit.get_means("farmer")[0] == pytest.approx(0.0)
+    # unbekannte Beasts werden ignoriert
+    bandit.finish(99, 0.0)
+    assert bandit.observe(99, 0.0) is False
+
+
+def test_save_and_load_roundtrip(tmp_path, bandit):
+    path = str(tmp_path / "bandit.json")
+    bandit.update("hunter", 3, 2.5)
+    bandit.save(path)
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["hunter"]["n"][3] == 1
+
+    loaded = tuning.RoleBandit(
+        tuning.build_role_arms(controller.ROLE_CONFIGS), path
+    )
+    assert loaded.get_counts("hunter") == bandit.get_counts("hunter")
+    assert loaded.get_means("hunter")[3] == pytest.approx(2.5)
+
+
+def test_save_defaults_to_own_stats_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "bandit.json")
+    arms = tuning.build_role_arms(controller.ROLE_CONFIGS)
+    with_file = tuning.RoleBandit(arms, path)
+    with_file.update("farmer", 1, 4.0)
+    monkeypatch.setattr(controller, "ROLE_BANDIT", with_file)
+
+    controller.save_role_bandit()
+
+    assert with_file.get_stats_file() == path
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["farmer"]["n"][1] == 1
+    with pytest.raises(ValueError):
+        tuning.RoleBandit(arms).save()
+
+
+def test_enable_role_bandit_saves_on_shutdown(tmp_path, monkeypatch):
+    path = str(tmp_path / "bandit.json")
+    monkeypatch.setattr(controller, "ROLE_BANDIT", None)
+    monkeypatch.setattr(utils, "SHUTDOWN_HOOKS", [])
+
+    bandit = controller.enable_role_bandit(path)
+    bandit.update("hunter", 0, 1.5)
+    utils.run_shutdown_hooks()
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["hunter"]["n"][0] == 1
+    controller.enable_role_bandit()
+    assert utils.SHUTDOWN_HOOKS == [controller.save_role_bandit]
+
+
+def test_apply_role_uses_bandit_arm(monkeypatch, bandit):
+    monkeypatch.setattr(controller, "ROLE_BANDIT", bandit)
+    monkeypatch.setattr(bandit, "select", lambda role: 2)
+
+    b = Beast()
+    b.set_id(5)
+    b.set_energy(40.0)
+    controller.apply_role_to_beast(b, "farmer")
+
+    base_escape = controller.ROLE_CONFIGS["farmer"]["escape"]
+    assert b.get_priority_escape() == round(base_escape * 1.25)
+    assert b.get_role() == "farmer"
+    assert bandit._active[5] == ["farmer", 2, 40.0, 0]
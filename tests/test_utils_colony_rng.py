@@ -0,0 +1,65 @@
+"""Tests für den seedbaren Kolonie-Zufallsgenerator (utils.COLONY_RNG) und
+dessen Weitergabe an Beast und controller."""
+
+import random
+
+from pymonster import controller, utils
+from pymonster.beast import Beast
+from .conftest import fill49
+
+
+def random_moves(beast, count=20):
+    return [beast.random_move() for _ in range(count)]
+
+
+def test_seed_colony_rng_makes_random_moves_reproducible():
+    b = Beast()
+
+    utils.seed_colony_rng(42)
+    first = random_moves(b)
+    utils.seed_colony_rng(42)
+    second = random_moves(b)
+
+    assert first == second
+
+
+def test_beast_uses_its_own_rng():
+    a = Beast(rng=random.Random(7))
+    b = Beast(rng=random.Random(7))
+
+    assert random_moves(a) == random_moves(b)
+    assert a.get_rng() is not utils.COLONY_RNG
+
+
+def test_split_spawn_does_not_use_beast_rng(beast):
+    """Ohne Food auf den Nachbarfeldern ist die Spawn-Wahl deterministisch."""
+    beast.set_energy(100.0)
+    beast.set_round_abs(30)
+    beast.set_hunt_list([])
+    beast.set_escape_list([])
+    beast.set_food_list([(2, 2), (2, -2), (-2, 2), (-2, -2)])
+    beast.set_environment(fill49("." * 49))
+    utils.GLOBAL_BEAST_LIST = [beast, Beast()]
+
+    moves = []
+    for seed in range(2):
+        rng = random.Random(seed)
+        state = rng.getstate()
+        beast.set_rng(rng)
+        moves.append(beast.split())
+        assert rng.getstate() == state
+
+    assert moves[0] == moves[1] == ((0, -1), True)
+
+
+def test_choose_role_by_score_is_reproducible_with_rng():
+    roles_a = [
+        controller.choose_role_by_score(2.0, rng=random.Random(5))
+        for _ in range(10)
+    ]
+    roles_b = [
+        controller.choose_role_by_score(2.0, rng=random.Random(5))
+        for _ in range(10)
+    ]
+
+    assert roles_a == roles_b
@@ -0,0 +1,105 @@
+"""Tests für den Streaming-Server der Log-Visualisierung (viz)."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pymonster import logger, viz
+from pymonster.viz import ChunkIndex, LogLibrary
+
+BEAST_FILE = "beast-1_c0000.ndjson.gz"
+
+
+@pytest.fixture
+def log_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger, "LOG_FOLDER", str(tmp_path))
+    monkeypatch.setattr(logger, "ARCHIVE_FOLDER", str(tmp_path / "archive"))
+    monkeypatch.setattr(logger, "LOGGING_ENABLED", True)
+    monkeypatch.setattr(logger, "_pending_members", {})
+    monkeypatch.setattr(viz, "INDEX_STRIDE", 16)
+    return tmp_path
+
+
+def write_rounds(first: int, last: int) -> None:
+    for abs_r in range(first, last + 1):
+        logger.log_beast(abs_r=abs_r, bid=1, e=float(abs_r), env="." * 49)
+    logger.flush_beast_logs()
+
+
+def test_read_window_and_find_round(log_folder):
+    write_rounds(1, 200)
+    index = ChunkIndex(str(log_folder / BEAST_FILE))
+    index.refresh()
+
+    assert index.get_total() == 200
+    assert (index.get_first_round(), index.get_last_round()) == (1, 200)
+    window = index.read_window(150, 3)
+    assert [r["abs_r"] for r in window] == [151, 152, 153]
+    assert index.read_window(199, 10)[0]["abs_r"] == 200
+    assert index.read_window(200, 10) == []
+    assert index.find_round(77) == 76
+    assert index.find_round(500) == 200
+
+
+def test_growing_file_is_indexed_incrementally(log_folder):
+    write_rounds(1, 40)
+    index = ChunkIndex(str(log_folder / BEAST_FILE))
+    index.refresh()
+    write_rounds(41, 60)
+    # halb geschriebenes Member am Ende wird ignoriert
+    with open(log_folder / BEAST_FILE, "ab") as f:
+        f.write(b"\x1f\x8b\x08\x00")
+
+    index.refresh()
+
+    assert index.get_total() == 60
+    assert index.read_window(55, 10)[-1]["abs_r"] == 60
+
+
+def test_library_rejects_paths_outside_log_folder(log_folder):
+    write_rounds(1, 3)
+    library = LogLibrary(str(log_folder))
+
+    with pytest.raises(ValueError):
+        library.resolve("../secret.ndjson.gz")
+    with pytest.raises(ValueError):
+        library.resolve("notes.txt")
+    assert [f["name"] for f in library.list_files()] == [BEAST_FILE]
+
+
+def test_http_endpoints_serve_windows(log_folder):
+    write_rounds(1, 100)
+    logger.log_server("SMSG", "hello")
+    html = log_folder / "index.html"
+    html.write_text("<html>viz</html>", encoding="utf-8")
+    server = viz.make_server(
+        port=0, log_folder=str(log_folder), html_path=str(html)
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def get(path):
+        with urllib.request.urlopen(base + path) as response:
+            return response.read().decode("utf-8")
+
+    try:
+        assert get("/") == "<html>viz</html>"
+        files = json.loads(get("/api/files"))["files"]
+        assert {f["kind"] for f in files} == {"beast", "server"}
+
+        page = json.loads(get(f"/api/records?file={BEAST_FILE}&round=42"))
+        assert page["total"] == 100
+        assert page["start"] == 41
+        assert page["records"][0]["abs_r"] == 42
+        assert len(page["records"]) == 59
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            get("/api/records?file=missing.ndjson.gz")
+        assert excinfo.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()